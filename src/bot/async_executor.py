@@ -12,7 +12,8 @@ import threading
 import queue
 import time
 import logging
-from typing import Optional, Dict, Any
+from collections import deque
+from typing import Optional, Dict, Any, Callable, List
 from datetime import datetime
 
 from models import GameTick
@@ -32,22 +33,29 @@ class AsyncBotExecutor:
     - Queue-based: Prevents direct thread blocking
     - Graceful degradation: Drops ticks if bot can't keep up
     - Clean shutdown: Proper thread cleanup
+    - Result notification: optional listener called when a result is queued,
+      so consumers don't need to poll result_queue
 
     Thread Safety:
-    - Uses queue.Queue for thread-safe communication
+    - Uses queue.Queue for execution requests
+    - Results use a deque (atomic append/popleft) so the UI-side check
+      for pending results never takes a lock
     - Worker thread is daemon for automatic cleanup
     - Stop event for graceful shutdown
     - AUDIT FIX: Added Condition for proper shutdown synchronization
     """
 
-    def __init__(self, bot_controller):
+    def __init__(self, bot_controller, on_result: Optional[Callable[[], None]] = None):
         """
         Initialize async bot executor
 
         Args:
             bot_controller: BotController instance to execute
+            on_result: Optional listener invoked (from the worker thread)
+                after each result is queued
         """
         self.bot_controller = bot_controller
+        self.on_result = on_result
 
         # AUDIT FIX: Thread-safe state with lock
         self._state_lock = threading.Lock()
@@ -56,7 +64,7 @@ class AsyncBotExecutor:
         # Queue for bot execution requests (max 10 pending ticks)
         # If bot can't keep up, older ticks are dropped
         self.execution_queue = queue.Queue(maxsize=10)
-        self.result_queue = queue.Queue()
+        self.result_queue: deque = deque()
 
         # Worker thread
         self.worker_thread = None
@@ -216,7 +224,7 @@ class AsyncBotExecutor:
                             self._executions += 1
 
                         # Put result in result queue for UI updates
-                        self.result_queue.put({
+                        self._publish_result({
                             'tick': tick.tick,
                             'result': result,
                             'elapsed': elapsed,
@@ -236,7 +244,7 @@ class AsyncBotExecutor:
                         logger.error(f"Bot execution failed at tick {tick.tick}: {e}")
 
                         # Put error in result queue
-                        self.result_queue.put({
+                        self._publish_result({
                             'tick': tick.tick,
                             'error': str(e),
                             'timestamp': datetime.now()
@@ -255,6 +263,21 @@ class AsyncBotExecutor:
 
         logger.info("Bot executor worker stopped")
 
+    def _publish_result(self, result: Dict[str, Any]):
+        """Queue a result and notify the listener, if any"""
+        self.result_queue.append(result)
+
+        listener = self.on_result
+        if listener is not None:
+            try:
+                listener()
+            except Exception as e:
+                logger.error(f"Bot result listener failed: {e}")
+
+    def has_results(self) -> bool:
+        """Lock-free check for pending results"""
+        return bool(self.result_queue)
+
     def get_latest_result(self) -> Optional[Dict]:
         """
         Get latest bot execution result (non-blocking)
@@ -262,11 +285,27 @@ class AsyncBotExecutor:
         Returns:
             dict: Latest result or None if no results pending
         """
+        if not self.result_queue:
+            return None
         try:
-            return self.result_queue.get_nowait()
-        except queue.Empty:
+            return self.result_queue.popleft()
+        except IndexError:
             return None
 
+    def drain_results(self) -> List[Dict]:
+        """
+        Take every pending result in arrival order (non-blocking)
+
+        Bounded by the queue length at call time, so results published
+        while draining are left for the next drain.
+
+        Returns:
+            list: Pending results, oldest first (empty if none)
+        """
+        result_queue = self.result_queue
+        popleft = result_queue.popleft
+        return [popleft() for _ in range(len(result_queue))]
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get executor statistics
@@ -52,9 +52,11 @@ class BotController:
         # Phase 8.3: Execution mode
         self.execution_mode = execution_mode
         self.ui_controller = ui_controller
+        # Mode is fixed for the controller's lifetime; test it once
+        self._is_ui_layer = execution_mode == ExecutionMode.UI_LAYER
 
         # Validate UI_LAYER mode requirements
-        if execution_mode == ExecutionMode.UI_LAYER and ui_controller is None:
+        if self._is_ui_layer and ui_controller is None:
             raise ValueError("UI_LAYER mode requires ui_controller parameter")
 
         # Track last action
@@ -105,10 +107,10 @@ class BotController:
             self.last_reasoning = reasoning
 
             # Step 4: Execute (Phase 8.3: Route based on execution mode)
-            if self.execution_mode == ExecutionMode.BACKEND:
-                result = self._execute_action_backend(action_type, amount)
-            else:  # ExecutionMode.UI_LAYER
+            if self._is_ui_layer:
                 result = self._execute_action_ui(action_type, amount)
+            else:  # ExecutionMode.BACKEND
+                result = self._execute_action_backend(action_type, amount)
 
             # Track result
             self.last_result = result
@@ -120,8 +122,8 @@ class BotController:
                 self.failed_actions += 1
 
             logger.debug(
-                f"Bot action ({self.execution_mode.value}): {action_type} - {reasoning} - "
-                f"Success: {result['success']}"
+                "Bot action (%s): %s - %s - Success: %s",
+                self.execution_mode.value, action_type, reasoning, result['success']
             )
 
             return result
@@ -13,7 +13,7 @@ from config import config
 logger = logging.getLogger(__name__)
 
 # Constants previously in Config
-BLOCKED_PHASES_FOR_TRADING = ["COOLDOWN", "RUG_EVENT", "RUG_EVENT_1", "UNKNOWN"]
+BLOCKED_PHASES_FOR_TRADING = frozenset({"COOLDOWN", "RUG_EVENT", "RUG_EVENT_1", "UNKNOWN"})
 
 # PRESALE allows one BUY and one SIDEBET before game starts
 PRESALE_PHASE = "PRESALE"
@@ -531,7 +531,7 @@ class BotUIController:
         """
         try:
             # Balance label format: "Balance: 0.0950 SOL"
-            label_text = self.main_window.balance_label.cget("text")
+            label_text = self.main_window.get_label_text(self.main_window.balance_label)
 
             # Extract number
             parts = label_text.split()
@@ -557,7 +557,7 @@ class BotUIController:
         try:
             # Position label format: "Position: 0.010 SOL @ 1.50x"
             # or "Position: None" if no active position
-            label_text = self.main_window.position_label.cget("text")
+            label_text = self.main_window.get_label_text(self.main_window.position_label)
 
             if "None" in label_text or label_text == "Position: ":
                 return None
@@ -590,7 +590,7 @@ class BotUIController:
         """
         try:
             # Price label format: "PRICE: 1.50x"
-            label_text = self.main_window.price_label.cget("text")
+            label_text = self.main_window.get_label_text(self.main_window.price_label)
 
             # Extract price
             parts = label_text.split()
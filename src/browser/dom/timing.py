@@ -10,7 +10,7 @@ Classes:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 
 @dataclass
@@ -63,6 +63,10 @@ class TimingMetrics:
     """
     executions: List[ExecutionTiming] = field(default_factory=list)
     max_history: int = 100  # Keep last 100 executions
+    # Bumped on every add/clear; get_stats() reuses its result until it changes
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _stats_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _stats_version: int = field(default=-1, init=False, repr=False, compare=False)
 
     def add_execution(self, timing: ExecutionTiming) -> None:
         """
@@ -74,6 +78,7 @@ class TimingMetrics:
         self.executions.append(timing)
         if len(self.executions) > self.max_history:
             self.executions.pop(0)  # Remove oldest
+        self._version += 1
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -89,10 +94,21 @@ class TimingMetrics:
             - avg_confirmation_delay_ms: Average click-to-confirmation delay
             - p50_total_delay_ms: Median total delay
             - p95_total_delay_ms: 95th percentile total delay
+
+        Stats are recomputed only after executions were added or cleared;
+        polling callers get a copy of the cached result otherwise.
         """
+        if self._stats_cache is None or self._stats_version != self._version:
+            self._stats_cache = self._compute_stats()
+            self._stats_version = self._version
+        return dict(self._stats_cache)
+
+    def _compute_stats(self) -> Dict[str, Any]:
+        """Calculate timing statistics from the current execution history"""
         if not self.executions:
             return {
                 'total_executions': 0,
+                'successful_executions': 0,
                 'success_rate': 0.0,
                 'avg_total_delay_ms': 0.0,
                 'avg_click_delay_ms': 0.0,
@@ -134,6 +150,7 @@ class TimingMetrics:
     def clear(self) -> None:
         """Clear all execution history"""
         self.executions.clear()
+        self._version += 1
 
     def get_recent(self, n: int = 10) -> List[ExecutionTiming]:
         """
@@ -3,12 +3,12 @@ Game State Management Module
 Centralized state management with observer pattern for reactive updates
 """
 
-from typing import Dict, Any, List, Optional, Callable, Deque
+from typing import Dict, Any, List, Optional, Callable, Deque, Tuple
 from dataclasses import dataclass, field
 from decimal import Decimal
 from datetime import datetime
 import threading
-from collections import defaultdict, deque
+from collections import deque
 import logging
 from enum import Enum
 
@@ -83,7 +83,9 @@ class GameState:
         self._closed_positions: Deque[Dict] = deque(maxlen=MAX_CLOSED_POSITIONS_SIZE)
         
         # Observer pattern
-        self._observers: Dict[StateEvents, List[Callable]] = defaultdict(list)
+        # Copy-on-write: subscribe/unsubscribe swap in a new tuple so _emit
+        # can read the current subscribers without locking or copying
+        self._observers: Dict[StateEvents, Tuple[Callable, ...]] = {}
         
         # Thread safety
         self._lock = threading.RLock()
@@ -787,21 +789,32 @@ class GameState:
     def subscribe(self, event: StateEvents, callback: Callable):
         """Subscribe to state change events"""
         with self._lock:
-            self._observers[event].append(callback)
+            self._observers[event] = self._observers.get(event, ()) + (callback,)
             logger.debug(f"Subscribed to {event.value}")
+
+    def subscribe_many(self, handlers: Dict[StateEvents, Callable]):
+        """Subscribe several event handlers in one locked pass"""
+        with self._lock:
+            for event, callback in handlers.items():
+                self._observers[event] = self._observers.get(event, ()) + (callback,)
+            logger.debug(f"Subscribed to {len(handlers)} state events")
     
     def unsubscribe(self, event: StateEvents, callback: Callable):
         """Unsubscribe from state change events"""
         with self._lock:
-            if callback in self._observers[event]:
-                self._observers[event].remove(callback)
+            callbacks = self._observers.get(event, ())
+            if callback in callbacks:
+                remaining = list(callbacks)
+                remaining.remove(callback)
+                self._observers[event] = tuple(remaining)
                 logger.debug(f"Unsubscribed from {event.value}")
     
     def _emit(self, event: StateEvents, data: Any = None):
-        """Emit an event to all subscribers (releases lock before calling callbacks)"""
-        # Get callbacks while holding lock, then release before calling
-        with self._lock:
-            callbacks = list(self._observers[event])  # Copy to avoid mutation during iteration
+        """Emit an event to all subscribers (callbacks run without the lock held)"""
+        # Immutable snapshot - safe to iterate while others (un)subscribe
+        callbacks = self._observers.get(event)
+        if not callbacks:
+            return
 
         # Call callbacks WITHOUT holding lock to prevent deadlocks
         for callback in callbacks:
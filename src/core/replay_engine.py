@@ -9,7 +9,7 @@ import threading
 import time
 import atexit
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Tuple
 from decimal import Decimal
 from contextlib import contextmanager
 
@@ -191,6 +191,18 @@ class ReplayEngine:
     # FILE LOADING
     # ========================================================================
 
+    def parse_file(self, filepath: Path) -> Tuple[List[GameTick], str]:
+        """
+        Read and parse a game recording without touching engine state.
+
+        Safe to call from a background thread (used to prefetch the next
+        game in multi-game mode).
+
+        Returns:
+            Tuple of (ticks list, game_id)
+        """
+        return self.replay_source.load(str(filepath))
+
     def load_file(self, filepath: Path) -> bool:
         """
         Load game recording from JSONL file
@@ -204,13 +216,38 @@ class ReplayEngine:
         try:
             logger.info(f"Loading game file: {filepath}")
 
+            # Use replay source to load ticks
+            loaded_ticks, game_id = self.parse_file(filepath)
+
+        except FileNotFoundError:
+            logger.error(f"File not found: {filepath}")
+            return False
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in file {filepath}: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to load file: {e}", exc_info=True)
+            return False
+
+        return self.load_parsed(filepath, loaded_ticks, game_id)
+
+    def load_parsed(self, filepath: Path, loaded_ticks: List[GameTick], game_id: str) -> bool:
+        """
+        Install an already-parsed game recording (see parse_file)
+
+        Args:
+            filepath: Path the ticks were read from
+            loaded_ticks: Parsed ticks
+            game_id: Game identifier
+
+        Returns:
+            True if loaded successfully, False otherwise
+        """
+        try:
             # Stop any current recording
             if self.recorder_sink.is_recording():
                 self.recorder_sink.stop_recording()
 
-            # Use replay source to load ticks
-            loaded_ticks, game_id = self.replay_source.load(str(filepath))
-
             with self._acquire_lock():
                 # Switch to file mode
                 self.is_live_mode = False
@@ -246,12 +283,6 @@ class ReplayEngine:
 
             return True
 
-        except FileNotFoundError:
-            logger.error(f"File not found: {filepath}")
-            return False
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in file {filepath}: {e}")
-            return False
         except Exception as e:
             logger.error(f"Failed to load file: {e}", exc_info=True)
             return False
@@ -313,108 +344,17 @@ class ReplayEngine:
             logger.error(f"Invalid tick type: {type(tick)}")
             return False
 
-        # AUDIT FIX: Capture display data inside lock to prevent race condition
-        display_data = None
-
         try:
+            # AUDIT FIX: Capture display data inside lock to prevent race condition
             with self._acquire_lock():
-                # Initialize live mode on first tick
-                if not self.is_live_mode or not self.game_id:
-                    self.is_live_mode = True
-                    self.game_id = tick.game_id
-                    self.file_mode_ticks = []  # Clear file mode data
-                    self.current_index = 0
-
-                    self.state.reset()
-                    self.state.update(
-                        game_id=self.game_id,
-                        game_active=True,
-                        current_tick=tick.tick,
-                        current_price=tick.price,
-                        current_phase=tick.phase
-                    )
-
-                    event_bus.publish(Events.GAME_START, {
-                        'game_id': self.game_id,
-                        'tick_count': 0,
-                        'live_mode': True
-                    })
-
-                    # Start recording if auto-recording enabled
-                    if self.auto_recording:
-                        try:
-                            recording_file = self.recorder_sink.start_recording(self.game_id)
-                            logger.info(f"Started live game: {self.game_id}, recording to {recording_file.name}")
-                        except Exception as e:
-                            logger.error(f"Failed to start recording: {e}")
-                            # Continue without recording
-                    else:
-                        logger.info(f"Started live game: {self.game_id} (recording disabled)")
-
-                # Detect new game starting (game_id changed) - LIVE FEED MULTI-GAME SUPPORT
-                if tick.game_id != self.game_id:
-                    logger.info(f"🔄 New game detected: {self.game_id} → {tick.game_id}")
-
-                    # End current game gracefully
-                    self._handle_game_end()
-
-                    # Reset for new game
-                    self.game_id = tick.game_id
-                    self.current_index = 0
-                    self.live_ring_buffer.clear()
-
-                    self.state.reset()
-                    self.state.update(
-                        game_id=self.game_id,
-                        game_active=True,
-                        current_tick=tick.tick,
-                        current_price=tick.price,
-                        current_phase=tick.phase
-                    )
-
-                    event_bus.publish(Events.GAME_START, {
-                        'game_id': self.game_id,
-                        'tick_count': 0,
-                        'live_mode': True
-                    })
-
-                    # Start recording new game
-                    if self.auto_recording:
-                        try:
-                            recording_file = self.recorder_sink.start_recording(self.game_id)
-                            logger.info(f"Started live game: {self.game_id}, recording to {recording_file.name}")
-                        except Exception as e:
-                            logger.error(f"Failed to start recording: {e}")
-                    else:
-                        logger.info(f"Started live game: {self.game_id} (recording disabled)")
-
-                # Add tick to ring buffer ONLY (no unbounded list growth)
-                self.live_ring_buffer.append(tick)
-
-                # Record tick to disk if recording enabled
-                if self.auto_recording and self.recorder_sink.is_recording():
-                    try:
-                        self.recorder_sink.record_tick(tick)
-                    except Exception as e:
-                        logger.error(f"Failed to record tick: {e}")
-                        # Continue processing even if recording fails
+                self._ingest_live_tick(tick)
 
                 # Update current index to latest
-                self.current_index = self.live_ring_buffer.get_size() - 1
-
-                # AUDIT FIX: Capture tick data and index inside lock to prevent race condition
-                # This prevents the tick list from changing between lock release and display
-                current_ticks = self.ticks  # Property call - gets current tick list based on mode
-                if current_ticks and 0 <= self.current_index < len(current_ticks):
-                    display_data = {
-                        'tick': current_ticks[self.current_index],
-                        'index': self.current_index,
-                        'total': len(current_ticks)
-                    }
+                total = self.live_ring_buffer.get_size()
+                self.current_index = total - 1
 
             # AUDIT FIX: Display using captured tick data (safe - no race condition)
-            if display_data is not None:
-                self._display_tick_direct(display_data['tick'], display_data['index'], display_data['total'])
+            self._display_tick_direct(tick, total - 1, total)
 
             logger.debug(f"Pushed tick {tick.tick} for game {tick.game_id}")
             return True
@@ -423,6 +363,89 @@ class ReplayEngine:
             logger.error(f"Error pushing tick: {e}", exc_info=True)
             return False
 
+    def _ingest_live_tick(self, tick: GameTick):
+        """Buffer and record one live tick, switching games as needed (lock held)"""
+        # Initialize live mode on first tick
+        if not self.is_live_mode or not self.game_id:
+            self.is_live_mode = True
+            self.game_id = tick.game_id
+            self.file_mode_ticks = []  # Clear file mode data
+            self.current_index = 0
+
+            self.state.reset()
+            self.state.update(
+                game_id=self.game_id,
+                game_active=True,
+                current_tick=tick.tick,
+                current_price=tick.price,
+                current_phase=tick.phase
+            )
+
+            event_bus.publish(Events.GAME_START, {
+                'game_id': self.game_id,
+                'tick_count': 0,
+                'live_mode': True
+            })
+
+            # Start recording if auto-recording enabled
+            if self.auto_recording:
+                try:
+                    recording_file = self.recorder_sink.start_recording(self.game_id)
+                    logger.info(f"Started live game: {self.game_id}, recording to {recording_file.name}")
+                except Exception as e:
+                    logger.error(f"Failed to start recording: {e}")
+                    # Continue without recording
+            else:
+                logger.info(f"Started live game: {self.game_id} (recording disabled)")
+
+        # Detect new game starting (game_id changed) - LIVE FEED MULTI-GAME SUPPORT
+        if tick.game_id != self.game_id:
+            logger.info(f"🔄 New game detected: {self.game_id} → {tick.game_id}")
+
+            # End current game gracefully
+            self._handle_game_end()
+
+            # Reset for new game
+            self.game_id = tick.game_id
+            self.current_index = 0
+            self.live_ring_buffer.clear()
+
+            self.state.reset()
+            self.state.update(
+                game_id=self.game_id,
+                game_active=True,
+                current_tick=tick.tick,
+                current_price=tick.price,
+                current_phase=tick.phase
+            )
+
+            event_bus.publish(Events.GAME_START, {
+                'game_id': self.game_id,
+                'tick_count': 0,
+                'live_mode': True
+            })
+
+            # Start recording new game
+            if self.auto_recording:
+                try:
+                    recording_file = self.recorder_sink.start_recording(self.game_id)
+                    logger.info(f"Started live game: {self.game_id}, recording to {recording_file.name}")
+                except Exception as e:
+                    logger.error(f"Failed to start recording: {e}")
+            else:
+                logger.info(f"Started live game: {self.game_id} (recording disabled)")
+
+        # Add tick to ring buffer ONLY (no unbounded list growth)
+        self.live_ring_buffer.append(tick)
+
+        # Record tick to disk if recording enabled
+        if self.auto_recording and self.recorder_sink.is_recording():
+            try:
+                self.recorder_sink.record_tick(tick)
+            except Exception as e:
+                logger.error(f"Failed to record tick: {e}")
+                # Continue processing even if recording fails
+
     # ========================================================================
     # PLAYBACK CONTROL (Phase 2: Delegates to PlaybackController)
     # ========================================================================
@@ -9,6 +9,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Phases that never allow trading, whatever the active flag says
+UNTRADEABLE_PHASES = frozenset({"COOLDOWN", "RUG_EVENT", "RUG_EVENT_1", "RUG_EVENT_2", "UNKNOWN"})
+
 
 @dataclass
 class GameTick:
@@ -95,7 +98,7 @@ class GameTick:
         return (
             self.active and
             not self.rugged and
-            self.phase not in ["COOLDOWN", "RUG_EVENT", "RUG_EVENT_1", "RUG_EVENT_2", "UNKNOWN"]
+            self.phase not in UNTRADEABLE_PHASES
         )
 
     def to_dict(self, preserve_precision: bool = False) -> Dict[str, Any]:
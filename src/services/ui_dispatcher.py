@@ -3,11 +3,30 @@ Thread-safe dispatcher for scheduling work on the Tk main thread.
 
 AUDIT FIX: Added queue overflow protection, proper drain on stop,
 and queue health monitoring.
+
+The drain interval adapts to measured paint time: the dispatcher keeps
+a ~10 second window of drain durations and sizes the gap between drains
+so that drain + gap lands on the target frame rate.
+
+Where Tk supports file handlers (POSIX), submit() wakes the Tcl event
+loop through a self-pipe instead of the dispatcher polling on a timer,
+so an idle dispatcher schedules nothing.
+
+Callers that may already be on the Tk thread can use run_or_submit(),
+which runs the callable inline there and only queues from other threads.
+schedule_coalesced() queues at most one pending call per key, so a burst
+of updates for the same target collapses into a single run of the latest.
 """
 
+import os
 import queue
 import logging
-from typing import Callable, Any, Tuple, Optional
+import statistics
+import threading
+import time
+import tkinter
+from collections import deque
+from typing import Callable, Any, Dict, Hashable, Set, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -27,22 +46,78 @@ class TkDispatcher:
     MAX_QUEUE_SIZE = 1000
     QUEUE_WARNING_THRESHOLD = 0.8  # Warn at 80% capacity
 
-    def __init__(self, root, poll_interval: int = 16):
+    # Adaptive frame pacing
+    FRAME_SAMPLE_WINDOW = 600      # ~10s of drains at 60 FPS
+    FRAME_RECALC_EVERY = 60        # Recompute interval roughly once per second
+    MIN_FRAME_INTERVAL_MS = 8
+
+    # Polling fallback: empty drains back off to this interval while idle
+    IDLE_POLL_MAX_MS = 100
+
+    def __init__(self, root, poll_interval: int = 16, target_fps: Optional[int] = 60):
         """
         Args:
             root: Tk root object providing .after()
-            poll_interval: milliseconds between queue drains
+            poll_interval: milliseconds between queue drains (initial value
+                when adaptive pacing is enabled)
+            target_fps: frame rate the drain cadence aims for; None keeps
+                poll_interval fixed
         """
         self._root = root
+        # The dispatcher is created on the Tk thread; run_or_submit() runs inline there
+        self._tk_thread_id = threading.get_ident()
         self._poll_interval = poll_interval
-        # AUDIT FIX: Use bounded queue
-        self._queue: queue.Queue[Tuple[Callable, tuple, dict]] = queue.Queue(
-            maxsize=self.MAX_QUEUE_SIZE
-        )
+        self._target_fps = target_fps
+        # Paint time (ms) of recent drains that executed at least one task
+        self._frame_times: deque = deque(maxlen=self.FRAME_SAMPLE_WINDOW)
+        self._frames_since_recalc = 0
+        # Lock-free MPSC queue (producers never contend on a Python-level lock);
+        # AUDIT FIX bound is enforced in submit() against qsize()
+        self._queue: queue.SimpleQueue[Tuple[Callable, tuple, dict]] = queue.SimpleQueue()
         self._running = True
         self._dropped_count = 0
         self._total_processed = 0
-        self._root.after(self._poll_interval, self._drain)
+        # Latest call per coalescing key, and keys with a run queued
+        self._coalesced: Dict[Hashable, Tuple[Callable, tuple, dict]] = {}
+        self._coalesced_armed: Set[Hashable] = set()
+        self._last_drain = 0.0
+        # Current polling-fallback delay; grows while drains find no work
+        self._idle_interval = poll_interval
+
+        # Self-pipe wakeup (falls back to timer polling when unavailable)
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        self._wake_pending = False
+        # Pending root.after id of the next drain (None = not scheduled)
+        self._drain_after_id = None
+        self._setup_wake_pipe()
+
+        if self._wake_r is None:
+            self._drain_after_id = self._root.after(self._poll_interval, self._drain)
+
+    def _setup_wake_pipe(self):
+        """Register a pipe with Tcl so submit() can wake the event loop."""
+        tk_app = getattr(self._root, 'tk', None)
+        if tk_app is None or not hasattr(tk_app, 'createfilehandler'):
+            return  # e.g. Windows builds of _tkinter
+
+        try:
+            r, w = os.pipe()
+        except OSError as e:
+            logger.debug(f"TkDispatcher wake pipe unavailable: {e}")
+            return
+
+        try:
+            os.set_blocking(r, False)
+            os.set_blocking(w, False)
+            tk_app.createfilehandler(r, tkinter.READABLE, self._on_wake)
+        except Exception as e:
+            logger.debug(f"TkDispatcher file handler unavailable, polling instead: {e}")
+            os.close(r)
+            os.close(w)
+            return
+
+        self._wake_r, self._wake_w = r, w
 
     def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> bool:
         """
@@ -56,19 +131,9 @@ class TkDispatcher:
         if not self._running:
             return False
 
-        try:
-            self._queue.put_nowait((fn, args, kwargs))
-
-            # AUDIT FIX: Warn if queue is getting full
-            qsize = self._queue.qsize()
-            if qsize > self.MAX_QUEUE_SIZE * self.QUEUE_WARNING_THRESHOLD:
-                logger.warning(
-                    f"TkDispatcher queue at {qsize}/{self.MAX_QUEUE_SIZE} "
-                    f"({qsize/self.MAX_QUEUE_SIZE*100:.0f}% capacity)"
-                )
-            return True
-
-        except queue.Full:
+        # AUDIT FIX: Bounded queue - drop when full
+        qsize = self._queue.qsize()
+        if qsize >= self.MAX_QUEUE_SIZE:
             self._dropped_count += 1
             logger.warning(
                 f"TkDispatcher queue full, dropped task "
@@ -76,6 +141,73 @@ class TkDispatcher:
             )
             return False
 
+        self._queue.put_nowait((fn, args, kwargs))
+
+        # AUDIT FIX: Warn if queue is getting full
+        if qsize >= self.MAX_QUEUE_SIZE * self.QUEUE_WARNING_THRESHOLD:
+            logger.warning(
+                f"TkDispatcher queue at {qsize + 1}/{self.MAX_QUEUE_SIZE} "
+                f"({(qsize + 1)/self.MAX_QUEUE_SIZE*100:.0f}% capacity)"
+            )
+
+        # One wake byte per idle->busy transition
+        if self._wake_w is not None and not self._wake_pending:
+            self._wake_pending = True
+            try:
+                os.write(self._wake_w, b'\x01')
+            except (BlockingIOError, OSError):
+                pass  # Pipe already full (a wake is pending) or closed
+        return True
+
+    def run_or_submit(self, fn: Callable, *args: Any, **kwargs: Any) -> bool:
+        """
+        Run fn immediately when called on the Tk thread, otherwise submit() it.
+
+        Avoids a queue round trip and loop wakeup for updates triggered from
+        Tk event handlers. Inline calls are not isolated: exceptions propagate
+        to the caller.
+
+        Returns:
+            bool: True if run or queued, False if the task was dropped
+        """
+        if threading.get_ident() == self._tk_thread_id:
+            fn(*args, **kwargs)
+            return True
+        return self.submit(fn, *args, **kwargs)
+
+    def schedule_coalesced(self, key: Hashable, fn: Callable, *args: Any, **kwargs: Any) -> bool:
+        """
+        Queue fn under key, replacing any call still pending for that key.
+
+        Only one run per key is queued at a time; when it executes it calls
+        the most recently scheduled fn/args. Safe to call from any thread.
+
+        Returns:
+            bool: True if pending or queued, False if dropped or stopped
+        """
+        if not self._running:
+            return False
+
+        # Store before checking the armed flag: _run_coalesced clears the flag
+        # before taking the entry, so a concurrent run either sees this entry
+        # or leaves the key unarmed for us to re-queue
+        self._coalesced[key] = (fn, args, kwargs)
+        if key in self._coalesced_armed:
+            return True
+        self._coalesced_armed.add(key)
+        if self.submit(self._run_coalesced, key):
+            return True
+        self._coalesced_armed.discard(key)
+        return False
+
+    def _run_coalesced(self, key: Hashable):
+        """Run the latest call scheduled under key (Tk thread)."""
+        self._coalesced_armed.discard(key)
+        entry = self._coalesced.pop(key, None)
+        if entry is not None:
+            fn, args, kwargs = entry
+            fn(*args, **kwargs)
+
     def stop(self):
         """
         Stop scheduling new drain cycles.
@@ -83,6 +215,8 @@ class TkDispatcher:
         AUDIT FIX: Drains remaining tasks before stopping.
         """
         self._running = False
+        self._close_wake_pipe()
+        self._cancel_scheduled_drain()
 
         # AUDIT FIX: Drain any remaining tasks
         remaining = 0
@@ -96,22 +230,78 @@ class TkDispatcher:
                         fn(*args, **kwargs)
                 except Exception as e:
                     logger.debug(f"Error executing task during shutdown: {e}")
-                finally:
-                    self._queue.task_done()
             except queue.Empty:
                 break
 
         if remaining > 0:
             logger.debug(f"TkDispatcher drained {remaining} pending tasks on stop")
 
+    def _cancel_scheduled_drain(self):
+        """Cancel the pending drain so it cannot fire after the root is destroyed."""
+        after_id, self._drain_after_id = self._drain_after_id, None
+        if after_id is None:
+            return
+        try:
+            self._root.after_cancel(after_id)
+        except Exception:
+            pass  # Root may already be destroyed
+
+    def _close_wake_pipe(self):
+        """Unregister the file handler and close both pipe ends."""
+        if self._wake_r is None:
+            return
+
+        try:
+            self._root.tk.deletefilehandler(self._wake_r)
+        except Exception:
+            pass  # Root may already be destroyed
+
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._wake_r = self._wake_w = None
+
+    def _on_wake(self, fd, _mask):
+        """
+        Tcl file handler: a task was submitted while the dispatcher was idle.
+
+        Schedules one paced drain rather than draining inline, so bursts
+        still respect the frame interval.
+        """
+        try:
+            while os.read(fd, 4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+        self._wake_pending = False
+        self._schedule_drain()
+
+    def _schedule_drain(self):
+        """Schedule a drain no sooner than one frame interval after the last."""
+        if self._drain_after_id is not None or not self._running:
+            return
+
+        elapsed_ms = (time.perf_counter() - self._last_drain) * 1000.0
+        delay = max(0, int(self._poll_interval - elapsed_ms))
+        try:
+            self._drain_after_id = self._root.after(delay, self._drain)
+        except Exception:
+            # Root may be destroyed during shutdown
+            self._running = False
+
     def _drain(self):
         """
         Execute queued tasks; scheduled on the Tk thread.
 
         AUDIT FIX: Added error isolation and processing count.
         """
+        self._drain_after_id = None
         processed = 0
         max_per_cycle = 50  # AUDIT FIX: Limit tasks per cycle to maintain UI responsiveness
+        started = time.perf_counter()
+        self._last_drain = started
 
         while processed < max_per_cycle:
             try:
@@ -126,15 +316,47 @@ class TkDispatcher:
             except Exception as e:
                 # AUDIT FIX: Isolate errors - don't let one bad task crash the dispatcher
                 logger.error(f"TkDispatcher task error: {e}", exc_info=True)
-            finally:
-                self._queue.task_done()
 
-        if self._running:
-            try:
-                self._root.after(self._poll_interval, self._drain)
-            except Exception:
-                # Root may be destroyed during shutdown
-                self._running = False
+        if processed and self._target_fps:
+            self._record_frame((time.perf_counter() - started) * 1000.0)
+
+        if not self._running:
+            return
+
+        if self._wake_r is not None:
+            # Event-driven: keep pumping only while work remains
+            if not self._queue.empty():
+                self._schedule_drain()
+            return
+
+        # Polling fallback: back off while idle (paused replay, no feed) so
+        # the loop stops waking every frame; any work resets the cadence
+        if processed:
+            self._idle_interval = self._poll_interval
+        else:
+            self._idle_interval = min(
+                max(self._idle_interval * 2, self._poll_interval), self.IDLE_POLL_MAX_MS
+            )
+
+        try:
+            self._drain_after_id = self._root.after(self._idle_interval, self._drain)
+        except Exception:
+            # Root may be destroyed during shutdown
+            self._running = False
+
+    def _record_frame(self, paint_ms: float):
+        """Record a drain's paint time and periodically re-pace the pump."""
+        self._frame_times.append(paint_ms)
+        self._frames_since_recalc += 1
+        if self._frames_since_recalc < self.FRAME_RECALC_EVERY:
+            return
+
+        self._frames_since_recalc = 0
+        median_paint_ms = statistics.median(self._frame_times)
+        self._poll_interval = max(
+            self.MIN_FRAME_INTERVAL_MS,
+            int(1000 / self._target_fps - median_paint_ms)
+        )
 
     def get_stats(self) -> dict:
         """
@@ -151,5 +373,7 @@ class TkDispatcher:
             'queue_utilization': self._queue.qsize() / self.MAX_QUEUE_SIZE,
             'dropped_count': self._dropped_count,
             'total_processed': self._total_processed,
+            'poll_interval_ms': self._poll_interval,
+            'event_driven': self._wake_r is not None,
             'running': self._running
         }
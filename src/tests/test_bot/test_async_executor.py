@@ -0,0 +1,110 @@
+"""
+Tests for AsyncBotExecutor result notification
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from bot.async_executor import AsyncBotExecutor
+
+
+def _make_tick(tick_number=1):
+    tick = Mock()
+    tick.tick = tick_number
+    return tick
+
+
+class TestAsyncBotExecutorResults:
+    """Tests for result delivery"""
+
+    def test_listener_called_after_result_queued(self):
+        """Listener fires once the result is already readable"""
+        controller = Mock()
+        controller.execute_step.return_value = {'action': 'WAIT', 'success': True}
+        seen = []
+        notified = threading.Event()
+
+        def on_result():
+            seen.append(executor.get_latest_result())
+            notified.set()
+
+        executor = AsyncBotExecutor(controller, on_result=on_result)
+        executor.start()
+        try:
+            executor.queue_execution(_make_tick(7))
+            assert notified.wait(timeout=2.0)
+        finally:
+            executor.stop()
+
+        assert seen[0]['tick'] == 7
+        assert seen[0]['result']['action'] == 'WAIT'
+
+    def test_listener_notified_on_error(self):
+        """Failed executions are delivered through the same path"""
+        controller = Mock()
+        controller.execute_step.side_effect = RuntimeError("boom")
+        notified = threading.Event()
+
+        executor = AsyncBotExecutor(controller, on_result=notified.set)
+        executor.start()
+        try:
+            executor.queue_execution(_make_tick(3))
+            assert notified.wait(timeout=2.0)
+        finally:
+            executor.stop()
+
+        result = executor.get_latest_result()
+        assert result['tick'] == 3
+        assert result['error'] == 'boom'
+
+    def test_listener_errors_do_not_kill_worker(self):
+        """A failing listener doesn't stop result production"""
+        controller = Mock()
+        controller.execute_step.return_value = {'action': 'WAIT'}
+
+        executor = AsyncBotExecutor(controller, on_result=Mock(side_effect=ValueError))
+        executor.start()
+        try:
+            executor.queue_execution(_make_tick(1))
+            for _ in range(100):
+                if executor.executions:
+                    break
+                time.sleep(0.01)
+            executor.queue_execution(_make_tick(2))
+            for _ in range(100):
+                if executor.executions >= 2:
+                    break
+                time.sleep(0.01)
+        finally:
+            executor.stop()
+
+        assert executor.executions == 2
+
+    def test_get_latest_result_empty(self):
+        """No results pending returns None without blocking"""
+        executor = AsyncBotExecutor(Mock())
+
+        assert not executor.has_results()
+        assert executor.get_latest_result() is None
+
+    def test_results_returned_in_order(self):
+        """Pending results are consumed FIFO"""
+        executor = AsyncBotExecutor(Mock())
+        executor._publish_result({'tick': 1})
+        executor._publish_result({'tick': 2})
+
+        assert executor.has_results()
+        assert executor.get_latest_result()['tick'] == 1
+        assert executor.get_latest_result()['tick'] == 2
+        assert executor.get_latest_result() is None
+
+    def test_drain_results_takes_all_pending(self):
+        """drain_results() empties the queue in FIFO order"""
+        executor = AsyncBotExecutor(Mock())
+        for tick in (1, 2, 3):
+            executor._publish_result({'tick': tick})
+
+        assert [r['tick'] for r in executor.drain_results()] == [1, 2, 3]
+        assert not executor.has_results()
+        assert executor.drain_results() == []
@@ -6,6 +6,7 @@ import pytest
 from decimal import Decimal
 from models import Position
 from core import GameState
+from core.game_state import StateEvents
 
 
 class TestGameStateInitialization:
@@ -214,6 +215,35 @@ class TestGameStateStatistics:
         assert len(game_state.get_position_history()) == 1
 
 
+class TestGameStateObservers:
+    """Tests for state event subscription"""
+
+    def test_subscribe_many_registers_each_handler(self, game_state):
+        """Each handler in the table receives its own event"""
+        balances, sell_pcts = [], []
+        game_state.subscribe_many({
+            StateEvents.BALANCE_CHANGED: balances.append,
+            StateEvents.SELL_PERCENTAGE_CHANGED: sell_pcts.append,
+        })
+
+        game_state.update_balance(Decimal('-0.01'), "test")
+
+        assert len(balances) == 1
+        assert sell_pcts == []
+
+    def test_unsubscribe_stops_delivery(self, game_state):
+        """Unsubscribed callbacks are not called; others still are"""
+        first, second = [], []
+        game_state.subscribe(StateEvents.BALANCE_CHANGED, first.append)
+        game_state.subscribe(StateEvents.BALANCE_CHANGED, second.append)
+
+        game_state.unsubscribe(StateEvents.BALANCE_CHANGED, first.append)
+        game_state.update_balance(Decimal('-0.01'), "test")
+
+        assert first == []
+        assert len(second) == 1
+
+
 class TestGameStateResetAndMetrics:
     """Additional regression tests for state integrity"""
 
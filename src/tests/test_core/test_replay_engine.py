@@ -115,3 +115,55 @@ def test_progress_reaches_100_percent_at_final_tick(tmp_path):
     assert info['progress'] == 100.0, f"Expected info progress=100.0, got {info['progress']}"
     assert info['total_ticks'] == 5
     assert info['current_tick'] == 4
+
+
+def test_parse_file_then_load_parsed(tmp_path):
+    """parse_file reads without touching state; load_parsed installs the game"""
+    game_state = GameState(Decimal("0.100"))
+    engine = ReplayEngine(game_state)
+
+    game_file = tmp_path / "game.jsonl"
+    _write_game_file(game_file, game_id="game-prefetched")
+
+    ticks, game_id = engine.parse_file(game_file)
+    assert game_id == "game-prefetched"
+    assert len(ticks) == 2
+    assert engine.game_id != "game-prefetched"
+
+    assert engine.load_parsed(game_file, ticks, game_id) is True
+    assert game_state.get('game_id') == "game-prefetched"
+    assert len(engine.ticks) == 2
+
+
+def test_push_tick_buffers_and_displays_every_tick():
+    """Each live tick is buffered and displayed as it is pushed"""
+    from models import GameTick
+
+    game_state = GameState(Decimal("0.100"))
+    engine = ReplayEngine(game_state)
+    engine.auto_recording = False
+    displayed = []
+    engine.on_tick_callback = lambda tick, index, total: displayed.append((tick.tick, index, total))
+
+    ticks = [
+        GameTick.from_dict({
+            "game_id": "live-game",
+            "tick": i,
+            "timestamp": f"2025-01-01T00:00:0{i}",
+            "price": 1.0 + i / 10,
+            "phase": "ACTIVE",
+            "active": True,
+            "rugged": False,
+            "cooldown_timer": 0,
+            "trade_count": i
+        })
+        for i in range(3)
+    ]
+
+    assert all(engine.push_tick(tick) for tick in ticks)
+    assert engine.push_tick("not a tick") is False
+    assert engine.live_ring_buffer.get_size() == 3
+    assert displayed == [(0, 0, 1), (1, 1, 2), (2, 2, 3)]
+    assert game_state.get('current_tick') == 2
+
+    engine.cleanup()
@@ -0,0 +1,60 @@
+"""
+Tests for BotManager bot result draining
+"""
+
+import sys
+import importlib.util
+from pathlib import Path
+from unittest.mock import Mock
+
+# Import BotManager directly to avoid ui/__init__.py cascade
+# which triggers sources/__init__.py and requires socketio
+_src_dir = Path(__file__).parent.parent.parent
+spec = importlib.util.spec_from_file_location(
+    "bot_manager",
+    _src_dir / "ui" / "controllers" / "bot_manager.py"
+)
+_bm_module = importlib.util.module_from_spec(spec)
+sys.modules["bot_manager"] = _bm_module
+spec.loader.exec_module(_bm_module)
+BotManager = _bm_module.BotManager
+
+
+def _make_bot_manager(ui_dispatcher):
+    timing_overlay_var = Mock()
+    timing_overlay_var.get.return_value = False
+    return BotManager(
+        root=Mock(),
+        state=Mock(),
+        bot_executor=Mock(),
+        bot_controller=Mock(),
+        bot_config_panel=Mock(),
+        browser_executor=None,
+        bot_toggle_button=Mock(),
+        bot_status_label=Mock(),
+        buy_button=Mock(),
+        sell_button=Mock(),
+        sidebet_button=Mock(),
+        strategy_var=Mock(),
+        bot_var=Mock(),
+        timing_overlay_var=timing_overlay_var,
+        log_callback=Mock(),
+        ui_dispatcher=ui_dispatcher
+    )
+
+
+def test_rejected_drain_submit_does_not_block_later_results():
+    """A full or stopped dispatcher must not leave the drain flag stuck"""
+    ui_dispatcher = Mock()
+    ui_dispatcher.submit.side_effect = [False, True]
+    manager = _make_bot_manager(ui_dispatcher)
+
+    manager._on_bot_result_ready()
+    manager._on_bot_result_ready()
+
+    assert ui_dispatcher.submit.call_count == 2
+    ui_dispatcher.submit.assert_called_with(manager._drain_bot_results)
+
+    # Further wakeups coalesce into the drain that was queued
+    manager._on_bot_result_ready()
+    assert ui_dispatcher.submit.call_count == 2
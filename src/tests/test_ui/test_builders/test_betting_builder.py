@@ -78,3 +78,11 @@ class TestBettingBuilder:
         builder = BettingBuilder(root, callbacks, Decimal('0.001'), Decimal('1.5'))
         widgets = builder.build()
         assert '1.5' in widgets['balance_label'].cget('text')
+
+    def test_bet_var_bound_to_entry(self, root, callbacks):
+        """bet_var should be a StringVar driving bet_entry"""
+        builder = BettingBuilder(root, callbacks, Decimal('0.001'), Decimal('1.0'))
+        widgets = builder.build()
+        assert isinstance(widgets['bet_var'], tk.StringVar)
+        widgets['bet_var'].set('0.25')
+        assert widgets['bet_entry'].get() == '0.25'
@@ -0,0 +1,91 @@
+"""Tests for ChartWidget price history and trend drawing"""
+
+import pytest
+import tkinter as tk
+from decimal import Decimal
+from ui.widgets.chart import ChartWidget, MAX_POINTS, _trend_runs
+
+
+@pytest.fixture
+def root():
+    """Create a Tk root window for testing"""
+    root = tk.Tk()
+    root.withdraw()  # Hide the window
+    yield root
+    root.destroy()
+
+
+@pytest.fixture
+def chart(root):
+    """ChartWidget showing the whole ring buffer"""
+    chart = ChartWidget(root)
+    chart.visible_ticks = MAX_POINTS
+    return chart
+
+
+class TestChartHistory:
+    """Tests for the ring buffer history"""
+
+    def test_add_ticks_ingests_batch_in_order(self, chart):
+        """add_ticks() stores every point in arrival order"""
+        chart.add_ticks(range(5), [Decimal('1.0') + Decimal(i) / 10 for i in range(5)])
+
+        assert chart.get_info()['tick_count'] == 5
+        assert list(chart._visible(chart._ticks)) == [0, 1, 2, 3, 4]
+        assert list(chart._visible(chart._prices)) == pytest.approx([1.0, 1.1, 1.2, 1.3, 1.4])
+
+    def test_add_tick_skips_repeated_tick(self, chart):
+        """Re-delivering the newest tick at the same price adds nothing"""
+        chart.add_tick(1, Decimal('1.5'))
+        chart.add_tick(1, Decimal('1.5'))
+
+        assert chart.get_info()['tick_count'] == 1
+
+    def test_buffer_wraps_at_max_points(self, chart):
+        """Past MAX_POINTS the oldest points are overwritten"""
+        total = MAX_POINTS + 10
+        chart.add_ticks(range(total), [Decimal('1.0')] * total)
+
+        assert chart.get_info()['tick_count'] == MAX_POINTS
+        assert list(chart._visible(chart._ticks)) == list(range(10, total))
+
+    def test_visible_tail_is_ordered_after_wrap(self, chart):
+        """The visible window spans the wrap point in chronological order"""
+        total = MAX_POINTS + 30
+        chart.add_ticks(range(total), [Decimal(i + 1) for i in range(total)])
+        chart.visible_ticks = 50
+
+        assert list(chart._visible(chart._ticks)) == list(range(total - 50, total))
+        assert list(chart._visible(chart._prices)) == [float(i + 1) for i in range(total - 50, total)]
+
+    def test_clear_history_empties_buffer(self, chart):
+        """clear_history() drops all points"""
+        chart.add_ticks(range(3), [Decimal('1.0')] * 3)
+        chart.clear_history()
+
+        assert chart.get_info()['tick_count'] == 0
+        assert len(chart._visible(chart._ticks)) == 0
+
+
+class TestChartTrendDrawing:
+    """Tests for trend-colored price line drawing"""
+
+    def test_trend_runs_split_on_direction_change(self):
+        """Consecutive same-direction moves share one run"""
+        prices = [1.0, 1.1, 1.2, 1.1, 1.1, 1.1, 1.3]
+
+        assert _trend_runs(prices) == [(0, 2, 1), (2, 3, -1), (3, 5, 0), (5, 6, 1)]
+
+    def test_trend_runs_need_two_points(self):
+        """A single point has no segments"""
+        assert _trend_runs([1.0]) == []
+
+    def test_draws_one_line_per_run_in_trend_colors(self, chart):
+        """Each run is one polyline colored by its direction"""
+        chart.add_ticks(range(5), [Decimal(p) for p in ('1.0', '1.1', '1.2', '1.1', '1.0')])
+
+        lines = [item for item in chart.find_withtag('series') if chart.type(item) == 'line']
+
+        assert [chart.itemcget(item, 'fill') for item in lines] == [
+            chart.colors['price_up'], chart.colors['price_down']
+        ]
@@ -2,6 +2,8 @@
 Tests for TkDispatcher
 """
 
+import threading
+
 from services.ui_dispatcher import TkDispatcher
 
 
@@ -10,9 +12,15 @@ class DummyRoot:
 
     def __init__(self):
         self.callbacks = []
+        self.delays = []
 
-    def after(self, _delay, callback):
+    def after(self, delay, callback):
         self.callbacks.append(callback)
+        self.delays.append(delay)
+        return f"after#{len(self.callbacks)}"
+
+    def after_cancel(self, _after_id):
+        pass
 
 
 def test_dispatcher_runs_tasks_on_main_thread_stub():
@@ -31,3 +39,135 @@ def test_dispatcher_runs_tasks_on_main_thread_stub():
             break
 
     assert executed == [42]
+
+
+def test_dispatcher_adapts_poll_interval_to_paint_time():
+    root = DummyRoot()
+    dispatcher = TkDispatcher(root, poll_interval=16, target_fps=50)
+
+    for _ in range(TkDispatcher.FRAME_RECALC_EVERY):
+        dispatcher._record_frame(5.0)
+
+    # 1000/50 = 20ms frame budget minus 5ms median paint
+    assert dispatcher.get_stats()['poll_interval_ms'] == 15
+
+    for _ in range(TkDispatcher.FRAME_RECALC_EVERY * 3):
+        dispatcher._record_frame(30.0)
+
+    assert dispatcher.get_stats()['poll_interval_ms'] == TkDispatcher.MIN_FRAME_INTERVAL_MS
+
+
+def test_polling_fallback_backs_off_while_idle_and_resets_on_work():
+    root = DummyRoot()
+    dispatcher = TkDispatcher(root, poll_interval=16, target_fps=None)
+
+    # Empty drains double the delay up to the idle cap
+    for _ in range(6):
+        root.callbacks.pop(0)()
+    assert root.delays[1:] == [32, 64, 100, 100, 100, 100]
+
+    executed = []
+    dispatcher.submit(executed.append, 1)
+    root.callbacks.pop(0)()
+
+    assert executed == [1]
+    assert root.delays[-1] == 16
+
+
+class DummyTkApp:
+    """Stub of the Tcl interpreter's file handler API."""
+
+    def __init__(self):
+        self.handlers = {}
+
+    def createfilehandler(self, fd, _mask, callback):
+        self.handlers[fd] = callback
+
+    def deletefilehandler(self, fd):
+        self.handlers.pop(fd, None)
+
+
+class DummyPipeRoot(DummyRoot):
+    """DummyRoot that also exposes a file-handler capable .tk"""
+
+    def __init__(self):
+        super().__init__()
+        self.tk = DummyTkApp()
+
+    def winfo_exists(self):
+        return True
+
+
+def test_dispatcher_wakes_via_pipe_instead_of_polling():
+    root = DummyPipeRoot()
+    dispatcher = TkDispatcher(root, poll_interval=0)
+    executed = []
+
+    # Idle dispatcher schedules nothing
+    assert root.callbacks == []
+    assert dispatcher.get_stats()['event_driven']
+
+    dispatcher.submit(executed.append, 1)
+    dispatcher.submit(executed.append, 2)
+
+    # Fire the Tcl file handler, then the paced drain it schedules
+    (fd, handler), = root.tk.handlers.items()
+    handler(fd, None)
+    assert len(root.callbacks) == 1
+    root.callbacks.pop(0)()
+
+    assert executed == [1, 2]
+    # Queue empty again: no follow-up drain scheduled
+    assert root.callbacks == []
+
+    dispatcher.stop()
+    assert root.tk.handlers == {}
+
+
+def test_dispatcher_drops_tasks_when_full():
+    root = DummyRoot()
+    dispatcher = TkDispatcher(root, poll_interval=0)
+
+    for _ in range(TkDispatcher.MAX_QUEUE_SIZE):
+        assert dispatcher.submit(lambda: None)
+
+    assert dispatcher.submit(lambda: None) is False
+    assert dispatcher.get_stats()['dropped_count'] == 1
+
+
+def test_run_or_submit_runs_inline_on_tk_thread_and_queues_elsewhere():
+    root = DummyRoot()
+    dispatcher = TkDispatcher(root, poll_interval=0)
+    executed = []
+
+    assert dispatcher.run_or_submit(executed.append, 'inline')
+    assert executed == ['inline']
+
+    worker = threading.Thread(target=dispatcher.run_or_submit, args=(executed.append, 'queued'))
+    worker.start()
+    worker.join()
+    assert executed == ['inline']
+
+    # Polling drain scheduled by the constructor
+    root.callbacks.pop(0)()
+    assert executed == ['inline', 'queued']
+    dispatcher.stop()
+
+
+def test_schedule_coalesced_runs_latest_call_once_per_key():
+    root = DummyRoot()
+    dispatcher = TkDispatcher(root, poll_interval=0)
+    executed = []
+
+    for value in range(5):
+        assert dispatcher.schedule_coalesced('tick', executed.append, value)
+    dispatcher.schedule_coalesced('phase', executed.append, 'ACTIVE')
+
+    root.callbacks.pop(0)()
+    assert executed == [4, 'ACTIVE']
+
+    # Key is re-armed once its run has happened
+    dispatcher.schedule_coalesced('tick', executed.append, 5)
+    root.callbacks.pop(0)()
+    assert executed == [4, 'ACTIVE', 5]
+    dispatcher.stop()
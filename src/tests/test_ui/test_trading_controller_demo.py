@@ -104,7 +104,7 @@ def mock_bet_entry():
 def mock_ui_dispatcher():
     """Create mock UI dispatcher"""
     dispatcher = Mock()
-    dispatcher.submit = Mock(side_effect=lambda f: f())  # Execute immediately
+    dispatcher.submit = Mock(side_effect=lambda f, *args, **kwargs: f(*args, **kwargs))  # Execute immediately
     return dispatcher
 
 
@@ -287,6 +287,34 @@ class TestPercentageButtonsRecording:
         assert demo_recorder.action_count >= 1
 
 
+class TestPercentageHighlight:
+    """Tests for radio-style percentage button highlighting"""
+
+    def test_only_changed_buttons_are_reconfigured(self, trading_controller_with_recorder):
+        """After the first pass only the old and new selections are touched"""
+        controller = trading_controller_with_recorder
+        controller.percentage_buttons = {
+            pct: {'button': Mock(), 'default_color': '#333', 'selected_color': '#0f0'}
+            for pct in (0.1, 0.25, 0.5, 1.0)
+        }
+        buttons = {pct: info['button'] for pct, info in controller.percentage_buttons.items()}
+
+        controller.highlight_percentage_button(1.0)
+        assert all(button.config.call_count == 1 for button in buttons.values())
+
+        for button in buttons.values():
+            button.config.reset_mock()
+        controller.highlight_percentage_button(0.5)
+        assert buttons[1.0].config.call_count == 1
+        assert buttons[0.5].config.call_count == 1
+        assert buttons[0.1].config.call_count == 0
+        assert buttons[0.25].config.call_count == 0
+
+        buttons[0.5].config.reset_mock()
+        controller.highlight_percentage_button(0.5)
+        assert buttons[0.5].config.call_count == 0
+
+
 class TestBetIncrementButtonsRecording:
     """Tests for bet increment buttons recording"""
 
@@ -427,3 +455,50 @@ class TestNoRecordingWhenRecorderNotActive:
         # UI update should still happen
         mock_bet_entry.delete.assert_called()
         mock_bet_entry.insert.assert_called()
+
+
+class TestGetBetAmountValidation:
+    """Tests for bet amount parsing and validation"""
+
+    @pytest.mark.parametrize("text", ["", "   ", "abc", "NaN", "Infinity"])
+    def test_invalid_text_rejected(self, trading_controller_with_recorder, mock_bet_entry, mock_toast, text):
+        """Unparseable or non-finite input returns None with an error toast"""
+        mock_bet_entry.get.return_value = text
+
+        assert trading_controller_with_recorder.get_bet_amount() is None
+        mock_toast.show.assert_called_with("Invalid bet amount", "error")
+
+    @pytest.mark.parametrize("text", ["", "abc", "NaN", "sNaN", "Infinity"])
+    @pytest.mark.parametrize("method", ["half_bet_amount", "double_bet_amount"])
+    def test_invalid_text_leaves_half_and_double_unchanged(
+        self, trading_controller_with_recorder, mock_bet_entry, text, method
+    ):
+        """1/2 and X2 ignore unparseable or non-finite entry text instead of raising"""
+        mock_bet_entry.get.return_value = text
+
+        getattr(trading_controller_with_recorder, method)()
+
+        mock_bet_entry.insert.assert_not_called()
+
+    @pytest.mark.parametrize("text", ["", "abc", "NaN", "sNaN", "Infinity"])
+    def test_invalid_text_increments_from_zero(self, trading_controller_with_recorder, mock_bet_entry, text):
+        """Increment treats unparseable or non-finite entry text as zero"""
+        mock_bet_entry.get.return_value = text
+
+        trading_controller_with_recorder.increment_bet_amount(Decimal('0.01'))
+
+        mock_bet_entry.insert.assert_called_with(0, '0.01')
+
+    def test_valid_amount_returned(self, trading_controller_with_recorder, mock_bet_entry):
+        """Amount within limits and balance is returned as Decimal"""
+        mock_bet_entry.get.return_value = "0.01"
+
+        assert trading_controller_with_recorder.get_bet_amount() == Decimal('0.01')
+
+    def test_edited_text_is_reparsed(self, trading_controller_with_recorder, mock_bet_entry):
+        """The parse cache never returns a stale amount after the entry changes"""
+        mock_bet_entry.get.return_value = "0.01"
+        assert trading_controller_with_recorder.get_bet_amount() == Decimal('0.01')
+
+        mock_bet_entry.get.return_value = "0.02"
+        assert trading_controller_with_recorder.get_bet_amount() == Decimal('0.02')
@@ -13,7 +13,7 @@ from tkinter import ttk, messagebox
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
 
 from bot.execution_mode import ExecutionMode
 from bot.strategies import list_strategies
@@ -49,6 +49,9 @@ class BotConfigPanel:
         # Dialog window (will be created when show() is called)
         self.dialog = None
 
+        # Called with the new ExecutionMode when a saved config changes it
+        self._mode_change_listeners: List[Callable[[ExecutionMode], None]] = []
+
         # UI variables
         self.execution_mode_var = None
         self.strategy_var = None
@@ -383,6 +386,7 @@ class BotConfigPanel:
     def _on_ok(self):
         """Handle OK button click"""
         # Update config with current values
+        previous_mode = self.config['execution_mode']
         self.config['execution_mode'] = self.execution_mode_var.get()
         self.config['strategy'] = self.strategy_var.get()
         self.config['bot_enabled'] = self.bot_enabled_var.get()
@@ -406,6 +410,11 @@ class BotConfigPanel:
             self._result = self.config.copy()
             self.dialog.destroy()
 
+            if self.config['execution_mode'] != previous_mode:
+                mode = self.get_execution_mode()
+                for listener in self._mode_change_listeners:
+                    listener(mode)
+
     def _on_cancel(self):
         """Handle Cancel button click"""
         # No result (user cancelled)
@@ -425,6 +434,16 @@ class BotConfigPanel:
         """
         return self.config.copy()
 
+    def add_mode_change_listener(self, callback: Callable[[ExecutionMode], None]) -> None:
+        """
+        Register a callback for execution mode changes
+
+        Args:
+            callback: Called on the Tk thread with the new ExecutionMode
+                      after the dialog saves a different mode
+        """
+        self._mode_change_listeners.append(callback)
+
     def get_execution_mode(self) -> ExecutionMode:
         """
         Get execution mode as enum
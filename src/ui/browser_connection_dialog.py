@@ -154,10 +154,20 @@ class BrowserConnectionDialog:
         """
         Add message to progress display
 
+        Safe to call from the connection thread: the widget write is
+        marshaled onto the Tk thread with parent.after().
+
         Args:
             message: Message to log
             status: "info", "success", "error", "warning"
         """
+        self.parent.after(0, self._append_progress, message, status)
+
+    def _append_progress(self, message, status):
+        """Write one progress line (Tk thread)"""
+        if not self.dialog.winfo_exists():
+            return
+
         self.progress_text.config(state='normal')
 
         # Color prefixes
@@ -172,14 +182,17 @@ class BrowserConnectionDialog:
         self.progress_text.insert(tk.END, f"{prefix}{message}\n")
         self.progress_text.see(tk.END)
         self.progress_text.config(state='disabled')
-        self.dialog.update()
 
-    async def _connect_async(self):
+    async def _connect_async(self, profile, navigate):
         """
         Async CDP connection process
 
         Phase 9.1: Uses CDP to connect to YOUR Chrome browser.
 
+        Args:
+            profile: Chrome profile name (read on the Tk thread)
+            navigate: Whether to open rugs.fun after connecting
+
         Returns:
             bool: True if connection succeeded, False otherwise
         """
@@ -188,7 +201,6 @@ class BrowserConnectionDialog:
             self._log_progress("\nStep 1: Connecting via CDP...", "info")
             self._log_progress("  Checking for running Chrome on port 9222")
 
-            profile = self.profile_var.get()
             self._log_progress(f"  Profile: {profile}")
 
             # Update executor profile
@@ -210,7 +222,7 @@ class BrowserConnectionDialog:
                 self._log_progress(f"  Current URL: {url}", "info")
 
             # Step 2: Navigate if requested
-            if self.navigate_var.get():
+            if navigate:
                 page = self.browser_executor.page
                 if page and "rugs.fun" not in page.url:
                     self._log_progress("\nStep 2: Navigating to rugs.fun...", "info")
@@ -246,22 +258,23 @@ class BrowserConnectionDialog:
         self._log_progress("Starting connection process...", "info")
         self._log_progress("="*60, "info")
 
+        # Tk variables are read here; the connection thread must not touch Tk
+        profile = self.profile_var.get()
+        navigate = self.navigate_var.get()
+
         def run_async():
             """Run async connection in background thread"""
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
 
             try:
-                result = loop.run_until_complete(self._connect_async())
+                result = loop.run_until_complete(self._connect_async(profile, navigate))
 
                 # Update UI on main thread
-                self.parent.after(0, lambda: self._connection_finished(result))
+                self.parent.after(0, self._connection_finished, result)
             except Exception as e:
                 logger.error(f"Async connection error: {e}", exc_info=True)
-                self.parent.after(
-                    0,
-                    lambda: self._connection_finished(False, str(e))
-                )
+                self.parent.after(0, self._connection_finished, False, str(e))
             finally:
                 loop.close()
 
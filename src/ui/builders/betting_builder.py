@@ -8,10 +8,20 @@ Handles construction of bet entry, increment buttons, and balance display.
 import tkinter as tk
 from typing import Callable, Dict
 from decimal import Decimal
+from functools import partial
 import logging
 
 logger = logging.getLogger(__name__)
 
+# (result key, label, amount) for the bet increment buttons, in display order.
+# Amounts are parsed once here and reused by every click.
+BET_INCREMENTS = (
+    ('increment_001_button', "+0.001", Decimal('0.001')),
+    ('increment_01_button', "+0.01", Decimal('0.01')),
+    ('increment_10_button', "+0.1", Decimal('0.1')),
+    ('increment_1_button', "+1", Decimal('1')),
+)
+
 
 class BettingBuilder:
     """
@@ -59,6 +69,7 @@ class BettingBuilder:
             dict with keys:
                 - bet_row: The bet row frame
                 - bet_entry: Bet amount entry field
+                - bet_var: StringVar bound to bet_entry
                 - clear_button: Clear (X) button
                 - increment_*_button: Increment buttons
                 - half_button: 1/2 button
@@ -76,8 +87,10 @@ class BettingBuilder:
         bet_left = tk.Frame(bet_row, bg='#1a1a1a')
         bet_left.pack(side=tk.LEFT, padx=10)
 
+        bet_var = tk.StringVar(self.parent, value=str(self.default_bet))
         bet_entry = tk.Entry(
             bet_left,
+            textvariable=bet_var,
             bg='#000000',
             fg='white',
             font=('Arial', 14, 'bold'),
@@ -87,7 +100,6 @@ class BettingBuilder:
             justify=tk.RIGHT
         )
         bet_entry.pack(side=tk.LEFT)
-        bet_entry.insert(0, str(self.default_bet))
 
         tk.Label(bet_left, text="SOL", bg='#1a1a1a', fg='white', font=('Arial', 10)).pack(side=tk.LEFT, padx=5)
 
@@ -95,88 +107,24 @@ class BettingBuilder:
         bet_center = tk.Frame(bet_row, bg='#1a1a1a')
         bet_center.pack(side=tk.LEFT, padx=10)
 
-        bet_btn_style = {'font': ('Arial', 9), 'width': 6, 'bd': 1, 'relief': tk.RAISED}
+        bet_btn_style = {
+            'font': ('Arial', 9), 'width': 6, 'bd': 1, 'relief': tk.RAISED,
+            'bg': '#333333', 'fg': 'white'
+        }
         increment_bet = self.callbacks.get('increment_bet', lambda a: None)
 
-        clear_button = tk.Button(
-            bet_center,
-            text="X",
-            command=self.callbacks.get('clear_bet', lambda: None),
-            bg='#333333',
-            fg='white',
-            **bet_btn_style
-        )
-        clear_button.pack(side=tk.LEFT, padx=2)
-
-        increment_001_button = tk.Button(
-            bet_center,
-            text="+0.001",
-            command=lambda: increment_bet(Decimal('0.001')),
-            bg='#333333',
-            fg='white',
-            **bet_btn_style
-        )
-        increment_001_button.pack(side=tk.LEFT, padx=2)
-
-        increment_01_button = tk.Button(
-            bet_center,
-            text="+0.01",
-            command=lambda: increment_bet(Decimal('0.01')),
-            bg='#333333',
-            fg='white',
-            **bet_btn_style
-        )
-        increment_01_button.pack(side=tk.LEFT, padx=2)
-
-        increment_10_button = tk.Button(
-            bet_center,
-            text="+0.1",
-            command=lambda: increment_bet(Decimal('0.1')),
-            bg='#333333',
-            fg='white',
-            **bet_btn_style
-        )
-        increment_10_button.pack(side=tk.LEFT, padx=2)
-
-        increment_1_button = tk.Button(
-            bet_center,
-            text="+1",
-            command=lambda: increment_bet(Decimal('1')),
-            bg='#333333',
-            fg='white',
-            **bet_btn_style
-        )
-        increment_1_button.pack(side=tk.LEFT, padx=2)
-
-        half_button = tk.Button(
-            bet_center,
-            text="1/2",
-            command=self.callbacks.get('half_bet', lambda: None),
-            bg='#333333',
-            fg='white',
-            **bet_btn_style
-        )
-        half_button.pack(side=tk.LEFT, padx=2)
-
-        double_button = tk.Button(
-            bet_center,
-            text="X2",
-            command=self.callbacks.get('double_bet', lambda: None),
-            bg='#333333',
-            fg='white',
-            **bet_btn_style
-        )
-        double_button.pack(side=tk.LEFT, padx=2)
-
-        max_button = tk.Button(
-            bet_center,
-            text="MAX",
-            command=self.callbacks.get('max_bet', lambda: None),
-            bg='#333333',
-            fg='white',
-            **bet_btn_style
-        )
-        max_button.pack(side=tk.LEFT, padx=2)
+        # (result key, label, command) in display order
+        bet_buttons = {}
+        for key, text, command in (
+            ('clear_button', "X", self.callbacks.get('clear_bet', lambda: None)),
+            *((key, text, partial(increment_bet, amount)) for key, text, amount in BET_INCREMENTS),
+            ('half_button', "1/2", self.callbacks.get('half_bet', lambda: None)),
+            ('double_button', "X2", self.callbacks.get('double_bet', lambda: None)),
+            ('max_button', "MAX", self.callbacks.get('max_bet', lambda: None)),
+        ):
+            btn = tk.Button(bet_center, text=text, command=command, **bet_btn_style)
+            btn.pack(side=tk.LEFT, padx=2)
+            bet_buttons[key] = btn
 
         # Right - wallet balance + lock control
         balance_container = tk.Frame(bet_row, bg='#1a1a1a')
@@ -209,14 +157,8 @@ class BettingBuilder:
         return {
             'bet_row': bet_row,
             'bet_entry': bet_entry,
-            'clear_button': clear_button,
-            'increment_001_button': increment_001_button,
-            'increment_01_button': increment_01_button,
-            'increment_10_button': increment_10_button,
-            'increment_1_button': increment_1_button,
-            'half_button': half_button,
-            'double_button': double_button,
-            'max_button': max_button,
+            'bet_var': bet_var,
+            **bet_buttons,
             'balance_label': balance_label,
             'balance_lock_button': balance_lock_button,
         }
@@ -7,10 +7,14 @@ Handles construction of playback buttons and speed controls.
 
 import tkinter as tk
 from typing import Callable, Dict
+from functools import partial
 import logging
 
 logger = logging.getLogger(__name__)
 
+# (speed multiplier, button colour) in display order
+SPEED_PRESETS = ((0.25, '#333333'), (0.5, '#333333'), (1.0, '#444444'), (2.0, '#333333'), (5.0, '#333333'))
+
 
 class PlaybackBuilder:
     """
@@ -62,50 +66,28 @@ class PlaybackBuilder:
         playback_left = tk.Frame(playback_row, bg='#1a1a1a')
         playback_left.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
-        btn_style = {'font': ('Arial', 10), 'width': 12, 'bd': 1, 'relief': tk.RAISED}
+        btn_style = {
+            'font': ('Arial', 10), 'width': 12, 'bd': 1, 'relief': tk.RAISED,
+            'bg': '#444444', 'fg': 'white'
+        }
 
-        load_button = tk.Button(
-            playback_left,
-            text="LOAD GAME",
-            command=self.callbacks.get('load_game', lambda: None),
-            bg='#444444',
-            fg='white',
-            **btn_style
-        )
-        load_button.pack(side=tk.LEFT, padx=5)
-
-        play_button = tk.Button(
-            playback_left,
-            text="PLAY",
-            command=self.callbacks.get('toggle_playback', lambda: None),
-            bg='#444444',
-            fg='white',
-            state=tk.DISABLED,
-            **btn_style
-        )
-        play_button.pack(side=tk.LEFT, padx=5)
-
-        step_button = tk.Button(
-            playback_left,
-            text="STEP",
-            command=self.callbacks.get('step_forward', lambda: None),
-            bg='#444444',
-            fg='white',
-            state=tk.DISABLED,
-            **btn_style
-        )
-        step_button.pack(side=tk.LEFT, padx=5)
-
-        reset_button = tk.Button(
-            playback_left,
-            text="RESET",
-            command=self.callbacks.get('reset_game', lambda: None),
-            bg='#444444',
-            fg='white',
-            state=tk.DISABLED,
-            **btn_style
-        )
-        reset_button.pack(side=tk.LEFT, padx=5)
+        # (result key, label, callback name, initial state)
+        playback_buttons = {}
+        for key, text, callback, state in (
+            ('load_button', "LOAD GAME", 'load_game', tk.NORMAL),
+            ('play_button', "PLAY", 'toggle_playback', tk.DISABLED),
+            ('step_button', "STEP", 'step_forward', tk.DISABLED),
+            ('reset_button', "RESET", 'reset_game', tk.DISABLED),
+        ):
+            btn = tk.Button(
+                playback_left,
+                text=text,
+                command=self.callbacks.get(callback, lambda: None),
+                state=state,
+                **btn_style
+            )
+            btn.pack(side=tk.LEFT, padx=5)
+            playback_buttons[key] = btn
 
         # Right side - playback speed controls
         speed_frame = tk.Frame(playback_row, bg='#1a1a1a')
@@ -125,11 +107,11 @@ class PlaybackBuilder:
         set_speed = self.callbacks.get('set_speed', lambda s: None)
 
         speed_buttons = []
-        for speed, bg in [(0.25, '#333333'), (0.5, '#333333'), (1.0, '#444444'), (2.0, '#333333'), (5.0, '#333333')]:
+        for speed, bg in SPEED_PRESETS:
             btn = tk.Button(
                 speed_frame,
                 text=f"{speed}x",
-                command=lambda s=speed: set_speed(s),
+                command=partial(set_speed, speed),
                 bg=bg,
                 fg='white',
                 **speed_btn_style
@@ -141,10 +123,7 @@ class PlaybackBuilder:
 
         return {
             'playback_row': playback_row,
-            'load_button': load_button,
-            'play_button': play_button,
-            'step_button': step_button,
-            'reset_button': reset_button,
+            **playback_buttons,
             'speed_label': speed_label,
             'speed_buttons': speed_buttons,
         }
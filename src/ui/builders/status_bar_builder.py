@@ -22,6 +22,11 @@ class StatusBarBuilder:
         tick_label = widgets['tick_label']
     """
 
+    # Label widths in characters, sized for the longest expected text
+    TICK_WIDTH = 12     # "TICK: 99999"
+    PRICE_WIDTH = 18    # "PRICE: 9999.9999X"
+    PHASE_WIDTH = 20    # "PHASE: DISCONNECTED"
+
     def __init__(self, parent: tk.Tk, toggle_recording: Optional[Callable] = None):
         """
         Initialize StatusBarBuilder.
@@ -51,13 +56,18 @@ class StatusBarBuilder:
         status_bar.pack(fill=tk.X)
         status_bar.pack_propagate(False)  # Fixed height
 
+        # Per-tick labels get a fixed character width so text changes keep
+        # the requested size constant and never trigger a geometry pass
+
         # Tick (left)
         tick_label = tk.Label(
             status_bar,
             text="TICK: 0",
             font=('Arial', 11, 'bold'),
             bg='#000000',
-            fg='white'
+            fg='white',
+            width=self.TICK_WIDTH,
+            anchor=tk.W
         )
         tick_label.pack(side=tk.LEFT, padx=10)
 
@@ -67,7 +77,9 @@ class StatusBarBuilder:
             text="PRICE: 1.0000 X",
             font=('Arial', 11, 'bold'),
             bg='#000000',
-            fg='white'
+            fg='white',
+            width=self.PRICE_WIDTH,
+            anchor=tk.W
         )
         price_label.pack(side=tk.LEFT, padx=20)
 
@@ -77,7 +89,9 @@ class StatusBarBuilder:
             text="PHASE: UNKNOWN",
             font=('Arial', 11, 'bold'),
             bg='#000000',
-            fg='white'
+            fg='white',
+            width=self.PHASE_WIDTH,
+            anchor=tk.E
         )
         phase_label.pack(side=tk.RIGHT, padx=10)
 
@@ -0,0 +1,106 @@
+"""
+Confirm Dialog
+
+Non-modal yes/no confirmation that reports the answer through callbacks.
+Unlike messagebox.askyesno it does not grab input or block the caller,
+so timers, toasts and overlays keep updating while it is open.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ConfirmDialog:
+    """Yes/No confirmation window that invokes on_yes or on_no when answered."""
+
+    def __init__(
+        self,
+        parent,
+        title: str,
+        message: str,
+        on_yes: Callable[[], None],
+        on_no: Optional[Callable[[], None]] = None
+    ):
+        """
+        Initialize and show the confirmation dialog.
+
+        Args:
+            parent: Parent window
+            title: Window title
+            message: Question shown to the user
+            on_yes: Callback when user confirms
+            on_no: Optional callback when user declines or closes the window
+        """
+        self.parent = parent
+        self.on_yes = on_yes
+        self.on_no = on_no
+
+        # Non-modal: transient keeps it above the parent, no grab_set
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.withdraw()
+        self.dialog.title(title)
+        self.dialog.resizable(False, False)
+        self.dialog.transient(parent)
+        self.dialog.protocol("WM_DELETE_WINDOW", self._on_no)
+
+        self._build_ui(message)
+
+        # Center on parent, then show
+        self.dialog.update_idletasks()
+        x = parent.winfo_x() + (parent.winfo_width() - self.dialog.winfo_reqwidth()) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - self.dialog.winfo_reqheight()) // 2
+        self.dialog.geometry(f"+{x}+{y}")
+        self.dialog.deiconify()
+
+    def _build_ui(self, message: str):
+        """Build dialog UI."""
+        msg_frame = ttk.Frame(self.dialog, padding=20)
+        msg_frame.pack(fill='both', expand=True)
+
+        msg_label = ttk.Label(
+            msg_frame,
+            text=message,
+            justify='left',
+            wraplength=400
+        )
+        msg_label.pack()
+
+        # Buttons
+        button_frame = ttk.Frame(self.dialog, padding=(20, 10))
+        button_frame.pack(fill='x', side='bottom')
+
+        no_btn = ttk.Button(
+            button_frame,
+            text="No",
+            command=self._on_no,
+            width=12
+        )
+        no_btn.pack(side='right', padx=5)
+
+        yes_btn = ttk.Button(
+            button_frame,
+            text="Yes",
+            command=self._on_yes,
+            width=12
+        )
+        yes_btn.pack(side='right', padx=5)
+
+        yes_btn.focus_set()
+
+        self.dialog.bind('<Escape>', lambda e: self._on_no())
+        self.dialog.bind('<Return>', lambda e: self._on_yes())
+
+    def _on_yes(self):
+        """Handle confirmation."""
+        self.dialog.destroy()
+        self.on_yes()
+
+    def _on_no(self):
+        """Handle decline or window close."""
+        self.dialog.destroy()
+        if self.on_no:
+            self.on_no()
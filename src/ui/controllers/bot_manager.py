@@ -13,11 +13,22 @@ Responsibilities:
 """
 
 import logging
+import threading
 import tkinter as tk
-from typing import Callable, Optional
+from tkinter import messagebox
+from typing import Callable, Optional, TYPE_CHECKING
+
+from bot import get_strategy
+from bot.execution_mode import ExecutionMode
+
+if TYPE_CHECKING:
+    from ui.timing_overlay import TimingOverlay
 
 logger = logging.getLogger(__name__)
 
+# Timing worker's initial "last stats", distinct from None (= no executor)
+_NO_STATS = object()
+
 
 class BotManager:
     """
@@ -25,6 +36,27 @@ class BotManager:
     
     Extracted from MainWindow to follow Single Responsibility Principle.
     """
+
+    # Timing worker poll cadence while the overlay is toggled on (2 Hz)
+    TIMING_REFRESH_MS = 500
+
+    # Fixed timing metrics dialog size (width, height); also used to center it
+    TIMING_DIALOG_SIZE = (400, 350)
+
+    # Timing metrics dialog rows: (caption, stats key, value format, value tag);
+    # None = spacer. Captions carry their trailing tab so rows render as-is.
+    TIMING_METRIC_ROWS = (
+        ("Total Executions:\t", 'total_executions', "{}\n", 'value'),
+        ("Successful:\t", 'successful_executions', "{}\n", 'value'),
+        ("Success Rate:\t", 'success_rate', "{:.1%}\n", 'good'),
+        None,
+        ("Average Total Delay:\t", 'avg_total_delay_ms', "{:.1f}ms\n", 'value'),
+        ("Average Click Delay:\t", 'avg_click_delay_ms', "{:.1f}ms\n", 'value'),
+        ("Average Confirmation:\t", 'avg_confirmation_delay_ms', "{:.1f}ms\n", 'value'),
+        None,
+        ("P50 Delay:\t", 'p50_total_delay_ms', "{:.1f}ms\n", 'value'),
+        ("P95 Delay:\t", 'p95_total_delay_ms', "{:.1f}ms\n", 'value'),
+    )
     
     def __init__(
         self,
@@ -33,7 +65,6 @@ class BotManager:
         bot_executor,
         bot_controller,
         bot_config_panel,
-        timing_overlay,
         browser_executor,
         # UI widgets
         bot_toggle_button: tk.Button,
@@ -47,7 +78,13 @@ class BotManager:
         # Callbacks
         log_callback: Callable[[str], None],
         # Notifications
-        toast: Optional[object] = None
+        toast: Optional[object] = None,
+        # Thread marshaling
+        ui_dispatcher: Optional[object] = None,
+        # Created on first use when None (most sessions never show it)
+        timing_overlay: Optional['TimingOverlay'] = None,
+        # Trade button state setter shared with the tick path's change cache
+        set_button_state: Optional[Callable[[tk.Button, str], None]] = None
     ):
         """Initialize BotManager with dependencies"""
         self.root = root
@@ -55,7 +92,7 @@ class BotManager:
         self.bot_executor = bot_executor
         self.bot_controller = bot_controller
         self.bot_config_panel = bot_config_panel
-        self.timing_overlay = timing_overlay
+        self._timing_overlay = timing_overlay
         self.browser_executor = browser_executor
         
         # UI widgets
@@ -71,17 +108,38 @@ class BotManager:
         # Callbacks
         self.log = log_callback
         self.toast = toast
+        self.ui_dispatcher = ui_dispatcher
+        self._set_button_state = set_button_state or (lambda button, state: button.config(state=state))
         
         # State
         self.bot_enabled = False
+        # Set while a result drain is queued on the UI thread (coalesces wakeups)
+        self._drain_pending = False
+        # Last (text, fg) applied to bot_status_label; skips redundant configure calls
+        self._last_bot_status = (None, None)
+        # Background timing stats poller and its stop signal (runs while the overlay is on)
+        self._timing_thread: Optional[threading.Thread] = None
+        self._timing_stop = threading.Event()
+        # Stats last pushed to the timing overlay; unchanged stats skip the redraw
+        self._last_timing_stats: Optional[dict] = None
+        # Latest stats delivered by the timing worker (None = no executor)
+        self._timing_stats: Optional[dict] = None
+        # Execution mode only changes through the config dialog; cache it
+        self._execution_mode = bot_config_panel.get_execution_mode()
+        bot_config_panel.add_mode_change_listener(self._on_execution_mode_changed)
+        # Timing metrics dialog and its stats text, built on first open
+        self._timing_dialog: Optional[tk.Toplevel] = None
+        self._timing_stats_text: Optional[tk.Text] = None
         
         # Start monitoring loops
         self._start_monitoring()
     
     def _start_monitoring(self):
-        """Start periodic monitoring loops"""
-        self.root.after(100, self._check_bot_results)
-        self.root.after(1000, self._update_timing_metrics_loop)
+        """Start monitoring: event-driven bot results, timing metrics while the overlay is on"""
+        # Bot results are pushed by the executor instead of polled
+        self.bot_executor.on_result = self._on_bot_result_ready
+        if self.timing_overlay_var.get():
+            self._start_timing_metrics_loop()
     
     # ========================================================================
     # BOT LIFECYCLE
@@ -99,14 +157,9 @@ class BotManager:
                 text="🤖 Disable Bot",
                 bg='#ff3366'
             )
-            self.bot_status_label.config(
-                text=f"Bot: ACTIVE ({self.strategy_var.get()})",
-                fg='#00ff88'
-            )
+            self.set_bot_status(f"Bot: ACTIVE ({self.strategy_var.get()})", '#00ff88')
             # Disable manual trading when bot is active
-            self.buy_button.config(state=tk.DISABLED)
-            self.sell_button.config(state=tk.DISABLED)
-            self.sidebet_button.config(state=tk.DISABLED)
+            self._set_trade_buttons(tk.DISABLED)
             self.log(f"🤖 Bot enabled with {self.strategy_var.get()} strategy (async mode)")
         else:
             # Stop async bot executor
@@ -116,24 +169,37 @@ class BotManager:
                 text="🤖 Enable Bot",
                 bg='#666666'
             )
-            self.bot_status_label.config(
-                text="Bot: Disabled",
-                fg='#666666'
-            )
+            self.set_bot_status("Bot: Disabled", '#666666')
 
             # Bug 5 Fix: Re-enable manual trading buttons when bot is disabled
             # (but only if game is active)
             current_tick = self.state.get('current_tick')
             if current_tick and current_tick.active:
-                self.buy_button.config(state=tk.NORMAL)
-                self.sell_button.config(state=tk.NORMAL)
-                self.sidebet_button.config(state=tk.NORMAL)
+                self._set_trade_buttons(tk.NORMAL)
 
             self.log("🤖 Bot disabled")
 
         # Bug 4 Fix: Sync menu checkbox with bot state
         self.bot_var.set(self.bot_enabled)
     
+    def _set_trade_buttons(self, state: str):
+        """Apply one state to the BUY, SELL and SIDEBET buttons"""
+        for button in (self.buy_button, self.sell_button, self.sidebet_button):
+            self._set_button_state(button, state)
+
+    def set_bot_status(self, text: str, fg: Optional[str] = None):
+        """Update the bot status label, skipping the configure call if nothing changed"""
+        if fg is None:
+            fg = self._last_bot_status[1]
+        status = (text, fg)
+        if status == self._last_bot_status:
+            return
+        self._last_bot_status = status
+        if fg is None:
+            self.bot_status_label.config(text=text)
+        else:
+            self.bot_status_label.config(text=text, fg=fg)
+
     def toggle_bot_from_menu(self):
         """
         Toggle bot enable/disable from menu (syncs with button)
@@ -149,8 +215,6 @@ class BotManager:
     
     def on_strategy_changed(self, event=None):
         """Handle strategy selection change"""
-        from bot import get_strategy
-
         strategy_name = self.strategy_var.get()
         try:
             # Update bot controller with new strategy
@@ -160,9 +224,7 @@ class BotManager:
 
             # Update status if bot is active
             if self.bot_enabled:
-                self.bot_status_label.config(
-                    text=f"Bot: ACTIVE ({strategy_name})"
-                )
+                self.set_bot_status(f"Bot: ACTIVE ({strategy_name})")
         except Exception as e:
             self.log(f"Failed to change strategy: {e}")
     
@@ -202,6 +264,19 @@ class BotManager:
     # TIMING METRICS
     # ========================================================================
     
+    @property
+    def timing_overlay(self) -> 'TimingOverlay':
+        """Draggable timing overlay, imported and built on first access"""
+        if self._timing_overlay is None:
+            from ui.timing_overlay import TimingOverlay
+            self._timing_overlay = TimingOverlay(self.root, config_file="timing_overlay.json")
+        return self._timing_overlay
+
+    def _hide_timing_overlay(self):
+        """Hide the overlay if it has been built (never builds it just to hide)"""
+        if self._timing_overlay is not None:
+            self._timing_overlay.hide()
+
     def toggle_timing_overlay(self):
         """
         Toggle timing overlay widget visibility (Phase A)
@@ -209,12 +284,14 @@ class BotManager:
         """
         def do_toggle():
             if self.timing_overlay_var.get():
-                # Show overlay
-                self.timing_overlay.show()
-                self.log("Timing overlay shown")
+                # The worker's first update shows the overlay, building it on
+                # first use, only when there is an executor in UI_LAYER mode
+                self._start_timing_metrics_loop()
+                self.log("Timing overlay enabled")
             else:
                 # Hide overlay
-                self.timing_overlay.hide()
+                self._stop_timing_metrics_loop()
+                self._hide_timing_overlay()
                 self.log("Timing overlay hidden")
 
         # Ensure always runs in main thread
@@ -226,7 +303,6 @@ class BotManager:
         Modal popup with full statistics
         """
         if not self.browser_executor:
-            from tkinter import messagebox
             messagebox.showinfo(
                 "Timing Metrics",
                 "Timing metrics are only available when browser executor is active.\n\n"
@@ -237,13 +313,41 @@ class BotManager:
         # Get timing stats
         stats = self.browser_executor.get_timing_stats()
 
-        # Create modal dialog
+        # Built once, then withdrawn on close and re-shown with fresh values
+        dialog = self._timing_dialog
+        if dialog is None or not dialog.winfo_exists():
+            dialog = self._build_timing_dialog()
+
+        self._render_timing_stats(stats)
+
+        # Center while still withdrawn, then map once. The dialog size is fixed,
+        # so its position is plain arithmetic on the root's geometry: no idle
+        # flush or query of the unmapped dialog (which would report 1x1)
+        width, height = self.TIMING_DIALOG_SIZE
+        x = self.root.winfo_rootx() + (self.root.winfo_width() - width) // 2
+        y = self.root.winfo_rooty() + (self.root.winfo_height() - height) // 2
+        dialog.geometry(f"{width}x{height}+{x}+{y}")
+
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+
+    def _build_timing_dialog(self) -> tk.Toplevel:
+        """Create the timing metrics dialog and keep a reference to its stats text"""
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.title("Bot Timing Metrics")
-        dialog.geometry("400x350")
+        dialog.geometry("{}x{}".format(*self.TIMING_DIALOG_SIZE))
         dialog.resizable(False, False)
         dialog.transient(self.root)
-        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", self._close_timing_dialog)
+        # X11: tell the WM this is a dialog so it gets light decorations and
+        # placement instead of full top-level window treatment
+        if self.root.tk.call('tk', 'windowingsystem') == 'x11':
+            try:
+                dialog.wm_attributes('-type', 'dialog')
+            except tk.TclError:
+                pass  # Unsupported by this Tk build
 
         # Main container
         main_frame = tk.Frame(dialog, bg='#1a1a1a', padx=20, pady=20)
@@ -259,58 +363,36 @@ class BotManager:
         )
         title_label.pack(pady=(0, 15))
 
-        # Stats frame
-        stats_frame = tk.Frame(main_frame, bg='#2a2a2a', relief=tk.RIDGE, bd=2)
-        stats_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
-
-        # Format stats as labels
-        stats_text = [
-            ("Total Executions:", f"{stats['total_executions']}"),
-            ("Successful:", f"{stats['successful_executions']}"),
-            ("Success Rate:", f"{stats['success_rate']:.1%}"),
-            ("", ""),
-            ("Average Total Delay:", f"{stats['avg_total_delay_ms']:.1f}ms"),
-            ("Average Click Delay:", f"{stats['avg_click_delay_ms']:.1f}ms"),
-            ("Average Confirmation:", f"{stats['avg_confirmation_delay_ms']:.1f}ms"),
-            ("", ""),
-            ("P50 Delay:", f"{stats['p50_total_delay_ms']:.1f}ms"),
-            ("P95 Delay:", f"{stats['p95_total_delay_ms']:.1f}ms"),
-        ]
-
-        for i, (label_text, value_text) in enumerate(stats_text):
-            if not label_text:  # Separator
-                separator = tk.Frame(stats_frame, height=10, bg='#2a2a2a')
-                separator.pack(fill=tk.X)
-                continue
-
-            row_frame = tk.Frame(stats_frame, bg='#2a2a2a')
-            row_frame.pack(fill=tk.X, padx=15, pady=5)
-
-            label = tk.Label(
-                row_frame,
-                text=label_text,
-                font=('Arial', 10),
-                bg='#2a2a2a',
-                fg='#cccccc',
-                anchor=tk.W
-            )
-            label.pack(side=tk.LEFT)
-
-            value = tk.Label(
-                row_frame,
-                text=value_text,
-                font=('Arial', 10, 'bold'),
-                bg='#2a2a2a',
-                fg='#00ff00' if 'Success' in label_text else '#ffffff',
-                anchor=tk.E
-            )
-            value.pack(side=tk.RIGHT)
+        # Stats text: a single read-only widget holds every row
+        stats_text = tk.Text(
+            main_frame,
+            height=len(self.TIMING_METRIC_ROWS),
+            font=('Arial', 10),
+            bg='#2a2a2a',
+            relief=tk.RIDGE,
+            bd=2,
+            padx=15,
+            pady=5,
+            spacing1=5,
+            spacing3=5,
+            tabs=(300, tk.RIGHT),  # Values right-aligned at the right edge
+            wrap=tk.NONE,
+            cursor='arrow',
+            highlightthickness=0
+        )
+        stats_text.tag_configure('caption', foreground='#cccccc')
+        stats_text.tag_configure('value', foreground='#ffffff', font=('Arial', 10, 'bold'))
+        stats_text.tag_configure('good', foreground='#00ff00', font=('Arial', 10, 'bold'))
+        stats_text.tag_configure('spacer', font=('Arial', 2))
+        stats_text.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
+        stats_text.configure(state=tk.DISABLED)
+        self._timing_stats_text = stats_text
 
         # Close button
         close_button = tk.Button(
             main_frame,
             text="Close",
-            command=dialog.destroy,
+            command=self._close_timing_dialog,
             bg='#3a3a3a',
             fg='#ffffff',
             font=('Arial', 10),
@@ -320,103 +402,183 @@ class BotManager:
         )
         close_button.pack()
 
-        # Center dialog
-        dialog.update_idletasks()
-        x = self.root.winfo_x() + (self.root.winfo_width() // 2) - (dialog.winfo_width() // 2)
-        y = self.root.winfo_y() + (self.root.winfo_height() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
+        self._timing_dialog = dialog
+        return dialog
+
+    def _render_timing_stats(self, stats: dict):
+        """Rewrite the timing dialog's stats text from a get_timing_stats() dict"""
+        text = self._timing_stats_text
+        text.configure(state=tk.NORMAL)
+        text.delete('1.0', tk.END)
+        for row in self.TIMING_METRIC_ROWS:
+            if row is None:  # Separator
+                text.insert(tk.END, '\n', 'spacer')
+                continue
+
+            caption, key, fmt, value_tag = row
+            text.insert(tk.END, caption, 'caption', fmt.format(stats[key]), value_tag)
+        text.configure(state=tk.DISABLED)
+
+    def _close_timing_dialog(self):
+        """Hide the timing metrics dialog, keeping its widgets for the next open"""
+        dialog = self._timing_dialog
+        if dialog is not None and dialog.winfo_exists():
+            dialog.grab_release()
+            dialog.withdraw()
     
-    def _update_timing_metrics_display(self):
+    def _update_timing_metrics_display(self, stats: Optional[dict]):
         """
         Update draggable timing overlay (Phase 8.6)
-        Called every second when bot is active in UI_LAYER mode
+        Runs on the Tk thread when the timing worker submits stats
+
+        Args:
+            stats: Latest get_timing_stats() result, or None without an executor
         """
-        if not self.browser_executor:
-            # Hide overlay if no executor
-            self.timing_overlay.hide()
-            return
+        self._timing_stats = stats
 
-        # Get current execution mode
-        execution_mode = self.bot_config_panel.get_execution_mode()
-        from bot.execution_mode import ExecutionMode
+        # Worker may still deliver after the overlay was toggled off
+        if not self.timing_overlay_var.get() or stats is None:
+            self._hide_timing_overlay()
+            return
 
-        # Only show timing overlay if BOTH conditions met:
-        # 1. UI_LAYER mode
-        # 2. User has toggled it on via menu
-        if execution_mode == ExecutionMode.UI_LAYER and self.timing_overlay_var.get():
+        # Only show timing overlay in UI_LAYER mode (user has toggled it on)
+        if self._execution_mode is ExecutionMode.UI_LAYER:
             # Show overlay
             self.timing_overlay.show()
 
-            # Get timing stats
-            stats = self.browser_executor.get_timing_stats()
-
-            # Update overlay with stats
-            self.timing_overlay.update_stats(stats)
+            # Update overlay with stats (labels keep their text while unchanged)
+            if stats != self._last_timing_stats:
+                self._last_timing_stats = stats
+                self.timing_overlay.update_stats(stats)
         else:
-            # Hide overlay if not in UI_LAYER mode OR user toggled it off
-            self.timing_overlay.hide()
+            self._hide_timing_overlay()
+
+    def _on_execution_mode_changed(self, mode: ExecutionMode):
+        """Config panel listener: re-evaluate overlay visibility for the new mode"""
+        self._execution_mode = mode
+        if self.timing_overlay_var.get():
+            self._update_timing_metrics_display(self._timing_stats)
     
-    def _update_timing_metrics_loop(self):
-        """
-        Periodic timing metrics update loop (Phase 8.6)
-        Runs every 1 second to update inline timing display
+    def _start_timing_metrics_loop(self):
+        """Start the timing stats worker unless it is already running"""
+        if self._timing_thread is not None and self._timing_thread.is_alive():
+            return
+        # Fresh event per worker, so a stopped worker can never be revived
+        self._timing_stop = threading.Event()
+        self._timing_thread = threading.Thread(
+            target=self._timing_metrics_worker,
+            args=(self._timing_stop,),
+            daemon=True,
+            name="TimingMetrics"
+        )
+        self._timing_thread.start()
+
+    def _stop_timing_metrics_loop(self):
+        """Signal the timing stats worker to exit"""
+        self._timing_stop.set()
+        self._timing_thread = None
+
+    def _timing_metrics_worker(self, stop: threading.Event):
         """
-        try:
-            self._update_timing_metrics_display()
-        except Exception as e:
-            logger.error(f"Error updating timing metrics: {e}", exc_info=True)
+        Timing metrics poller (Phase 8.6), runs off the Tk thread.
 
-        # Schedule next update (every 1000ms = 1 second)
-        self.root.after(1000, self._update_timing_metrics_loop)
+        Reads executor stats every TIMING_REFRESH_MS and only wakes the Tk
+        thread when they changed; execution mode changes arrive through
+        _on_execution_mode_changed instead of being polled.
+        """
+        last_stats = _NO_STATS  # Always submit on the first pass
+        while True:
+            stats = None
+            executor = self.browser_executor
+            if executor is not None:
+                try:
+                    stats = executor.get_timing_stats()
+                except Exception as e:
+                    logger.error(f"Error reading timing metrics: {e}", exc_info=True)
+
+            if stats != last_stats:
+                last_stats = stats
+                if self.ui_dispatcher:
+                    self.ui_dispatcher.submit(self._update_timing_metrics_display, stats)
+                else:
+                    self.root.after(0, self._update_timing_metrics_display, stats)
+
+            if stop.wait(self.TIMING_REFRESH_MS / 1000):
+                return
     
     # ========================================================================
     # BOT MONITORING
     # ========================================================================
     
-    def _check_bot_results(self):
+    def _on_bot_result_ready(self):
+        """
+        Executor listener - called from the bot worker thread.
+        Marshals the drain onto the UI thread; nothing runs while the bot is idle.
+        A burst of results schedules a single drain.
+        """
+        if self._drain_pending:
+            return
+        self._drain_pending = True
+
+        if self.ui_dispatcher:
+            # Full or stopped dispatcher: re-arm so the next result tries again
+            if not self.ui_dispatcher.submit(self._drain_bot_results):
+                self._drain_pending = False
+        else:
+            self.root.after(0, self._drain_bot_results)
+
+    def _drain_bot_results(self):
         """
-        Periodically check for bot execution results from async executor
+        Process pending bot execution results from async executor
         This runs in the UI thread and processes results non-blocking
         """
-        if self.bot_enabled:
-            # Process all pending results
-            while True:
-                result = self.bot_executor.get_latest_result()
-                if not result:
-                    break
-
-                # Handle errors
-                if 'error' in result:
-                    self.bot_status_label.config(
-                        text=f"Bot: ERROR",
-                        fg='#ff3366'
-                    )
-                    self.log(f"🤖 Bot error at tick {result['tick']}: {result['error']}")
-                    continue
+        # Clear before reading so results queued from here on schedule a new drain
+        self._drain_pending = False
 
-                # Process successful execution
-                bot_result = result.get('result', {})
-                action = bot_result.get('action', 'WAIT')
+        if not self.bot_enabled:
+            return
+
+        log = self.log
+        # Only the newest status is visible, so apply it once after the loop
+        status = None
+
+        # Process all pending results
+        for result in self.bot_executor.drain_results():
+            # Handle errors
+            if 'error' in result:
+                status = ("Bot: ERROR", '#ff3366')
+                log(f"🤖 Bot error at tick {result['tick']}: {result['error']}")
+                continue
+
+            # Process successful execution
+            bot_result = result.get('result', {})
+            action = bot_result.get('action', 'WAIT')
+
+            # Update UI for non-WAIT actions
+            if action != 'WAIT':
                 reasoning = bot_result.get('reasoning', '')
                 success = bot_result.get('success', False)
-
-                # Update UI for non-WAIT actions
-                if action != 'WAIT':
+                if reasoning:
+                    short = reasoning if len(reasoning) <= 30 else reasoning[:30] + '...'
+                    status_text = f"Bot: {action} ({short})"
+                else:
                     status_text = f"Bot: {action}"
-                    if reasoning:
-                        status_text += f" ({reasoning[:30]}...)" if len(reasoning) > 30 else f" ({reasoning})"
+                status = (status_text, '#00ff88' if success else '#ff3366')
 
-                    self.bot_status_label.config(
-                        text=status_text,
-                        fg='#00ff88' if success else '#ff3366'
-                    )
+                # Log bot action
+                if success:
+                    log(f"🤖 Bot: {action} - {reasoning}")
+                else:
+                    reason = bot_result.get('reason', 'Unknown')
+                    log(f"🤖 Bot: {action} FAILED - {reason}")
 
-                    # Log bot action
-                    if success:
-                        self.log(f"🤖 Bot: {action} - {reasoning}")
-                    else:
-                        reason = bot_result.get('reason', 'Unknown')
-                        self.log(f"🤖 Bot: {action} FAILED - {reason}")
+        if status is not None:
+            self.set_bot_status(*status)
+
+    # ========================================================================
+    # CLEANUP
+    # ========================================================================
 
-        # Schedule next check (every 100ms)
-        self.root.after(100, self._check_bot_results)
+    def cleanup(self):
+        """Stop the timing stats worker on shutdown"""
+        self._stop_timing_metrics_loop()
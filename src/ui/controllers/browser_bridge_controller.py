@@ -10,15 +10,24 @@ Handles:
 """
 
 import tkinter as tk
-import asyncio
 import logging
 from typing import Callable, Optional
-from browser.executor import BrowserExecutor
 from browser.bridge import BridgeStatus
 from ui.browser_connection_dialog import BrowserConnectionDialog
+from ui.confirm_dialog import ConfirmDialog
 
 logger = logging.getLogger(__name__)
 
+# Browser menu styling per status value: (status item label, short name, disconnect item state)
+_BROWSER_STATUS_STYLE = {
+    BridgeStatus.DISCONNECTED.value: ('⚫ Status: Disconnected', 'Disconnected', tk.DISABLED),
+    BridgeStatus.CONNECTING.value: ('🟡 Status: Connecting...', 'Connecting...', tk.DISABLED),
+    BridgeStatus.CONNECTED.value: ('🟢 Status: Connected', 'Connected', tk.NORMAL),
+    BridgeStatus.ERROR.value: ('🔴 Status: Error', 'Error', tk.DISABLED),
+    BridgeStatus.RECONNECTING.value: ('🟡 Status: Reconnecting...', 'Reconnecting...', tk.DISABLED),
+}
+_UNKNOWN_BROWSER_STATUS_STYLE = ('⚫ Status: Unknown', 'Unknown', tk.DISABLED)
+
 
 class BrowserBridgeController:
     """
@@ -27,12 +36,15 @@ class BrowserBridgeController:
     Extracted from MainWindow (Phase 3.5) to reduce God Object anti-pattern.
     """
 
+    # Status toasts raised within this window collapse into the latest one
+    TOAST_DEBOUNCE_MS = 50
+
     def __init__(
         self,
         root: tk.Tk,
         parent_window,  # Reference to MainWindow for state access
         # UI components
-        browser_menu: tk.Menu,
+        browser_menu: Optional[tk.Menu],
         browser_status_item_index: int,
         browser_disconnect_item_index: int,
         # Notifications
@@ -60,6 +72,14 @@ class BrowserBridgeController:
         self.toast = toast
         self.log = log_callback
 
+        # Open disconnect confirmation (non-modal, so guard against duplicates)
+        self._disconnect_confirm: Optional[ConfirmDialog] = None
+        # Last _BROWSER_STATUS_STYLE entry applied to the menu; None fields force the first update
+        self._browser_menu_style = (None, None, None)
+        # Latest (message, type) waiting for the debounced toast flush
+        self._pending_toast: Optional[tuple] = None
+        self._toast_after_id: Optional[str] = None
+
         logger.info("BrowserBridgeController initialized")
 
     # ========================================================================
@@ -87,21 +107,10 @@ class BrowserBridgeController:
         """Called when browser connects successfully"""
         try:
             self.log("Browser connected successfully")
-            if self.toast:
-                self.toast.show("Browser connected", "success")
+            self._queue_toast("Browser connected", "success")
 
             # Update browser menu
-            if hasattr(self, 'browser_menu'):
-                # Enable disconnect button
-                self.browser_menu.entryconfig(
-                    self.browser_disconnect_item_index,
-                    state=tk.NORMAL
-                )
-                # Update status indicator
-                self.browser_menu.entryconfig(
-                    self.browser_status_item_index,
-                    label="🟢 Status: Connected"
-                )
+            self._apply_browser_menu_style(_BROWSER_STATUS_STYLE[BridgeStatus.CONNECTED.value])
 
         except Exception as e:
             logger.error(f"Error handling browser connected: {e}", exc_info=True)
@@ -110,8 +119,7 @@ class BrowserBridgeController:
         """Called when browser connection fails"""
         error_msg = f"Browser connection failed: {error}" if error else "Browser connection failed"
         self.log(error_msg)
-        if self.toast:
-            self.toast.show(error_msg, "error")
+        self._queue_toast(error_msg, "error")
 
     def disconnect_browser(self):
         """Disconnect browser (Phase 8.5)"""
@@ -119,35 +127,42 @@ class BrowserBridgeController:
             self.log("No browser connection to disconnect")
             return
 
-        # Confirm disconnection
-        from tkinter import messagebox
-        if not messagebox.askyesno(
+        # Confirm disconnection without blocking the event loop
+        confirm = self._disconnect_confirm
+        if confirm is not None and confirm.dialog.winfo_exists():
+            confirm.dialog.lift()
+            return
+
+        self._disconnect_confirm = ConfirmDialog(
+            self.root,
             "Disconnect Browser",
             "Are you sure you want to disconnect the browser?\n\n"
-            "The browser window will remain open but automation will stop."
-        ):
-            return
+            "The browser window will remain open but automation will stop.",
+            on_yes=self._start_disconnect
+        )
+
+    def _start_disconnect(self):
+        """Run the browser disconnect once the user has confirmed"""
+        self._disconnect_confirm = None
+        if not self.parent.browser_executor:
+            return  # Disconnected while the confirmation was open
 
         try:
             self.log("Disconnecting browser...")
 
-            # Run async disconnect in background thread
-            def run_disconnect():
+            # Run async disconnect on the shared browser loop
+            def on_disconnect_done(future):
                 try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    loop.run_until_complete(self.parent.browser_executor.disconnect())
-                    loop.close()
+                    future.result()
 
                     # Update UI in main thread
                     self.root.after(0, self.on_browser_disconnected)
                 except Exception as e:
                     logger.error(f"Background disconnect failed: {e}", exc_info=True)
-                    self.root.after(0, lambda: self.log(f"Disconnect error: {e}"))
+                    self.root.after(0, self.log, f"Disconnect error: {e}")
 
-            import threading
-            disconnect_thread = threading.Thread(target=run_disconnect, daemon=True)
-            disconnect_thread.start()
+            future = self.parent.run_browser_coroutine(self.parent.browser_executor.disconnect())
+            future.add_done_callback(on_disconnect_done)
 
         except Exception as e:
             logger.error(f"Error disconnecting browser: {e}", exc_info=True)
@@ -158,60 +173,68 @@ class BrowserBridgeController:
         try:
             self.parent.browser_executor = None
             self.log("Browser disconnected")
-            if self.toast:
-                self.toast.show("Browser disconnected", "info")
+            self._queue_toast("Browser disconnected", "info")
 
             # Update browser menu
-            if hasattr(self, 'browser_menu'):
-                # Disable disconnect button
-                self.browser_menu.entryconfig(
-                    self.browser_disconnect_item_index,
-                    state=tk.DISABLED
-                )
-                # Update status indicator
-                self.browser_menu.entryconfig(
-                    self.browser_status_item_index,
-                    label="⚫ Status: Disconnected"
-                )
+            self._apply_browser_menu_style(_BROWSER_STATUS_STYLE[BridgeStatus.DISCONNECTED.value])
 
         except Exception as e:
             logger.error(f"Error handling browser disconnected: {e}", exc_info=True)
 
+    def _queue_toast(self, message: str, msg_type: str):
+        """
+        Show a status toast after TOAST_DEBOUNCE_MS (Tk thread).
+
+        Transitions that arrive in a burst (e.g. connecting -> error during a
+        reconnect loop) replace the pending toast, so only the last one is shown.
+        """
+        if not self.toast:
+            return
+        self._pending_toast = (message, msg_type)
+        if self._toast_after_id is None:
+            self._toast_after_id = self.root.after(self.TOAST_DEBOUNCE_MS, self._flush_toast)
+
+    def _flush_toast(self):
+        """Show the latest queued status toast"""
+        self._toast_after_id = None
+        pending, self._pending_toast = self._pending_toast, None
+        if pending is not None:
+            self.toast.show(*pending)
+
     # ========================================================================
     # BROWSER STATUS UPDATES
     # ========================================================================
 
     def update_browser_status(self, status):
         """Update browser status indicator"""
-        # Map status to icon and color
-        status_map = {
-            'disconnected': ('⚫', 'Disconnected'),
-            'connecting': ('🟡', 'Connecting...'),
-            'connected': ('🟢', 'Connected'),
-            'error': ('🔴', 'Error'),
-            'reconnecting': ('🟡', 'Reconnecting...'),
-        }
-
-        icon, label = status_map.get(status, ('⚫', 'Unknown'))
-
-        # Update menu item
-        if hasattr(self, 'browser_menu'):
+        self._apply_browser_menu_style(
+            _BROWSER_STATUS_STYLE.get(status, _UNKNOWN_BROWSER_STATUS_STYLE)
+        )
+
+    def _apply_browser_menu_style(self, style):
+        """
+        Apply a _BROWSER_STATUS_STYLE entry to the browser menu (Tk thread).
+
+        Sets the status label and disconnect item state together, and only
+        issues entryconfig for the parts that differ from the last style
+        applied, so repeated status callbacks cost nothing.
+        """
+        if self.browser_menu is None:
+            return
+
+        status_label, _, disconnect_state = style
+        last_label, _, last_state = self._browser_menu_style
+        if status_label != last_label:
             self.browser_menu.entryconfig(
                 self.browser_status_item_index,
-                label=f"{icon} Status: {label}"
+                label=status_label
             )
-
-            # Enable/disable disconnect button based on status
-            if status == 'connected':
-                self.browser_menu.entryconfig(
-                    self.browser_disconnect_item_index,
-                    state=tk.NORMAL
-                )
-            else:
-                self.browser_menu.entryconfig(
-                    self.browser_disconnect_item_index,
-                    state=tk.DISABLED
-                )
+        if disconnect_state != last_state:
+            self.browser_menu.entryconfig(
+                self.browser_disconnect_item_index,
+                state=disconnect_state
+            )
+        self._browser_menu_style = style
 
     # ========================================================================
     # CDP BRIDGE CONNECTION (Phase 9.3)
@@ -246,47 +269,39 @@ class BrowserBridgeController:
         # Marshal to main thread
         def update_ui():
             try:
-                # Map BridgeStatus to menu display
-                status_display_map = {
-                    BridgeStatus.DISCONNECTED: ('⚫', 'Disconnected', tk.DISABLED),
-                    BridgeStatus.CONNECTING: ('🟡', 'Connecting...', tk.DISABLED),
-                    BridgeStatus.CONNECTED: ('🟢', 'Connected', tk.NORMAL),
-                    BridgeStatus.ERROR: ('🔴', 'Error', tk.DISABLED),
-                    BridgeStatus.RECONNECTING: ('🟡', 'Reconnecting...', tk.DISABLED),
-                }
-
-                icon, label, disconnect_state = status_display_map.get(
-                    status,
-                    ('⚫', 'Unknown', tk.DISABLED)
-                )
-
-                # Update status indicator
-                self.browser_menu.entryconfig(
-                    self.browser_status_item_index,
-                    label=f"{icon} Status: {label}"
-                )
-
-                # Update disconnect button state
-                self.browser_menu.entryconfig(
-                    self.browser_disconnect_item_index,
-                    state=disconnect_state
-                )
+                style = _BROWSER_STATUS_STYLE.get(status_value, _UNKNOWN_BROWSER_STATUS_STYLE)
+                label = style[1]
+
+                # Update status indicator and disconnect button state
+                self._apply_browser_menu_style(style)
 
                 # Log status change
                 self.log(f"Browser bridge: {label}")
 
                 # Show toast for important status changes
                 if status == BridgeStatus.CONNECTED:
-                    if self.toast:
-                        self.toast.show("Browser bridge connected", "success")
+                    self._queue_toast("Browser bridge connected", "success")
                 elif status == BridgeStatus.ERROR:
-                    if self.toast:
-                        self.toast.show("Browser bridge error", "error")
+                    self._queue_toast("Browser bridge error", "error")
                 elif status == BridgeStatus.DISCONNECTED:
-                    if self.toast:
-                        self.toast.show("Browser bridge disconnected", "info")
+                    self._queue_toast("Browser bridge disconnected", "info")
 
             except Exception as e:
                 logger.error(f"Error updating browser status UI: {e}", exc_info=True)
 
         self.root.after(0, update_ui)
+
+    # ========================================================================
+    # CLEANUP
+    # ========================================================================
+
+    def cleanup(self):
+        """Cancel the pending status toast flush on shutdown"""
+        self._pending_toast = None
+        if self._toast_after_id is None:
+            return
+        try:
+            self.root.after_cancel(self._toast_after_id)
+        except Exception:
+            pass  # Root may already be destroyed
+        self._toast_after_id = None
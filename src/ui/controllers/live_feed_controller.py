@@ -15,8 +15,13 @@ auto-stops when disconnected.
 import tkinter as tk
 import threading
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Callable, Optional, TYPE_CHECKING
 
+from services.event_bus import Events
+from sources.websocket_feed import WebSocketFeed
+from models.recording_models import ServerState
+
 if TYPE_CHECKING:
     from ui.controllers.recording_controller import RecordingController
 
@@ -30,6 +35,11 @@ class LiveFeedController:
     Extracted from MainWindow (Phase 3.4) to reduce God Object anti-pattern.
     """
 
+    # Initial-connect retries (Socket.IO handles reconnects once connected)
+    RETRY_BASE_MS = 2000
+    RETRY_MAX_MS = 30000
+    MAX_CONNECT_RETRIES = 5
+
     def __init__(
         self,
         root: tk.Tk,
@@ -41,7 +51,8 @@ class LiveFeedController:
         # Notifications
         toast,
         # Callbacks
-        log_callback: Callable[[str], None]
+        log_callback: Callable[[str], None],
+        ui_dispatcher=None
     ):
         """
         Initialize LiveFeedController with dependencies.
@@ -54,6 +65,8 @@ class LiveFeedController:
             live_feed_var: Menu checkbox variable for live feed
             toast: Toast notification widget
             log_callback: Logging function
+            ui_dispatcher: TkDispatcher for batching feed events onto the
+                Tk thread (falls back to root.after when absent)
         """
         self.root = root
         self.parent = parent_window
@@ -68,9 +81,18 @@ class LiveFeedController:
 
         # Callbacks
         self.log = log_callback
+        self.ui_dispatcher = ui_dispatcher
 
         # Phase 10.5: Track current game for GAME_START/GAME_END events
         self._current_game_id: str = None
+        # Guards _current_game_id; signal and gameComplete run on the feed thread
+        self._game_lock = threading.Lock()
+        # One reusable worker for the blocking Socket.IO handshake
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LiveFeedConnect")
+        # In-flight connect, pending backoff retry and failed attempts so far
+        self._connect_future: Optional[Future] = None
+        self._retry_after_id: Optional[str] = None
+        self._retry_attempt = 0
 
         # Phase 10.6: Recording controller for auto-start/stop
         self._recording_controller: Optional["RecordingController"] = None
@@ -93,6 +115,13 @@ class LiveFeedController:
         self._recording_controller = controller
         logger.debug("Recording controller set for auto-start/stop")
 
+    def _marshal(self, fn: Callable[[], None]):
+        """Run fn on the Tk thread (called from the feed's background threads)"""
+        if self.ui_dispatcher:
+            self.ui_dispatcher.submit(fn)
+        else:
+            self.root.after(0, fn)
+
     # ========================================================================
     # LIVE FEED CONNECTION
     # ========================================================================
@@ -102,7 +131,17 @@ class LiveFeedController:
         if self.parent.live_feed_connected:
             self.log("Live feed already connected")
             return
+        if self._connect_future is not None and not self._connect_future.done():
+            self.log("Live feed already connecting")
+            return
+
+        # A user-initiated connect starts a fresh retry sequence
+        self._cancel_retry()
+        self._retry_attempt = 0
+        self._start_connect()
 
+    def _start_connect(self):
+        """Create the feed, wire its handlers and connect on the I/O worker"""
         try:
             self.log("Connecting to live feed...")
             # Show connecting toast for user feedback
@@ -110,31 +149,25 @@ class LiveFeedController:
                 self.toast.show("Connecting to live feed...", "info")
 
             # Create WebSocketFeed
-            from sources.websocket_feed import WebSocketFeed
             self.parent.live_feed = WebSocketFeed(log_level='WARN')
 
-            # Register event handlers (THREAD-SAFE with root.after)
-            # PRODUCTION FIX: All handlers capture values via default arguments
-            # to prevent race conditions when signals arrive faster than processing
-            @self.parent.live_feed.on('signal')
-            def on_signal(signal):
-                # CRITICAL FIX: Create immutable snapshot to prevent race condition
-                # Without this, 'signal' could change before process_signal() runs
-                signal_snapshot = dict(signal) if hasattr(signal, 'items') else signal
-
-                # Marshal to Tkinter main thread with captured value
-                def process_signal(captured_signal=signal_snapshot):
-                    try:
-                        # Convert GameSignal to GameTick
-                        tick = self.parent.live_feed.signal_to_game_tick(captured_signal)
+            feed = self.parent.live_feed
 
-                        # Push to replay engine (auto-records if enabled)
-                        self.replay_engine.push_tick(tick)
+            # Tick ingestion runs on the feed thread: conversion, push_tick and
+            # bus publishes need no Tk, and ReplayEngine/EventBus are thread-safe.
+            # Only the UI refresh is marshalled (via ReplayEngine.on_tick_callback).
+            @feed.on('signal')
+            def on_signal(signal):
+                try:
+                    # Convert GameSignal to GameTick
+                    tick = feed.signal_to_game_tick(signal)
 
-                        # Publish to event bus for UI updates
-                        from services.event_bus import Events
+                    # Push to replay engine (auto-records if enabled)
+                    self.replay_engine.push_tick(tick)
 
-                        # Phase 10.5: Detect game transitions for recording
+                    # Publish to event bus for UI updates
+                    # Phase 10.5: Detect game transitions for recording
+                    with self._game_lock:
                         game_id = tick.game_id
                         if game_id and game_id != self._current_game_id:
                             # New game started
@@ -152,12 +185,13 @@ class LiveFeedController:
                                 'game_id': game_id
                             })
 
-                        self.event_bus.publish(Events.GAME_TICK, {'tick': tick})
-                    except Exception as e:
-                        logger.error(f"Error processing live signal: {e}", exc_info=True)
-
-                self.root.after(0, process_signal)
+                    self.event_bus.publish(Events.GAME_TICK, {'tick': tick})
+                except Exception as e:
+                    logger.error(f"Error processing live signal: {e}", exc_info=True)
 
+            # Remaining handlers touch Tk state and are marshalled (THREAD-SAFE via _marshal)
+            # PRODUCTION FIX: All handlers capture values via default arguments
+            # to prevent race conditions when signals arrive faster than processing
             @self.parent.live_feed.on('connected')
             def on_connected(info):
                 # PRODUCTION FIX: Capture info snapshot
@@ -175,14 +209,15 @@ class LiveFeedController:
 
                     # Only process when Socket ID is available (actual connection established)
                     self.parent.live_feed_connected = True
+                    self._retry_attempt = 0
                     # Sync menu checkbox state (connection succeeded)
                     self.live_feed_var.set(True)
                     self.log(f"✅ Live feed connected (Socket ID: {socket_id})")
                     if self.toast:
                         self.toast.show("Live feed connected", "success")
                     # Update status label if it exists
-                    if hasattr(self.parent, 'phase_label'):
-                        self.parent.phase_label.config(text="PHASE: LIVE FEED", fg='#00ff88')
+                    if self.parent.phase_label is not None:
+                        self.parent._set_label(self.parent.phase_label, "PHASE: LIVE FEED", fg='#00ff88')
 
                     # Phase 10.6: Auto-start recording DISABLED
                     # Recording is now controlled via UI toggle, not auto-started
@@ -194,7 +229,7 @@ class LiveFeedController:
                     #     except Exception as rec_e:
                     #         logger.error(f"Failed to auto-start recording: {rec_e}")
 
-                self.root.after(0, handle_connected)
+                self._marshal(handle_connected)
 
             @self.parent.live_feed.on('disconnected')
             def on_disconnected(info):
@@ -210,8 +245,8 @@ class LiveFeedController:
                     self.log(f"❌ Live feed disconnected: {reason}")
                     if self.toast:
                         self.toast.show("Live feed disconnected", "error")
-                    if hasattr(self.parent, 'phase_label'):
-                        self.parent.phase_label.config(text="PHASE: DISCONNECTED", fg='#ff3366')
+                    if self.parent.phase_label is not None:
+                        self.parent._set_label(self.parent.phase_label, "PHASE: DISCONNECTED", fg='#ff3366')
 
                     # Phase 10.6: Auto-stop recording
                     if self._recording_controller and self._recording_controller.is_active:
@@ -225,22 +260,19 @@ class LiveFeedController:
                     if hasattr(self.parent, '_reset_server_state'):
                         self.parent._reset_server_state()
 
-                self.root.after(0, handle_disconnected)
+                self._marshal(handle_disconnected)
 
-            @self.parent.live_feed.on('gameComplete')
+            # Stays on the feed thread so it is ordered with on_signal's
+            # game transition detection (both read/write _current_game_id)
+            @feed.on('gameComplete')
             def on_game_complete(data):
-                # PRODUCTION FIX: Capture data snapshot
-                data_snapshot = dict(data) if hasattr(data, 'items') else {}
-
-                # Marshal to Tkinter main thread with captured value
-                def handle_game_complete(captured_data=data_snapshot):
-                    from services.event_bus import Events
-
-                    game_num = captured_data.get('gameNumber', 0)
-                    seed_data = captured_data.get('seedData')
-                    self.log(f"💥 Game {game_num} complete")
+                data = data if hasattr(data, 'get') else {}
+                game_num = data.get('gameNumber', 0)
+                seed_data = data.get('seedData')
+                self.log(f"💥 Game {game_num} complete")
 
-                    # Phase 10.5: Publish GAME_END with seed data
+                # Phase 10.5: Publish GAME_END with seed data
+                with self._game_lock:
                     if self._current_game_id:
                         logger.debug(f"Live feed: Game complete - {self._current_game_id}")
                         self.event_bus.publish(Events.GAME_END, {
@@ -251,8 +283,6 @@ class LiveFeedController:
                         # Reset for next game
                         self._current_game_id = None
 
-                self.root.after(0, handle_game_complete)
-
             # Phase 10.7: Player identity event (once on connect)
             @self.parent.live_feed.on('player_identity')
             def on_player_identity(info):
@@ -260,8 +290,6 @@ class LiveFeedController:
                 info_snapshot = dict(info) if hasattr(info, 'items') else {}
 
                 def handle_identity(captured_info=info_snapshot):
-                    from services.event_bus import Events
-
                     self._player_id = captured_info.get('player_id')
                     self._username = captured_info.get('username')
                     self.log(f"👤 Logged in as: {self._username}")
@@ -276,7 +304,7 @@ class LiveFeedController:
                     # Publish to EventBus for other consumers
                     self.event_bus.publish(Events.PLAYER_IDENTITY, captured_info)
 
-                self.root.after(0, handle_identity)
+                self._marshal(handle_identity)
 
             # Phase 10.7: Player update event (after each trade)
             @self.parent.live_feed.on('player_update')
@@ -285,9 +313,6 @@ class LiveFeedController:
                 data_snapshot = dict(data) if hasattr(data, 'items') else {}
 
                 def handle_update(captured_data=data_snapshot):
-                    from services.event_bus import Events
-                    from models.recording_models import ServerState
-
                     # Create ServerState from WebSocket data
                     server_state = ServerState.from_websocket(captured_data)
 
@@ -301,27 +326,30 @@ class LiveFeedController:
                         'raw_data': captured_data
                     })
 
-                self.root.after(0, handle_update)
+                self._marshal(handle_update)
 
             # Bug 6 Fix: Connect to feed in background thread (non-blocking)
             # This prevents UI freeze during Socket.IO handshake (up to 20s timeout)
             def connect_in_background():
                 try:
-                    self.parent.live_feed.connect()
+                    feed.connect()
                 except Exception as e:
                     logger.error(f"Background connection failed: {e}", exc_info=True)
                     # Marshal error handling to main thread
-                    def handle_error():
-                        self.log(f"Failed to connect to live feed: {e}")
-                        if self.toast:
-                            self.toast.show(f"Live feed error: {e}", "error")
+                    def handle_error(error=e):
+                        self.log(f"Failed to connect to live feed: {error}")
+                        if self.parent.live_feed is not feed:
+                            return  # Disabled or replaced meanwhile
                         self.parent.live_feed = None
                         self.parent.live_feed_connected = False
+                        if self._schedule_retry():
+                            return
+                        if self.toast:
+                            self.toast.show(f"Live feed error: {error}", "error")
                         self.live_feed_var.set(False)
-                    self.root.after(0, handle_error)
+                    self._marshal(handle_error)
 
-            connection_thread = threading.Thread(target=connect_in_background, daemon=True)
-            connection_thread.start()
+            self._connect_future = self._io_pool.submit(connect_in_background)
 
         except Exception as e:
             logger.error(f"Failed to enable live feed: {e}", exc_info=True)
@@ -333,8 +361,44 @@ class LiveFeedController:
             # Sync menu checkbox state (connection failed)
             self.live_feed_var.set(False)
 
+    def _schedule_retry(self) -> bool:
+        """Arm an exponential-backoff reconnect (Tk thread); False once retries are spent"""
+        if self._retry_attempt >= self.MAX_CONNECT_RETRIES:
+            return False
+
+        delay_ms = min(self.RETRY_BASE_MS * (2 ** self._retry_attempt), self.RETRY_MAX_MS)
+        self._retry_attempt += 1
+        self.log(
+            f"Retrying live feed in {delay_ms / 1000:.0f}s "
+            f"(attempt {self._retry_attempt}/{self.MAX_CONNECT_RETRIES})"
+        )
+        self._retry_after_id = self.root.after(delay_ms, self._retry_connect)
+        return True
+
+    def _retry_connect(self):
+        """Backoff timer fired: try connecting again"""
+        self._retry_after_id = None
+        if not self.parent.live_feed_connected:
+            self._start_connect()
+
+    def _cancel_retry(self) -> bool:
+        """Cancel a pending backoff retry; True if one was pending"""
+        if self._retry_after_id is None:
+            return False
+        try:
+            self.root.after_cancel(self._retry_after_id)
+        except Exception:
+            pass  # Root may already be destroyed
+        self._retry_after_id = None
+        return True
+
     def disable_live_feed(self):
         """Disable WebSocket live feed"""
+        if self._cancel_retry():
+            self.log("Live feed retry cancelled")
+            self.live_feed_var.set(False)
+            if not self.parent.live_feed:
+                return
         if not self.parent.live_feed:
             self.log("Live feed not active")
             return
@@ -350,15 +414,15 @@ class LiveFeedController:
             self._player_id = None
             self._username = None
             self.toast.show("Live feed disconnected", "info")
-            if hasattr(self.parent, 'phase_label'):
-                self.parent.phase_label.config(text="PHASE: DISCONNECTED", fg='white')
+            if self.parent.phase_label is not None:
+                self.parent._set_label(self.parent.phase_label, "PHASE: DISCONNECTED", fg='white')
         except Exception as e:
             logger.error(f"Error disconnecting live feed: {e}", exc_info=True)
             self.log(f"Error disconnecting: {e}")
 
     def toggle_live_feed(self):
-        """Toggle live feed on/off"""
-        if self.parent.live_feed_connected:
+        """Toggle live feed on/off (a pending retry counts as on)"""
+        if self.parent.live_feed_connected or self._retry_after_id is not None:
             self.disable_live_feed()
         else:
             self.enable_live_feed()
@@ -395,3 +459,6 @@ class LiveFeedController:
                 self._username = None
             except Exception as e:
                 logger.error(f"Error disconnecting live feed during shutdown: {e}", exc_info=True)
+
+        self._cancel_retry()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
@@ -7,18 +7,35 @@ Handles:
 - Playback control (play/pause, step, reset)
 - Playback speed management
 - Recording control
+- Background prefetch of the next game in multi-game mode
 """
 
 import tkinter as tk
 from tkinter import filedialog, messagebox
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable
+from typing import Callable, List, NamedTuple, Optional, Tuple
+import os
 import subprocess
 import platform
 import logging
 
 logger = logging.getLogger(__name__)
 
+# File manager command for this platform (None when unsupported)
+_FOLDER_OPENER = {
+    'Linux': 'xdg-open',   # most Linux distros
+    'Darwin': 'open',      # macOS
+    'Windows': 'explorer',
+}.get(platform.system())
+
+
+class GameData(NamedTuple):
+    """A parsed game recording, ready to install without touching disk"""
+    filepath: Path
+    ticks: List
+    game_id: str
+
 
 class ReplayController:
     """
@@ -93,6 +110,10 @@ class ReplayController:
         # Callbacks
         self.log = log_callback
 
+        # Multi-game prefetch: parse the next file while the current game plays
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="GamePrefetch")
+        self._prefetch: Optional[Tuple[Path, Future]] = None  # Future[GameData]
+
         logger.info("ReplayController initialized")
 
     # ========================================================================
@@ -114,11 +135,30 @@ class ReplayController:
 
     def load_game_file(self, filepath: Path):
         """Load game data from file using ReplayEngine"""
+        try:
+            game = self._parse_game_file(filepath)
+        except Exception as e:
+            logger.error(f"Failed to load file {filepath}: {e}", exc_info=True)
+            self._on_game_file_loaded(False)
+            return
+
+        self._apply_game_data(game)
+
+    def _parse_game_file(self, filepath: Path) -> GameData:
+        """Read and parse a recording (no Tk or engine state; safe off-thread)"""
+        ticks, game_id = self.replay_engine.parse_file(filepath)
+        return GameData(filepath, ticks, game_id)
+
+    def _apply_game_data(self, game: GameData):
+        """Install a parsed game into the engine and update controls (Tk thread)"""
         # Sync multi-game mode to replay engine
         self.replay_engine.multi_game_mode = self.parent.multi_game_mode
 
-        success = self.replay_engine.load_file(filepath)
+        success = self.replay_engine.load_parsed(game.filepath, game.ticks, game.game_id)
+        self._on_game_file_loaded(success)
 
+    def _on_game_file_loaded(self, success: bool):
+        """Update controls after a load attempt and queue the next prefetch"""
         if success:
             info = self.replay_engine.get_info()
             self.log(f"Loaded game with {info['total_ticks']} ticks")
@@ -128,18 +168,62 @@ class ReplayController:
             self.step_button.config(state=tk.NORMAL)
             self.reset_button.config(state=tk.NORMAL)
             self.bot_toggle_button.config(state=tk.NORMAL)
+
+            self._prefetch_next_game()
         else:
             self.log("Failed to load game file")
             messagebox.showerror("Load Error", "Failed to load game file")
 
+    def _prefetch_next_game(self):
+        """Start parsing the next queued game in the background (multi-game mode)"""
+        if not self.parent.multi_game_mode:
+            return
+
+        game_queue = self.parent.game_queue
+        if not game_queue.has_next():
+            return
+
+        next_file = game_queue.peek_next()
+        if self._prefetch and self._prefetch[0] == next_file:
+            return
+
+        self._prefetch = (next_file, self._io_pool.submit(self._parse_game_file, next_file))
+        logger.debug(f"Prefetching next game: {next_file.name}")
+
+    def get_game_data(self, filepath: Path) -> Optional[GameData]:
+        """
+        Return parsed data for the next game, preferring the background prefetch.
+
+        Falls back to parsing synchronously. On failure logs, leaves
+        multi-game mode and returns None.
+        """
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch and prefetch[0] == filepath:
+            try:
+                # Usually already finished while the previous game played
+                return prefetch[1].result()
+            except Exception as e:
+                logger.warning(f"Prefetch of {filepath.name} failed, loading directly: {e}")
+        elif prefetch:
+            prefetch[1].cancel()
+
+        try:
+            return self._parse_game_file(filepath)
+        except Exception as e:
+            logger.error(f"Failed to load next game: {e}")
+            self.log(f"❌ Failed to load next game: {e}")
+            # Stop multi-game mode on error
+            self.parent.multi_game_mode = False
+            return None
+
     def load_file_dialog(self):
         """Alias for load_game() - used by menu bar"""
         self.load_game()
 
-    def load_next_game(self, filepath: Path):
-        """Load next game in multi-game session (instant, no delay)"""
+    def load_next_game(self, game: GameData):
+        """Load next game in multi-game session (instant, no delay, no disk I/O)"""
         try:
-            self.load_game_file(filepath)
+            self._apply_game_data(game)
             # Keep bot running if it was enabled
             if self.parent.bot_enabled:
                 # Bot stays enabled across games
@@ -245,16 +329,18 @@ class ReplayController:
         recordings_dir = self.config.FILES['recordings_dir']
 
         try:
-            system = platform.system()
-            if system == 'Linux':
-                # Try xdg-open first (most Linux distros)
-                subprocess.run(['xdg-open', str(recordings_dir)], check=True)
-            elif system == 'Darwin':  # macOS
-                subprocess.run(['open', str(recordings_dir)], check=True)
-            elif system == 'Windows':
-                subprocess.run(['explorer', str(recordings_dir)], check=True)
+            if _FOLDER_OPENER is None:
+                raise OSError(f"Unsupported platform: {platform.system()}")
+            if hasattr(os, 'startfile'):
+                os.startfile(str(recordings_dir))  # Windows shell, returns at once
             else:
-                raise OSError(f"Unsupported platform: {system}")
+                # Fire and forget: the file manager may outlive this call
+                subprocess.Popen(
+                    [_FOLDER_OPENER, str(recordings_dir)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True
+                )
 
             self.log(f"Opened recordings folder: {recordings_dir}")
         except Exception as e:
@@ -262,3 +348,14 @@ class ReplayController:
             self.log(f"Failed to open recordings folder: {e}")
             if self.toast:
                 self.toast.show(f"Error opening folder: {e}", "error")
+
+    # ========================================================================
+    # CLEANUP
+    # ========================================================================
+
+    def cleanup(self):
+        """Stop the prefetch worker (called on application shutdown)"""
+        if self._prefetch:
+            self._prefetch[1].cancel()
+            self._prefetch = None
+        self._io_pool.shutdown(wait=False)
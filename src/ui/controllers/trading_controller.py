@@ -13,8 +13,8 @@ dual-state validation (local vs server).
 """
 
 import tkinter as tk
-from decimal import Decimal
-from typing import Callable, Optional, TYPE_CHECKING
+from decimal import Decimal, InvalidOperation
+from typing import Callable, Optional, Tuple, TYPE_CHECKING
 import logging
 
 if TYPE_CHECKING:
@@ -49,7 +49,9 @@ class TradingController:
         # Phase 10.6: Recording controller (replaces demo_recorder)
         recording_controller: Optional["RecordingController"] = None,
         # Legacy: Keep demo_recorder for backwards compatibility during migration
-        demo_recorder=None
+        demo_recorder=None,
+        # StringVar bound to bet_entry (single Tcl call per read/write)
+        bet_var: Optional[tk.StringVar] = None
     ):
         """
         Initialize TradingController with dependencies.
@@ -67,6 +69,7 @@ class TradingController:
             log_callback: Logging function
             recording_controller: RecordingController for Phase 10.6 recording
             demo_recorder: DEPRECATED - Legacy DemoRecorderSink (Phase 10.1-10.3)
+            bet_var: StringVar bound to bet_entry; falls back to the entry if None
         """
         self.parent = parent_window
         self.trade_manager = trade_manager
@@ -74,9 +77,18 @@ class TradingController:
         self.config = config
         self.browser_bridge = browser_bridge
 
+        # Bet limits are fixed for the session - read once
+        self._min_bet = config.FINANCIAL['min_bet']
+        self._max_bet = config.FINANCIAL['max_bet']
+
         # UI widgets
         self.bet_entry = bet_entry
+        self.bet_var = bet_var
         self.percentage_buttons = percentage_buttons
+        # (entry text, parsed amount) - skips re-parsing while the text is unchanged
+        self._bet_cache: Tuple[Optional[str], Optional[Decimal]] = (None, None)
+        # Percentage whose button is currently drawn as selected
+        self._highlighted_percentage: Optional[float] = None
 
         # UI dispatcher
         self.ui_dispatcher = ui_dispatcher
@@ -115,9 +127,8 @@ class TradingController:
         """
         try:
             # Get current bet amount from entry
-            try:
-                bet_amount = Decimal(self.bet_entry.get())
-            except Exception:
+            bet_amount = self._parse_bet(self._get_bet_text())
+            if bet_amount is None:
                 bet_amount = Decimal('0')
 
             # Phase 10.6: Use new RecordingController
@@ -137,7 +148,7 @@ class TradingController:
                     amount=amount,
                     server_state=server_state
                 )
-                logger.debug(f"Recorded button press (Phase 10.6): {button}")
+                logger.debug("Recorded button press (Phase 10.6): %s", button)
 
             # Legacy: Also record to old system during migration
             elif self.demo_recorder and self.demo_recorder.is_game_active():
@@ -147,7 +158,7 @@ class TradingController:
                     state_before=state_before,
                     amount=amount
                 )
-                logger.debug(f"Recorded button press (legacy): {button}")
+                logger.debug("Recorded button press (legacy): %s", button)
 
         except Exception as e:
             logger.error(f"Failed to record button press: {e}")
@@ -254,8 +265,8 @@ class TradingController:
 
         if success:
             self.parent.current_sell_percentage = percentage
-            # Highlight the selected button
-            self.ui_dispatcher.submit(lambda: self.highlight_percentage_button(percentage))
+            # Highlight the selected button (no-op if it is already highlighted)
+            self.ui_dispatcher.submit(self.highlight_percentage_button, percentage)
             self.log(f"Sell percentage set to {percentage*100:.0f}%")
         else:
             self.toast.show(f"Invalid percentage: {percentage*100:.0f}%", "error")
@@ -269,7 +280,22 @@ class TradingController:
         Args:
             selected_percentage: The percentage value that should be highlighted
         """
-        for pct, btn_info in self.percentage_buttons.items():
+        previous = self._highlighted_percentage
+        if selected_percentage == previous:
+            return
+        self._highlighted_percentage = selected_percentage
+
+        # After the first pass only the old and new selections change
+        if previous is None:
+            targets = self.percentage_buttons.items()
+        else:
+            targets = [
+                (pct, self.percentage_buttons[pct])
+                for pct in (previous, selected_percentage)
+                if pct in self.percentage_buttons
+            ]
+
+        for pct, btn_info in targets:
             button = btn_info['button']
             if pct == selected_percentage:
                 # Highlight selected button
@@ -290,11 +316,43 @@ class TradingController:
     # BET AMOUNT MANAGEMENT
     # ========================================================================
 
+    def _get_bet_text(self) -> str:
+        """Read the bet entry text"""
+        if self.bet_var is not None:
+            return self.bet_var.get()
+        return self.bet_entry.get()
+
+    def _set_bet_text(self, text: str):
+        """Replace the bet entry text"""
+        if self.bet_var is not None:
+            self.bet_var.set(text)
+        else:
+            self.bet_entry.delete(0, tk.END)
+            self.bet_entry.insert(0, text)
+
+    def _parse_bet(self, text: str) -> Optional[Decimal]:
+        """Parse bet entry text, reusing the last result if the text is unchanged"""
+        cached_text, cached_amount = self._bet_cache
+        if text == cached_text:
+            return cached_amount
+
+        try:
+            amount = Decimal(text)
+        except InvalidOperation:
+            amount = None
+        self._bet_cache = (text, amount)
+        return amount
+
+    def _set_bet(self, amount: Decimal):
+        """Write a bet amount to the entry and prime the parse cache"""
+        text = str(amount)
+        self._set_bet_text(text)
+        self._bet_cache = (text, amount)
+
     def set_bet_amount(self, amount: Decimal):
         """Set bet amount from quick buttons or manual input"""
-        self.bet_entry.delete(0, tk.END)
-        self.bet_entry.insert(0, str(amount))
-        logger.debug(f"Bet amount set to {amount}")
+        self._set_bet(amount)
+        logger.debug("Bet amount set to %s", amount)
 
     def increment_bet_amount(self, amount: Decimal):
         """Increment bet amount by specified amount (Phase 9.3: syncs to browser)"""
@@ -307,15 +365,14 @@ class TradingController:
         self._record_button_press(button_text)
 
         # Then update local UI
-        try:
-            current_amount = Decimal(self.bet_entry.get())
-        except Exception:
+        current_amount = self._parse_bet(self._get_bet_text())
+        # NaN/Infinity parse but can't take part in arithmetic (sNaN raises)
+        if current_amount is None or not current_amount.is_finite():
             current_amount = Decimal('0')
 
         new_amount = current_amount + amount
-        self.bet_entry.delete(0, tk.END)
-        self.bet_entry.insert(0, str(new_amount))
-        logger.debug(f"Bet amount incremented by {amount} to {new_amount}")
+        self._set_bet(new_amount)
+        logger.debug("Bet amount incremented by %s to %s", amount, new_amount)
 
     def clear_bet_amount(self):
         """Clear bet amount to zero (Phase 9.3: syncs to browser)"""
@@ -326,8 +383,7 @@ class TradingController:
         self._record_button_press('X')
 
         # Then update local UI
-        self.bet_entry.delete(0, tk.END)
-        self.bet_entry.insert(0, "0")
+        self._set_bet(Decimal('0'))
         logger.debug("Bet amount cleared to 0")
 
     def half_bet_amount(self):
@@ -339,14 +395,11 @@ class TradingController:
         self._record_button_press('1/2')
 
         # Then update local UI
-        try:
-            current = Decimal(self.bet_entry.get())
+        current = self._parse_bet(self._get_bet_text())
+        if current is not None and current.is_finite():
             new_amount = current / 2
-            self.bet_entry.delete(0, tk.END)
-            self.bet_entry.insert(0, str(new_amount))
-            logger.debug(f"Bet amount halved to {new_amount}")
-        except Exception:
-            pass
+            self._set_bet(new_amount)
+            logger.debug("Bet amount halved to %s", new_amount)
 
     def double_bet_amount(self):
         """Double bet amount (X2 button) - Phase 9.3: syncs to browser"""
@@ -357,14 +410,11 @@ class TradingController:
         self._record_button_press('X2')
 
         # Then update local UI
-        try:
-            current = Decimal(self.bet_entry.get())
+        current = self._parse_bet(self._get_bet_text())
+        if current is not None and current.is_finite():
             new_amount = current * 2
-            self.bet_entry.delete(0, tk.END)
-            self.bet_entry.insert(0, str(new_amount))
-            logger.debug(f"Bet amount doubled to {new_amount}")
-        except Exception:
-            pass
+            self._set_bet(new_amount)
+            logger.debug("Bet amount doubled to %s", new_amount)
 
     def max_bet_amount(self):
         """Set bet to max (MAX button) - Phase 9.3: syncs to browser"""
@@ -377,9 +427,8 @@ class TradingController:
         # Then update local UI
         balance = self.state.get('balance')
         if balance:
-            self.bet_entry.delete(0, tk.END)
-            self.bet_entry.insert(0, str(balance))
-            logger.debug(f"Bet amount set to MAX: {balance}")
+            self._set_bet(balance)
+            logger.debug("Bet amount set to MAX: %s", balance)
 
     def get_bet_amount(self) -> Optional[Decimal]:
         """
@@ -388,28 +437,33 @@ class TradingController:
         Returns:
             Decimal amount if valid, None otherwise
         """
-        try:
-            bet_amount = Decimal(self.bet_entry.get())
+        text = self._get_bet_text().strip()
+        if not text:
+            self.toast.show("Invalid bet amount", "error")
+            return None
 
-            min_bet = self.config.FINANCIAL['min_bet']
-            max_bet = self.config.FINANCIAL['max_bet']
+        bet_amount = self._parse_bet(text)
 
-            if bet_amount < min_bet:
-                self.toast.show(f"Bet must be at least {min_bet} SOL", "error")
-                return None
+        # NaN/Infinity parse but can't be compared against limits
+        if bet_amount is None or not bet_amount.is_finite():
+            self.toast.show("Invalid bet amount", "error")
+            logger.error(f"Invalid bet amount: {text!r}")
+            return None
 
-            if bet_amount > max_bet:
-                self.toast.show(f"Bet cannot exceed {max_bet} SOL", "error")
-                return None
+        min_bet = self._min_bet
+        max_bet = self._max_bet
 
-            balance = self.state.get('balance')
-            if bet_amount > balance:
-                self.toast.show(f"Insufficient balance! Have {balance:.4f} SOL", "error")
-                return None
+        if bet_amount < min_bet:
+            self.toast.show(f"Bet must be at least {min_bet} SOL", "error")
+            return None
 
-            return bet_amount
+        if bet_amount > max_bet:
+            self.toast.show(f"Bet cannot exceed {max_bet} SOL", "error")
+            return None
 
-        except Exception as e:
-            self.toast.show("Invalid bet amount", "error")
-            logger.error(f"Invalid bet amount: {e}")
+        balance = self.state.get('balance')
+        if bet_amount > balance:
+            self.toast.show(f"Insufficient balance! Have {balance:.4f} SOL", "error")
             return None
+
+        return bet_amount
@@ -9,38 +9,121 @@ from pathlib import Path
 from decimal import Decimal
 import json
 import logging
-from typing import Optional, List, Dict
+from functools import partial
+from operator import attrgetter
+import subprocess
+from typing import Optional, List, Dict, Tuple
+from concurrent.futures import Future
 import threading
 
 from core import ReplayEngine, TradeManager
 from core.game_queue import GameQueue
 from core.demo_recorder import DemoRecorderSink  # Phase 10
+from core.game_state import StateEvents
 from debug.raw_capture_recorder import RawCaptureRecorder  # Raw capture debug tool
 from models import GameTick
+from models.game_tick import UNTRADEABLE_PHASES
 from ui.widgets import ChartWidget, ToastNotification
 from services.ui_dispatcher import TkDispatcher  # Phase 1: Moved to services
+from services.async_loop_manager import AsyncLoopManager
+from services.event_bus import Events
 from ui.builders import (  # Phase Issue-4: Extracted builders
     MenuBarBuilder, StatusBarBuilder, ChartBuilder,
     PlaybackBuilder, BettingBuilder, ActionBuilder
 )
+from ui.builders.playback_builder import SPEED_PRESETS
+from ui.builders.betting_builder import BET_INCREMENTS
 from ui.bot_config_panel import BotConfigPanel  # Phase 8.4
 from ui.balance_edit_dialog import BalanceUnlockDialog, BalanceRelockDialog, BalanceEditEntry
 from bot import BotInterface, BotController, list_strategies
 from bot.async_executor import AsyncBotExecutor
 from bot.execution_mode import ExecutionMode  # Phase 8.4
 from bot.ui_controller import BotUIController  # Phase 8.4
-from browser.executor import BrowserExecutor  # Phase 2: Browser consolidation
 from browser.bridge import get_browser_bridge, BridgeStatus  # Phase 2: Browser consolidation
 from sources import WebSocketFeed
 
 logger = logging.getLogger(__name__)
 
+# Help > About text
+_ABOUT_TEXT = """
+REPLAYER - Rugs.fun Game Replay & Analysis System
+Version: 2.0 (Phase 7B - Menu Bar)
+
+A professional replay viewer and empirical analysis engine for
+Rugs.fun trading game recordings.
+
+Features:
+• Interactive replay with speed control
+• Trading bot automation (Conservative, Aggressive, Sidebet)
+• Real-time WebSocket live feed integration
+• Multi-game session support
+• Position & P&L tracking
+• Empirical analysis for RL training
+
+Architecture:
+• Event-driven modular design
+• Thread-safe state management
+• 141 test suite coverage
+• Symlinked ML predictor integration
+
+Part of the Rugs.fun quantitative trading ecosystem:
+• CV-BOILER-PLATE-FORK: YOLOv8 live detection
+• rugs-rl-bot: Reinforcement learning trading bot
+• REPLAYER: Replay viewer & analysis engine
+
+Keyboard Shortcuts: Press 'H' for help
+
+© 2025 REPLAYER Project
+"""
+
+# MenuBarBuilder callbacks as (action name, dotted attribute path on MainWindow,
+# post via root.after(0)). _create_menu_bar runs after the controllers exist,
+# so each path is resolved once to a bound method at build time.
+_MENU_CALLBACKS = (
+    ('load_file', 'replay_controller.load_file_dialog', False),
+    ('exit_app', 'root.quit', False),
+    ('toggle_playback', 'replay_controller.toggle_play_pause', False),
+    ('reset_game', 'replay_controller.reset_game', False),
+    ('show_recording_config', '_show_recording_config', False),
+    ('stop_recording', '_stop_recording_session', False),
+    ('toggle_recording', 'replay_controller.toggle_recording', False),
+    ('open_recordings_folder', 'replay_controller.open_recordings_folder', False),
+    ('show_recording_status', '_show_recording_status', False),
+    ('start_demo_session', '_start_demo_session', False),
+    ('end_demo_session', '_end_demo_session', False),
+    ('start_demo_game', '_start_demo_game', False),
+    ('end_demo_game', '_end_demo_game', False),
+    ('show_demo_status', '_show_demo_status', False),
+    ('toggle_bot', 'bot_manager.toggle_bot_from_menu', False),
+    ('show_bot_config', 'bot_manager.show_bot_config', True),
+    ('show_timing_metrics', 'bot_manager.show_timing_metrics', True),
+    ('toggle_timing_overlay', 'bot_manager.toggle_timing_overlay', False),
+    ('toggle_live_feed', 'live_feed_controller.toggle_live_feed_from_menu', False),
+    ('connect_browser', '_menu_connect_browser', False),
+    ('disconnect_browser', '_menu_disconnect_browser', False),
+    ('change_theme', '_change_theme', False),
+    ('set_ui_style', '_set_ui_style', False),
+    ('toggle_raw_capture', '_toggle_raw_capture', False),
+    ('analyze_capture', '_analyze_last_capture', False),
+    ('open_captures_folder', '_open_captures_folder', False),
+    ('show_capture_status', '_show_capture_status', False),
+    ('open_debug_terminal', '_open_debug_terminal', False),
+    ('show_about', '_show_about', False),
+)
+
+
 class MainWindow:
     """
     Main application window with integrated ReplayEngine
     Phase 8.5: Added browser automation support
     """
 
+    # Replay speed per unit of display stride: at 10x the display refreshes every 5th tick
+    DISPLAY_STRIDE_SPEED = 2
+
+    # Max seconds shutdown waits for the browser to stop
+    BROWSER_STOP_TIMEOUT = 30.0
+
     def __init__(self, root: tk.Tk, state, event_bus, config, live_mode: bool = False):
         """
         Initialize main window
@@ -58,10 +141,28 @@ class MainWindow:
         self.config = config
         self.live_mode = live_mode  # Phase 8.5
 
+        # Status bar and balance labels (assigned in _create_ui)
+        self.tick_label: Optional[tk.Label] = None
+        self.price_label: Optional[tk.Label] = None
+        self.phase_label: Optional[tk.Label] = None
+        self.balance_label: Optional[tk.Label] = None
+
+        # Browser menu/status widgets (assigned in _create_menu_bar/_create_ui)
+        # and the controller that drives them (created after the UI)
+        self.browser_menu: Optional[tk.Menu] = None
+        self.browser_status_item_index: Optional[int] = None
+        self.browser_disconnect_item_index: Optional[int] = None
+        self.browser_status_label: Optional[tk.Label] = None
+        self.browser_bridge_controller = None
+
         # Balance editing state (lock/unlock sync to rugs.fun)
         self.balance_locked = True
         self.manual_balance: Optional[Decimal] = None
         self.tracked_balance: Decimal = self.state.get('balance')
+        # Below this balance a game end resets to initial balance
+        self._bankrupt_threshold = Decimal('0.001')
+        # Game rules are fixed for the session - read once for the tick path
+        self._sidebet_window_ticks = config.GAME_RULES.get('sidebet_window_ticks', 40)
 
         # Phase 10.8: Server state tracking (from WebSocket)
         self.server_username: Optional[str] = None
@@ -72,9 +173,12 @@ class MainWindow:
         # Phase 8.5: Initialize browser executor (user controls connection via menu)
         self.browser_executor = None
         self.browser_connected = False
+        # Long-lived asyncio loop for browser lifecycle coroutines, started on first use
+        self._async_manager: Optional[AsyncLoopManager] = None
 
         try:
-            from browser.executor import BrowserExecutor
+            # Imported here so a broken browser stack degrades instead of failing startup
+            from browser.executor import BrowserExecutor  # Phase 2: Browser consolidation
             self.browser_executor = BrowserExecutor(profile_name="rugs_fun_phantom")
             logger.info("BrowserExecutor available - user can connect via Browser menu")
         except Exception as e:
@@ -131,6 +235,31 @@ class MainWindow:
         self.ui_dispatcher = TkDispatcher(self.root)
         self.user_paused = True
 
+        # Coalesced UI updates from state events (flushed once per dispatcher pump).
+        # Producers run on worker threads; _pending_lock guards every write and
+        # the flush's swap so no update lands in a container already drained.
+        self._pending_lock = threading.Lock()
+        self._pending_ui = {}
+        self._pending_log = []
+        # Per-tick label text, latest value wins: {label: (text, config kwargs)}
+        self._pending_labels = {}
+        # Labels whose text is set through a StringVar (filled in _create_ui)
+        self._label_vars: Dict[tk.Label, tk.StringVar] = {}
+        # Last value applied per widget ((text, kwargs) for labels, state for
+        # buttons); unchanged values skip the Tcl configure call entirely
+        self._last_ui_state = {}
+        # (entry_price, amount, float entry, float amount) of the displayed position
+        self._pnl_basis = (None, None, 0.0, 0.0)
+        # Ticks not yet drawn on the chart, and the index of the last displayed tick
+        self._chart_backlog: List[tuple] = []
+        # Pending after_idle id of the chart flush (None = not scheduled)
+        self._chart_flush_after_id: Optional[str] = None
+        self._last_display_index = -1
+        # (phase, "PHASE: ..." text) - phases change a few times per game
+        self._phase_text = (None, None)
+        # Last text requested for balance_label; unchanged balances skip the UI pass
+        self._last_balance_text = None
+
         # Set replay callbacks
         self.replay_engine.on_tick_callback = self._on_tick_update
         self.replay_engine.on_game_end_callback = self._on_game_end
@@ -150,47 +279,20 @@ class MainWindow:
             logger.info("Bot executor auto-started from config")
 
         # Auto-start live feed connection on UI startup
-        self.root.after(1000, self._auto_connect_live_feed)
+        self._auto_connect_after_id: Optional[str] = self.root.after(1000, self._auto_connect_live_feed)
 
         # Phase 3.1: Monitoring loops now handled by BotManager
-        # (removed _check_bot_results() and _update_timing_metrics_loop() calls)
+        # (bot results are event-driven via BotManager._drain_bot_results)
 
         logger.info("MainWindow initialized with ReplayEngine and async bot executor")
 
     def _create_menu_bar(self):
         """Create menu bar using MenuBarBuilder (Phase Issue-4: Extracted)"""
-        # Callbacks dictionary - uses lambdas to defer controller access
-        callbacks = {
-            'load_file': lambda: self.replay_controller.load_file_dialog() if hasattr(self, 'replay_controller') else None,
-            'exit_app': self.root.quit,
-            'toggle_playback': lambda: self.replay_controller.toggle_play_pause() if hasattr(self, 'replay_controller') else None,
-            'reset_game': lambda: self.replay_controller.reset_game() if hasattr(self, 'replay_controller') else None,
-            'show_recording_config': self._show_recording_config,
-            'stop_recording': self._stop_recording_session,
-            'toggle_recording': lambda: self.replay_controller.toggle_recording() if hasattr(self, 'replay_controller') else None,
-            'open_recordings_folder': lambda: self.replay_controller.open_recordings_folder() if hasattr(self, 'replay_controller') else None,
-            'show_recording_status': self._show_recording_status,
-            'start_demo_session': self._start_demo_session,
-            'end_demo_session': self._end_demo_session,
-            'start_demo_game': self._start_demo_game,
-            'end_demo_game': self._end_demo_game,
-            'show_demo_status': self._show_demo_status,
-            'toggle_bot': lambda: self.bot_manager.toggle_bot_from_menu() if hasattr(self, 'bot_manager') else None,
-            'show_bot_config': lambda: self.root.after(0, self.bot_manager.show_bot_config) if hasattr(self, 'bot_manager') else None,
-            'show_timing_metrics': lambda: self.root.after(0, self.bot_manager.show_timing_metrics) if hasattr(self, 'bot_manager') else None,
-            'toggle_timing_overlay': lambda: self.bot_manager.toggle_timing_overlay() if hasattr(self, 'bot_manager') else None,
-            'toggle_live_feed': lambda: self.live_feed_controller.toggle_live_feed_from_menu() if hasattr(self, 'live_feed_controller') else None,
-            'connect_browser': lambda: self.root.after(0, self.browser_bridge_controller.connect_browser_bridge) if hasattr(self, 'browser_bridge_controller') else None,
-            'disconnect_browser': lambda: self.root.after(0, self.browser_bridge_controller.disconnect_browser_bridge) if hasattr(self, 'browser_bridge_controller') else None,
-            'change_theme': self._change_theme,
-            'set_ui_style': self._set_ui_style,
-            'toggle_raw_capture': self._toggle_raw_capture,
-            'analyze_capture': self._analyze_last_capture,
-            'open_captures_folder': self._open_captures_folder,
-            'show_capture_status': self._show_capture_status,
-            'open_debug_terminal': self._open_debug_terminal,
-            'show_about': self._show_about,
-        }
+        # Resolve the declarative table to bound methods once
+        callbacks = {}
+        for name, path, deferred in _MENU_CALLBACKS:
+            method = attrgetter(path)(self)
+            callbacks[name] = partial(self.root.after, 0, method) if deferred else method
 
         # Variables for checkbutton menus
         variables = {
@@ -212,6 +314,16 @@ class MainWindow:
         self.browser_connect_item_index = refs['browser_connect_item_index']
         self.dev_capture_item_index = refs['dev_capture_item_index']
 
+    def _menu_connect_browser(self):
+        """Browser > Connect (BrowserBridgeController is created after the menu)"""
+        if self.browser_bridge_controller is not None:
+            self.root.after(0, self.browser_bridge_controller.connect_browser_bridge)
+
+    def _menu_disconnect_browser(self):
+        """Browser > Disconnect (BrowserBridgeController is created after the menu)"""
+        if self.browser_bridge_controller is not None:
+            self.root.after(0, self.browser_bridge_controller.disconnect_browser_bridge)
+
     def _create_ui(self):
         """Create UI matching the user's mockup design"""
         # Menu bar will be created after controllers are initialized (moved to __init__)
@@ -240,27 +352,17 @@ class MainWindow:
         self.chart = chart_widgets['chart']
 
         # ========== ROW 3: PLAYBACK CONTROLS (Phase Issue-4: Using builder) ==========
-        playback_callbacks = {
-            'load_game': lambda: self.replay_controller.load_game() if hasattr(self, 'replay_controller') else None,
-            'toggle_playback': lambda: self.replay_controller.toggle_playback() if hasattr(self, 'replay_controller') else None,
-            'step_forward': lambda: self.replay_controller.step_forward() if hasattr(self, 'replay_controller') else None,
-            'reset_game': lambda: self.replay_controller.reset_game() if hasattr(self, 'replay_controller') else None,
-            'set_speed': lambda s: self.replay_controller.set_playback_speed(s) if hasattr(self, 'replay_controller') else None,
-        }
-        playback_widgets = PlaybackBuilder(self.root, playback_callbacks).build()
+        # Button commands are bound in _bind_control_commands once controllers exist
+        playback_widgets = PlaybackBuilder(self.root, {}).build()
         self.load_button = playback_widgets['load_button']
         self.play_button = playback_widgets['play_button']
         self.step_button = playback_widgets['step_button']
         self.reset_button = playback_widgets['reset_button']
         self.speed_label = playback_widgets['speed_label']
+        self.speed_buttons = playback_widgets['speed_buttons']
 
         # ========== ROW 4: BET AMOUNT CONTROLS (Phase Issue-4: Using builder) ==========
         bet_callbacks = {
-            'clear_bet': lambda: self.trading_controller.clear_bet_amount() if hasattr(self, 'trading_controller') else None,
-            'increment_bet': lambda a: self.trading_controller.increment_bet_amount(a) if hasattr(self, 'trading_controller') else None,
-            'half_bet': lambda: self.trading_controller.half_bet_amount() if hasattr(self, 'trading_controller') else None,
-            'double_bet': lambda: self.trading_controller.double_bet_amount() if hasattr(self, 'trading_controller') else None,
-            'max_bet': lambda: self.trading_controller.max_bet_amount() if hasattr(self, 'trading_controller') else None,
             'toggle_balance_lock': self._toggle_balance_lock,
         }
         bet_widgets = BettingBuilder(
@@ -269,6 +371,7 @@ class MainWindow:
             self.state.get('balance')
         ).build()
         self.bet_entry = bet_widgets['bet_entry']
+        self.bet_var = bet_widgets['bet_var']
         self.clear_button = bet_widgets['clear_button']
         self.increment_001_button = bet_widgets['increment_001_button']
         self.increment_01_button = bet_widgets['increment_01_button']
@@ -294,7 +397,6 @@ class MainWindow:
         self.sidebet_button = tk.Button(
             action_left,
             text="SIDEBET",
-            command=lambda: self.trading_controller.execute_sidebet() if hasattr(self, 'trading_controller') else None,
             bg='#3399ff',
             fg='white',
             state=tk.NORMAL,  # Always enabled for testing browser forwarding
@@ -305,7 +407,6 @@ class MainWindow:
         self.buy_button = tk.Button(
             action_left,
             text="BUY",
-            command=lambda: self.trading_controller.execute_buy() if hasattr(self, 'trading_controller') else None,
             bg='#00ff66',
             fg='black',
             state=tk.NORMAL,  # Always enabled for testing browser forwarding
@@ -316,7 +417,6 @@ class MainWindow:
         self.sell_button = tk.Button(
             action_left,
             text="SELL",
-            command=lambda: self.trading_controller.execute_sell() if hasattr(self, 'trading_controller') else None,
             bg='#ff3399',
             fg='white',
             state=tk.NORMAL,  # Always enabled for testing browser forwarding
@@ -344,7 +444,6 @@ class MainWindow:
             btn = tk.Button(
                 action_left,
                 text=text,
-                command=lambda v=value: self.trading_controller.set_sell_percentage(v) if hasattr(self, 'trading_controller') else None,
                 bg=default_color,
                 fg='white',
                 **pct_btn_style
@@ -359,8 +458,6 @@ class MainWindow:
 
         # Set initial selection to 100%
         self.current_sell_percentage = 1.0
-        if hasattr(self, 'trading_controller'):
-            self.trading_controller.highlight_percentage_button(1.0)
 
         # Right - bot and info
         action_right = tk.Frame(action_row, bg='#1a1a1a')
@@ -373,7 +470,6 @@ class MainWindow:
         self.bot_toggle_button = tk.Button(
             bot_top,
             text="ENABLE BOT",
-            command=lambda: self.bot_manager.toggle_bot() if hasattr(self, 'bot_manager') else None,
             bg='#444444',
             fg='white',
             font=('Arial', 10),
@@ -396,7 +492,6 @@ class MainWindow:
             font=('Arial', 9)
         )
         self.strategy_dropdown.pack(side=tk.LEFT)
-        self.strategy_dropdown.bind('<<ComboboxSelected>>', lambda e: self.bot_manager.on_strategy_changed(e) if hasattr(self, 'bot_manager') else None)
 
         # Info labels (bottom right)
         bot_bottom = tk.Frame(action_right, bg='#1a1a1a')
@@ -430,10 +525,15 @@ class MainWindow:
         )
         self.sidebet_status_label.pack(side=tk.LEFT, padx=10)
 
-        # Phase 8.6: Draggable timing overlay (replaces inline labels)
-        # Create overlay widget (hidden initially, shown in UI_LAYER mode)
-        from ui.timing_overlay import TimingOverlay
-        self.timing_overlay = TimingOverlay(self.root, config_file="timing_overlay.json")
+        # Per-tick labels are driven through Tcl variables: a variable set
+        # redraws without option parsing. Read their text with get_label_text().
+        for label in (self.tick_label, self.price_label, self.phase_label,
+                      self.position_label, self.sidebet_status_label, self.balance_label):
+            var = tk.StringVar(master=self.root, value=label.cget('text'))
+            label.config(textvariable=var)
+            self._label_vars[label] = var
+
+        # Phase 8.6: Draggable timing overlay is owned by BotManager and built on first show
 
         # Initialize toast notifications
         self.toast = ToastNotification(self.root)
@@ -470,7 +570,6 @@ class MainWindow:
             bot_executor=self.bot_executor,
             bot_controller=self.bot_controller,
             bot_config_panel=self.bot_config_panel,
-            timing_overlay=self.timing_overlay,
             browser_executor=self.browser_executor,
             # UI widgets
             bot_toggle_button=self.bot_toggle_button,
@@ -484,7 +583,11 @@ class MainWindow:
             # Notifications
             toast=self.toast,
             # Callbacks
-            log_callback=self.log
+            log_callback=self.log,
+            # Bot results are marshaled through the shared dispatcher
+            ui_dispatcher=self.ui_dispatcher,
+            # Share the per-tick change cache for trade button states
+            set_button_state=self._set_button_state
         )
 
         # Phase 3.2: Initialize ReplayController
@@ -517,6 +620,7 @@ class MainWindow:
             browser_bridge=self.browser_bridge,
             # UI widgets
             bet_entry=self.bet_entry,
+            bet_var=self.bet_var,
             percentage_buttons=self.percentage_buttons,
             # UI dispatcher
             ui_dispatcher=self.ui_dispatcher,
@@ -539,7 +643,8 @@ class MainWindow:
             # Notifications
             toast=self.toast,
             # Callbacks
-            log_callback=self.log
+            log_callback=self.log,
+            ui_dispatcher=self.ui_dispatcher
         )
 
         # Phase 10.5H: Initialize RecordingController
@@ -560,6 +665,8 @@ class MainWindow:
         # Issue #18 Fix: Wire RecordingController to ReplayController for state consistency
         self.replay_controller.recording_controller = self.recording_controller
 
+        self._bind_control_commands()
+
         # Create menu bar now (after controllers are initialized, before BrowserBridgeController needs it)
         self._create_menu_bar()
 
@@ -580,14 +687,42 @@ class MainWindow:
         # Phase 3.5: Register browser bridge status change callback
         self.browser_bridge.on_status_change = self.browser_bridge_controller.on_bridge_status_change
 
+    def _bind_control_commands(self):
+        """Point control-row widgets straight at controller methods (controllers now exist)"""
+        replay = self.replay_controller
+        trading = self.trading_controller
+
+        for button, command in (
+            (self.load_button, replay.load_game),
+            (self.play_button, replay.toggle_playback),
+            (self.step_button, replay.step_forward),
+            (self.reset_button, replay.reset_game),
+            (self.clear_button, trading.clear_bet_amount),
+            (self.half_button, trading.half_bet_amount),
+            (self.double_button, trading.double_bet_amount),
+            (self.max_button, trading.max_bet_amount),
+            (self.sidebet_button, trading.execute_sidebet),
+            (self.buy_button, trading.execute_buy),
+            (self.sell_button, trading.execute_sell),
+            (self.bot_toggle_button, self.bot_manager.toggle_bot),
+        ):
+            button.config(command=command)
+
+        for key, _text, amount in BET_INCREMENTS:
+            getattr(self, key).config(command=partial(trading.increment_bet_amount, amount))
+
+        for (speed, _bg), button in zip(SPEED_PRESETS, self.speed_buttons):
+            button.config(command=partial(replay.set_playback_speed, speed))
+
+        for value, info in self.percentage_buttons.items():
+            info['button'].config(command=partial(trading.set_sell_percentage, value))
+
+        self.strategy_dropdown.bind('<<ComboboxSelected>>', self.bot_manager.on_strategy_changed)
+
     def _setup_event_handlers(self):
         """Setup event bus subscriptions"""
-        from services.event_bus import Events
-
         # Subscribe to game events
         self.event_bus.subscribe(Events.GAME_TICK, self._handle_game_tick)
-        self.event_bus.subscribe(Events.TRADE_EXECUTED, self._handle_trade_executed)
-        self.event_bus.subscribe(Events.TRADE_FAILED, self._handle_trade_failed)
         self.event_bus.subscribe(Events.FILE_LOADED, self._handle_file_loaded)
 
         # Phase 10.5: Subscribe to game events for recording
@@ -598,14 +733,15 @@ class MainWindow:
         self.event_bus.subscribe(Events.PLAYER_IDENTITY, self._handle_player_identity)
         self.event_bus.subscribe(Events.PLAYER_UPDATE, self._handle_player_update)
 
-        # Subscribe to state events
-        from core.game_state import StateEvents
-        self.state.subscribe(StateEvents.BALANCE_CHANGED, self._handle_balance_changed)
-        self.state.subscribe(StateEvents.POSITION_OPENED, self._handle_position_opened)
-        self.state.subscribe(StateEvents.POSITION_CLOSED, self._handle_position_closed)
-        # Phase 8.2: Partial sell events
-        self.state.subscribe(StateEvents.SELL_PERCENTAGE_CHANGED, self._handle_sell_percentage_changed)
-        self.state.subscribe(StateEvents.POSITION_REDUCED, self._handle_position_reduced)
+        # Subscribe to state events (one handler per event, registered in one pass)
+        self.state.subscribe_many({
+            StateEvents.BALANCE_CHANGED: self._handle_balance_changed,
+            StateEvents.POSITION_OPENED: self._handle_position_opened,
+            StateEvents.POSITION_CLOSED: self._handle_position_closed,
+            # Phase 8.2: Partial sell events
+            StateEvents.SELL_PERCENTAGE_CHANGED: self._handle_sell_percentage_changed,
+            StateEvents.POSITION_REDUCED: self._handle_position_reduced,
+        })
     
     def log(self, message: str):
         """Log message (using logger instead of text widget)"""
@@ -613,6 +749,7 @@ class MainWindow:
 
     def _auto_connect_live_feed(self):
         """Auto-connect to live feed on startup."""
+        self._auto_connect_after_id = None
         if hasattr(self, 'live_feed_controller'):
             logger.info("Auto-connecting to live feed...")
             self.live_feed_controller.toggle_live_feed()
@@ -638,107 +775,170 @@ class MainWindow:
     # ========================================================================
 
     def _on_tick_update(self, tick: GameTick, index: int, total: int):
-        """Background callback for ReplayEngine tick updates"""
-        self.ui_dispatcher.submit(self._process_tick_ui, tick, index, total)
+        """
+        Background callback for ReplayEngine tick updates
 
-    def _process_tick_ui(self, tick: GameTick, index: int, total: int):
-        """Execute tick updates on the Tk main thread"""
-        # Update UI labels
-        self.tick_label.config(text=f"TICK: {tick.tick}")
-        self.price_label.config(text=f"PRICE: {tick.price:.4f}X")
+        Status bar text is formatted here and coalesced into the next UI
+        flush; only the per-tick trading/bot work is marshalled as a task.
+        """
+        set_label = self._set_label
+        set_label(self.tick_label, f"TICK: {tick.tick}")
+        set_label(self.price_label, f"PRICE: {tick.price:.4f}X")
 
         # Show "RUGGED" if game was rugged (even during cooldown phase)
         display_phase = "RUGGED" if tick.rugged else tick.phase
-        self.phase_label.config(text=f"PHASE: {display_phase}")
+        phase, phase_text = self._phase_text
+        if display_phase != phase:
+            phase_text = f"PHASE: {display_phase}"
+            self._phase_text = (display_phase, phase_text)
+        set_label(self.phase_label, phase_text)
+
+        self.ui_dispatcher.submit(self._process_tick_ui, tick, index, total)
 
-        # Update chart
-        self.chart.add_tick(tick.tick, tick.price)
+    def _process_tick_ui(self, tick: GameTick, index: int, total: int):
+        """Execute tick updates on the Tk main thread"""
+        # Hot path (runs once per tick): bind frequently used attributes locally
+        state_get = self.state.get
+        trade_manager = self.trade_manager
+        set_state = self._set_button_state
+        buy_button = self.buy_button
+        sell_button = self.sell_button
+        sidebet_button = self.sidebet_button
+        set_label = self._set_label
+        position_label = self.position_label
+        NORMAL = tk.NORMAL
+        DISABLED = tk.DISABLED
+        price = tick.price
+        chart_backlog = self._chart_backlog
+        chart_backlog.append((tick.tick, price))
 
         # Maintain trading state lifecycles
-        self.trade_manager.check_and_handle_rug(tick)
-        self.trade_manager.check_sidebet_expiry(tick)
+        trade_manager.check_and_handle_rug(tick)
+        trade_manager.check_sidebet_expiry(tick)
 
         # ========== BOT EXECUTION (ASYNC) ==========
         # Queue bot execution (non-blocking) - prevents deadlock
-        if self.bot_enabled:
+        bot_enabled = self.bot_enabled
+        if bot_enabled:
             self.bot_executor.queue_execution(tick)
 
+        # Fast replay: refresh the display every Nth tick only (always on a
+        # rug or the final tick); the chart still receives every point
+        if index < self._last_display_index:
+            # Rewound or a new game: undrawn points belong to the old timeline
+            del chart_backlog[:-1]
+        stride = int(self.replay_engine.playback_speed // self.DISPLAY_STRIDE_SPEED)
+        if (stride > 1 and not tick.rugged and index < total - 1
+                and 0 <= index - self._last_display_index < stride):
+            return
+        self._last_display_index = index
+
+        # Redraw the chart once the current burst of tasks has been processed
+        if self._chart_flush_after_id is None:
+            self._chart_flush_after_id = self.root.after_idle(self._flush_chart)
+
+        # One state read each; both branches below and the countdown share them
+        position = state_get('position')
+        has_position = bool(position) and position.get('status') == 'active'
+        sidebet = state_get('sidebet')
+
         # Live-mode safety: never block BUY/SELL/SIDEBET if live bridge or live_mode is on
-        live_override = self.live_mode or (self.browser_bridge and self.browser_bridge.is_connected())
+        browser_bridge = self.browser_bridge
+        live_override = self.live_mode or (browser_bridge and browser_bridge.is_connected())
 
         # Update button states based on phase (only when bot disabled and not overridden)
-        if not self.bot_enabled and not live_override:
-            if tick.is_tradeable():
-                self.buy_button.config(state=tk.NORMAL)
-                if not self.state.get('sidebet'):
-                    self.sidebet_button.config(state=tk.NORMAL)
+        if not bot_enabled and not live_override:
+            # Inlined GameTick.is_tradeable() (hot path)
+            phase = tick.phase
+            if phase == "PRESALE" or (tick.active and not tick.rugged and phase not in UNTRADEABLE_PHASES):
+                set_state(buy_button, NORMAL)
+                if not sidebet:
+                    set_state(sidebet_button, NORMAL)
             else:
-                self.buy_button.config(state=tk.DISABLED)
-                self.sidebet_button.config(state=tk.DISABLED)
+                set_state(buy_button, DISABLED)
+                set_state(sidebet_button, DISABLED)
 
             # Check position status and display P&L
-            position = self.state.get('position')
-            if position and position.get('status') == 'active':
-                self.sell_button.config(state=tk.NORMAL)
+            if has_position:
+                set_state(sell_button, NORMAL)
 
                 # Calculate P&L in both percentage and SOL
-                entry_price = position['entry_price']
-                amount = position['amount']
-                pnl_pct = ((tick.price / entry_price) - 1) * 100
-                pnl_sol = amount * (tick.price - entry_price)
-
-                self.position_label.config(
-                    text=f"POS: {pnl_sol:+.4f} SOL ({pnl_pct:+.1f}%)",
-                    fg='#00ff88' if pnl_sol > 0 else '#ff3366'
-                )
+                pnl_text, pnl_fg = self._position_pnl_text(position, price)
+                set_label(position_label, pnl_text, fg=pnl_fg)
             else:
-                self.sell_button.config(state=tk.DISABLED)
-                self.position_label.config(text="POSITION: NONE", fg='#666666')
+                set_state(sell_button, DISABLED)
+                set_label(position_label, "POSITION: NONE", fg='#666666')
         else:
             # Keep position display updated even when bot is active or live override is enabled
-            position = self.state.get('position')
-            if position and position.get('status') == 'active':
-                entry_price = position['entry_price']
-                amount = position['amount']
-                pnl_pct = ((tick.price / entry_price) - 1) * 100
-                pnl_sol = amount * (tick.price - entry_price)
-
+            if has_position:
                 # Keep manual overrides enabled in live/bridge scenarios
-                self.buy_button.config(state=tk.NORMAL)
-                self.sidebet_button.config(state=tk.NORMAL)
-                self.sell_button.config(state=tk.NORMAL)
+                set_state(buy_button, NORMAL)
+                set_state(sidebet_button, NORMAL)
+                set_state(sell_button, NORMAL)
 
-                self.position_label.config(
-                    text=f"POS: {pnl_sol:+.4f} SOL ({pnl_pct:+.1f}%)",
-                    fg='#00ff88' if pnl_sol > 0 else '#ff3366'
-                )
+                pnl_text, pnl_fg = self._position_pnl_text(position, price)
+                set_label(position_label, pnl_text, fg=pnl_fg)
             else:
                 # In live override, enable ALL buttons for manual control
                 # FIX: Was only enabling SELL, now enable BUY/SIDEBET too
                 if live_override:
-                    self.buy_button.config(state=tk.NORMAL)
-                    self.sidebet_button.config(state=tk.NORMAL)
-                    self.sell_button.config(state=tk.NORMAL)
+                    set_state(buy_button, NORMAL)
+                    set_state(sidebet_button, NORMAL)
+                    set_state(sell_button, NORMAL)
                 else:
-                    self.sell_button.config(state=tk.DISABLED)
-                self.position_label.config(text="POSITION: NONE", fg='#666666')
+                    set_state(sell_button, DISABLED)
+                set_label(position_label, "POSITION: NONE", fg='#666666')
 
         # Update sidebet countdown
-        sidebet = self.state.get('sidebet')
         if sidebet and sidebet.get('status') == 'active':
             placed_tick = sidebet.get('placed_tick', 0)
-            resolution_window = self.config.GAME_RULES.get('sidebet_window_ticks', 40)
-            ticks_remaining = (placed_tick + resolution_window) - tick.tick
+            ticks_remaining = (placed_tick + self._sidebet_window_ticks) - tick.tick
 
             if ticks_remaining > 0:
-                self.sidebet_status_label.config(
-                    text=f"SIDEBET: {ticks_remaining} ticks",
+                set_label(
+                    self.sidebet_status_label,
+                    f"SIDEBET: {ticks_remaining} ticks",
                     fg='#ffcc00'
                 )
             else:
-                self.sidebet_status_label.config(text="SIDEBET: RESOLVING", fg='#ff9900')
+                set_label(self.sidebet_status_label, "SIDEBET: RESOLVING", fg='#ff9900')
         else:
-            self.sidebet_status_label.config(text="SIDEBET: NONE", fg='#666666')
+            set_label(self.sidebet_status_label, "SIDEBET: NONE", fg='#666666')
+
+    def _flush_chart(self):
+        """Draw every backlogged tick on the chart with a single redraw (Tk idle)"""
+        self._chart_flush_after_id = None
+        backlog = self._chart_backlog
+        if not backlog:
+            return
+        if len(backlog) == 1:
+            self.chart.add_tick(*backlog[0])
+        else:
+            ticks, prices = zip(*backlog)
+            self.chart.add_ticks(ticks, prices)
+        backlog.clear()
+
+    def _position_pnl_text(self, position: dict, price: Decimal) -> Tuple[str, str]:
+        """
+        Format the live P&L line for an open position as (text, fg colour)
+
+        Display-only, so it runs in floats; the Decimal entry price and amount
+        are converted once per position rather than on every tick.
+        """
+        entry_price = position['entry_price']
+        amount = position['amount']
+        basis = self._pnl_basis
+        if basis[0] != entry_price or basis[1] != amount:
+            basis = self._pnl_basis = (entry_price, amount, float(entry_price), float(amount))
+        entry_f, amount_f = basis[2], basis[3]
+
+        price_f = float(price)
+        pnl_pct = ((price_f / entry_f) - 1) * 100
+        pnl_sol = amount_f * (price_f - entry_f)
+        return (
+            f"POS: {pnl_sol:+.4f} SOL ({pnl_pct:+.1f}%)",
+            '#00ff88' if pnl_sol > 0 else '#ff3366'
+        )
 
     def _on_game_end(self, metrics: dict):
         """Callback for game end - AUDIT FIX Phase 2.6: Thread-safe UI updates"""
@@ -747,7 +947,7 @@ class MainWindow:
         def _update_ui():
             """Execute UI updates on main thread"""
             # Check bankruptcy and reset for continuous testing
-            if self.state.get('balance') < Decimal('0.001'):
+            if self.state.get('balance') < self._bankrupt_threshold:
                 logger.warning("BANKRUPT - Resetting balance to initial")
                 self.state.update(balance=self.state.get('initial_balance'))
                 self.log("⚠️ Balance reset to initial (bankruptcy)")
@@ -759,7 +959,10 @@ class MainWindow:
                 self.log(f"Auto-loading game {self.game_queue.current_index}/{len(self.game_queue)}")
                 # Instant advance - NO DELAY
                 if hasattr(self, 'replay_controller'):
-                    self.replay_controller.load_next_game(next_file)
+                    # Usually prefetched while this game played - no disk I/O here
+                    game = self.replay_controller.get_game_data(next_file)
+                    if game is not None:
+                        self.replay_controller.load_next_game(game)
                 if not self.user_paused:
                     self.replay_engine.play()
                     self.play_button.config(text="⏸️ Pause")
@@ -771,7 +974,7 @@ class MainWindow:
                     self.bot_executor.stop()
                     self.bot_enabled = False
                     self.bot_toggle_button.config(text="🤖 Enable Bot", bg='#666666')
-                    self.bot_status_label.config(text="Bot: Disabled", fg='#666666')
+                    self.bot_manager.set_bot_status("Bot: Disabled", '#666666')
 
                     # Bug 4 Fix: Sync menu checkbox when auto-shutdown occurs
                     self.bot_var.set(False)
@@ -797,14 +1000,6 @@ class MainWindow:
             if game_tick and hasattr(game_tick, 'tick') and hasattr(game_tick, 'price'):
                 self.recording_controller.on_tick(game_tick.tick, game_tick.price)
     
-    def _handle_trade_executed(self, event):
-        """Handle successful trade"""
-        self.log(f"Trade executed: {event.get('data')}")
-    
-    def _handle_trade_failed(self, event):
-        """Handle failed trade"""
-        self.log(f"Trade failed: {event.get('data')}")
-
     def _handle_game_start_for_recording(self, event):
         """Handle game start event for recording - Phase 10.5"""
         if hasattr(self, 'recording_controller') and self.recording_controller.is_active:
@@ -847,9 +1042,13 @@ class MainWindow:
 
             # Marshal to UI thread via TkDispatcher (only update label when locked)
             if self.balance_locked:
-                self.ui_dispatcher.submit(
-                    lambda: self.balance_label.config(text=f"WALLET: {new_balance:.4f} SOL")
-                )
+                balance_text = f"WALLET: {new_balance:.4f} SOL"
+                if balance_text == self._last_balance_text:
+                    return
+                self._last_balance_text = balance_text
+                with self._pending_lock:
+                    self._pending_ui['balance'] = balance_text
+                self._schedule_ui_flush()
 
     # ========================================================================
     # PHASE 10.8: PLAYER IDENTITY / SERVER STATE
@@ -904,8 +1103,8 @@ class MainWindow:
 
                 # Update wallet display with server truth
                 def update_wallet_ui():
-                    self.balance_label.config(
-                        text=f"WALLET: {self.server_balance:.4f} SOL",
+                    self._set_balance_text(
+                        f"WALLET: {self.server_balance:.4f} SOL",
                         fg='#00ff88'  # Green = server-verified
                     )
                     logger.debug(f"Server balance updated: {self.server_balance}")
@@ -1008,7 +1207,7 @@ class MainWindow:
         self.manual_balance = None
         self.balance_lock_button.config(text="🔒")
         # Refresh label to the new balance value
-        self.balance_label.config(text=f"WALLET: {self.state.get('balance'):.4f} SOL")
+        self._set_balance_text(f"WALLET: {self.state.get('balance'):.4f} SOL")
 
     def _start_balance_edit(self):
         """Replace balance label with inline editor."""
@@ -1032,7 +1231,7 @@ class MainWindow:
         self.manual_balance = new_balance
         # Restore label view
         self.balance_edit_entry.destroy()
-        self.balance_label.config(text=f"WALLET: {new_balance:.4f} SOL")
+        self._set_balance_text(f"WALLET: {new_balance:.4f} SOL")
         self.balance_label.pack(side=tk.RIGHT, padx=4)
 
     def _cancel_balance_edit(self):
@@ -1044,38 +1243,94 @@ class MainWindow:
     def _handle_position_opened(self, data):
         """Handle position opened (thread-safe via TkDispatcher)"""
         entry_price = data.get('entry_price', 0)
-        # Marshal to UI thread via TkDispatcher
-        self.ui_dispatcher.submit(
-            lambda: self.log(f"Position opened at {entry_price:.4f}")
-        )
+        self._queue_log_line(f"Position opened at {entry_price:.4f}")
     
     def _handle_position_closed(self, data):
         """Handle position closed (thread-safe via TkDispatcher)"""
         pnl = data.get('pnl_sol', 0)
-        # Marshal to UI thread via TkDispatcher
-        self.ui_dispatcher.submit(
-            lambda: self.log(f"Position closed - P&L: {pnl:+.4f} SOL")
-        )
+        self._queue_log_line(f"Position closed - P&L: {pnl:+.4f} SOL")
+
+    def _queue_log_line(self, line: str):
+        """Queue a log line for the next UI flush (any thread)"""
+        with self._pending_lock:
+            self._pending_log.append(line)
+        self._schedule_ui_flush()
+
+    def _schedule_ui_flush(self):
+        """Queue a single flush of pending UI updates (any thread)"""
+        self.ui_dispatcher.schedule_coalesced('ui_flush', self._flush_pending_ui)
+
+    def _flush_pending_ui(self):
+        """Apply the latest pending value per widget and batched log lines (Tk thread)"""
+        # The dispatcher re-arms 'ui_flush' for updates arriving mid-flush
+        with self._pending_lock:
+            pending, self._pending_ui = self._pending_ui, {}
+            lines, self._pending_log = self._pending_log, []
+            labels, self._pending_labels = self._pending_labels, {}
+
+        last = self._last_ui_state
+        label_vars = self._label_vars
+        for label, update in labels.items():
+            if last.get(label) != update:
+                last[label] = update
+                text, kw = update
+                var = label_vars.get(label)
+                if var is None:
+                    label.config(text=text, **kw)
+                else:
+                    var.set(text)
+                    if kw:
+                        label.config(**kw)
+
+        if 'balance' in pending:
+            self._set_balance_text(pending['balance'])
+
+        if lines:
+            self.log('\n'.join(lines))
+
+    def _set_label(self, label, text: str, **kw):
+        """Queue a label update; only the latest text per label is applied at the next flush (any thread)"""
+        with self._pending_lock:
+            self._pending_labels[label] = (text, kw)
+        self._schedule_ui_flush()
+
+    def _set_button_state(self, button, state: str):
+        """Set a button's state, skipping the configure call if unchanged (Tk thread)"""
+        if self._last_ui_state.get(button) != state:
+            self._last_ui_state[button] = state
+            button.config(state=state)
+
+    def _set_balance_text(self, text: str, **kw):
+        """Write balance_label text and keep the change-detection cache in sync (Tk thread)"""
+        self._last_balance_text = text
+        self._label_vars[self.balance_label].set(text)
+        if kw:
+            self.balance_label.config(**kw)
+
+    def get_label_text(self, label) -> str:
+        """Current text of a status label, whether or not it is variable-driven (Tk thread)"""
+        var = self._label_vars.get(label)
+        return label.cget('text') if var is None else var.get()
 
     def _handle_sell_percentage_changed(self, data):
         """Handle sell percentage changed (Phase 8.2, thread-safe via TkDispatcher)"""
         new_percentage = data.get('new', 1.0)
         # Marshal to UI thread - update button highlighting
-        self.ui_dispatcher.submit(
-            lambda: self.trading_controller.highlight_percentage_button(float(new_percentage)) if hasattr(self, 'trading_controller') else None
-        )
+        if hasattr(self, 'trading_controller'):
+            self.ui_dispatcher.run_or_submit(
+                self.trading_controller.highlight_percentage_button, float(new_percentage)
+            )
 
     def _handle_position_reduced(self, data):
         """Handle partial position close (Phase 8.2, thread-safe via TkDispatcher)"""
         percentage = data.get('percentage', 0)
         pnl = data.get('pnl_sol', 0)
         remaining = data.get('remaining_amount', 0)
-        # Marshal to UI thread
-        self.ui_dispatcher.submit(
-            lambda: self.log(f"Position reduced ({percentage*100:.0f}%) - P&L: {pnl:+.4f} SOL, Remaining: {remaining:.4f} SOL")
+        self._queue_log_line(
+            f"Position reduced ({percentage*100:.0f}%) - P&L: {pnl:+.4f} SOL, Remaining: {remaining:.4f} SOL"
         )
 
-    # Phase 3.1: _check_bot_results moved to BotManager
+    # Phase 3.1: bot result handling moved to BotManager (_drain_bot_results)
 
     # ========================================================================
     # BET AMOUNT METHODS
@@ -1088,25 +1343,46 @@ class MainWindow:
     # ========================================================================
 
     def _setup_keyboard_shortcuts(self):
-        """Setup keyboard shortcuts for common actions"""
-        self.root.bind('<space>', lambda e: self.replay_controller.toggle_playback() if hasattr(self, 'replay_controller') else None)
-        self.root.bind('b', lambda e: self.trading_controller.execute_buy() if self.buy_button['state'] != tk.DISABLED else None)
-        self.root.bind('B', lambda e: self.trading_controller.execute_buy() if self.buy_button['state'] != tk.DISABLED else None)
-        self.root.bind('s', lambda e: self.trading_controller.execute_sell() if self.sell_button['state'] != tk.DISABLED else None)
-        self.root.bind('S', lambda e: self.trading_controller.execute_sell() if self.sell_button['state'] != tk.DISABLED else None)
-        self.root.bind('d', lambda e: self.trading_controller.execute_sidebet() if self.sidebet_button['state'] != tk.DISABLED else None)
-        self.root.bind('D', lambda e: self.trading_controller.execute_sidebet() if self.sidebet_button['state'] != tk.DISABLED else None)
-        self.root.bind('r', lambda e: self.replay_controller.reset_game() if hasattr(self, 'replay_controller') else None)
-        self.root.bind('R', lambda e: self.replay_controller.reset_game() if hasattr(self, 'replay_controller') else None)
-        self.root.bind('<Left>', lambda e: self.replay_controller.step_backward() if hasattr(self, 'replay_controller') else None)
-        self.root.bind('<Right>', lambda e: self.replay_controller.step_forward() if hasattr(self, 'replay_controller') else None)
-        self.root.bind('<h>', lambda e: self.show_help())
-        self.root.bind('<H>', lambda e: self.show_help())
-        self.root.bind('l', lambda e: self.live_feed_controller.toggle_live_feed())
-        self.root.bind('L', lambda e: self.live_feed_controller.toggle_live_feed())
+        """Setup keyboard shortcuts for common actions (table-driven)"""
+        # keysym -> (button that must be enabled, or None; action)
+        # Letter keys are stored lowercase and bound for both cases
+        self._keymap = {
+            'space': (None, self.replay_controller.toggle_playback),
+            'b': (self.buy_button, self.trading_controller.execute_buy),
+            's': (self.sell_button, self.trading_controller.execute_sell),
+            'd': (self.sidebet_button, self.trading_controller.execute_sidebet),
+            'r': (None, self.replay_controller.reset_game),
+            'Left': (None, self.replay_controller.step_backward),
+            'Right': (None, self.replay_controller.step_forward),
+            'h': (None, self.show_help),
+            'l': (None, self.live_feed_controller.toggle_live_feed),
+        }
+
+        for keysym in self._keymap:
+            if len(keysym) == 1:
+                self.root.bind(keysym, self._dispatch_key)
+                self.root.bind(keysym.upper(), self._dispatch_key)
+            else:
+                self.root.bind(f'<{keysym}>', self._dispatch_key)
 
         logger.info("Keyboard shortcuts configured (added 'L' for live feed)")
 
+    def _dispatch_key(self, event):
+        """Run the action bound to a shortcut key"""
+        keysym = event.keysym
+        entry = self._keymap.get(keysym) or self._keymap.get(keysym.lower())
+        if entry is None:
+            return
+        button, action = entry
+        if button is not None:
+            # Last state applied via _set_button_state; ask Tk only before the first one
+            state = self._last_ui_state.get(button)
+            if state is None:
+                state = str(button['state'])
+            if state == tk.DISABLED:
+                return
+        action()
+
     # Phase 3.2: step_backward moved to ReplayController
 
     def show_help(self):
@@ -1335,37 +1611,7 @@ GAME RULES:
 
     def _show_about(self):
         """Show about dialog with application information"""
-        about_text = """
-REPLAYER - Rugs.fun Game Replay & Analysis System
-Version: 2.0 (Phase 7B - Menu Bar)
-
-A professional replay viewer and empirical analysis engine for
-Rugs.fun trading game recordings.
-
-Features:
-• Interactive replay with speed control
-• Trading bot automation (Conservative, Aggressive, Sidebet)
-• Real-time WebSocket live feed integration
-• Multi-game session support
-• Position & P&L tracking
-• Empirical analysis for RL training
-
-Architecture:
-• Event-driven modular design
-• Thread-safe state management
-• 141 test suite coverage
-• Symlinked ML predictor integration
-
-Part of the Rugs.fun quantitative trading ecosystem:
-• CV-BOILER-PLATE-FORK: YOLOv8 live detection
-• rugs-rl-bot: Reinforcement learning trading bot
-• REPLAYER: Replay viewer & analysis engine
-
-Keyboard Shortcuts: Press 'H' for help
-
-© 2025 REPLAYER Project
-"""
-        messagebox.showinfo("About REPLAYER", about_text)
+        messagebox.showinfo("About REPLAYER", _ABOUT_TEXT)
 
     # ========================================================================
     # DEMO RECORDING HANDLERS (Phase 10)
@@ -1565,7 +1811,7 @@ Recordings Directory: {self.recording_controller.recordings_path}
                 label="⏺ Stop Raw Capture"
             )
             self.toast.show(f"Capturing to: {capture_file.name}", "success")
-        self.ui_dispatcher.submit(update_ui)
+        self.ui_dispatcher.run_or_submit(update_ui)
 
     def _on_raw_capture_stopped(self, capture_file, event_counts):
         """Callback when raw capture stops."""
@@ -1576,7 +1822,7 @@ Recordings Directory: {self.recording_controller.recordings_path}
             )
             total = sum(event_counts.values())
             self.toast.show(f"Capture complete: {total} events", "info")
-        self.ui_dispatcher.submit(update_ui)
+        self.ui_dispatcher.run_or_submit(update_ui)
 
     def _on_raw_event_captured(self, event_name, seq_num):
         """Callback for each captured event (throttled logging)."""
@@ -1586,7 +1832,6 @@ Recordings Directory: {self.recording_controller.recordings_path}
 
     def _analyze_last_capture(self):
         """Analyze the most recent capture file."""
-        import subprocess
         try:
             capture_file = self.raw_capture_recorder.get_last_capture_file()
             if not capture_file:
@@ -1621,7 +1866,6 @@ Recordings Directory: {self.recording_controller.recordings_path}
 
     def _open_captures_folder(self):
         """Open the raw captures folder in file manager."""
-        import subprocess
         try:
             captures_dir = self.raw_capture_recorder.capture_dir
             captures_dir.mkdir(parents=True, exist_ok=True)
@@ -1667,7 +1911,7 @@ Captures Directory: {self.raw_capture_recorder.capture_dir}
     def _open_debug_terminal(self):
         """Open WebSocket debug terminal window."""
         from ui.debug_terminal import DebugTerminal
-        from services.event_bus import Events, event_bus
+        from services.event_bus import event_bus
 
         if not hasattr(self, '_debug_terminal') or self._debug_terminal is None:
             self._debug_terminal = DebugTerminal(self.root)
@@ -1699,27 +1943,47 @@ Captures Directory: {self.raw_capture_recorder.capture_dir}
         def update():
             self.source_label.config(text=text, foreground=color)
 
-        self.ui_dispatcher.submit(update)
+        self.ui_dispatcher.run_or_submit(update)
+
+    def run_browser_coroutine(self, coro) -> Future:
+        """
+        Run a browser coroutine on the shared background asyncio loop.
+
+        The loop thread is started on first use and reused for every later
+        browser operation, so callers never create or close their own loops.
+
+        Returns:
+            concurrent.futures.Future holding the coroutine's result
+        """
+        if self._async_manager is None:
+            self._async_manager = AsyncLoopManager()
+            self._async_manager.start()
+        return self._async_manager.run_coroutine(coro)
 
     def shutdown(self):
         """Cleanup dispatcher resources during application shutdown."""
+        # Cancel one-shot callbacks so none fire into destroyed widgets
+        for after_id in (self._auto_connect_after_id, self._chart_flush_after_id):
+            if after_id is not None:
+                try:
+                    self.root.after_cancel(after_id)
+                except tk.TclError:
+                    pass  # Root already destroyed
+        self._auto_connect_after_id = self._chart_flush_after_id = None
+
         # Phase 8.5: Stop browser if connected
         if self.browser_connected and self.browser_executor:
-            loop = None
             try:
                 logger.info("Shutting down browser...")
-                import asyncio
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.browser_executor.stop_browser())
+                future = self.run_browser_coroutine(self.browser_executor.stop_browser())
+                future.result(timeout=self.BROWSER_STOP_TIMEOUT)
                 logger.info("Browser stopped")
             except Exception as e:
                 logger.error(f"Error stopping browser during shutdown: {e}", exc_info=True)
-            finally:
-                # AUDIT FIX: Always close event loop to prevent resource leak
-                if loop:
-                    loop.close()
-                    asyncio.set_event_loop(None)
+
+        if self._async_manager is not None:
+            self._async_manager.stop()
+            self._async_manager = None
 
         # Phase 10: Close demo recorder (flushes any pending data)
         if self.demo_recorder:
@@ -1740,6 +2004,16 @@ Captures Directory: {self.raw_capture_recorder.capture_dir}
         # Phase 3.4: Delegate live feed cleanup to LiveFeedController
         self.live_feed_controller.cleanup()
 
+        # Stop multi-game prefetch worker
+        self.replay_controller.cleanup()
+
+        # Stop the timing overlay worker
+        self.bot_manager.cleanup()
+
+        # Cancel the debounced browser status toast
+        if self.browser_bridge_controller is not None:
+            self.browser_bridge_controller.cleanup()
+
         # Stop bot executor
         if self.bot_enabled:
             self.bot_executor.stop()
@@ -5,14 +5,85 @@ Handles smooth progression from 1x to 100x+ using log scale
 
 import tkinter as tk
 from tkinter import Canvas
-from collections import deque
+from tkinter import font as tkfont
+from array import array
 from decimal import Decimal
 import math
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Iterable
 import logging
 
 logger = logging.getLogger(__name__)
 
+MAX_POINTS = 500  # Scrollable history length
+
+# Chart palettes per ttkbootstrap theme (Phase 5), built once and shared
+# read-only by every chart; 'default' covers all other themes
+THEME_COLORS = {
+    'cyborg': {
+        'grid': '#1a1a1a',
+        'grid_major': '#2a2a2a',
+        'text': '#77B7D7',
+        'text_bright': '#ffffff',
+        'price_up': '#2A9FD6',
+        'price_down': '#ff3366',
+        'price_neutral': '#ffcc00',
+        'background': '#060606'
+    },
+    'darkly': {
+        'grid': '#2a2a2a',
+        'grid_major': '#3a3a3a',
+        'text': '#AAAAAA',
+        'text_bright': '#ffffff',
+        'price_up': '#375A7F',
+        'price_down': '#ff3366',
+        'price_neutral': '#ffcc00',
+        'background': '#222222'
+    },
+    'superhero': {
+        'grid': '#2a2a2a',
+        'grid_major': '#3a3a3a',
+        'text': '#AAAAAA',
+        'text_bright': '#ffffff',
+        'price_up': '#4F9FE0',
+        'price_down': '#DF6919',
+        'price_neutral': '#ECA400',
+        'background': '#2B3E50'
+    },
+    # Default colors for other themes
+    'default': {
+        'grid': '#1a1a1a',
+        'grid_major': '#2a2a2a',
+        'text': '#666666',
+        'text_bright': '#ffffff',
+        'price_up': '#00ff88',
+        'price_down': '#ff3366',
+        'price_neutral': '#ffcc00',
+        'background': '#0a0a0a'
+    }
+}
+
+
+def _trend_runs(prices) -> List[Tuple[int, int, int]]:
+    """
+    Split a price path into runs of same-direction segments
+
+    Returns:
+        (start, end, direction) per run: points start..end inclusive,
+        direction 1 = up, -1 = down, 0 = flat
+    """
+    runs = []
+    start = 0
+    direction = None
+    for i in range(1, len(prices)):
+        step = (prices[i] > prices[i - 1]) - (prices[i] < prices[i - 1])
+        if step != direction:
+            if direction is not None:
+                runs.append((start, i - 1, direction))
+            start = i - 1
+            direction = step
+    if direction is not None:
+        runs.append((start, len(prices) - 1, direction))
+    return runs
 
 class ChartWidget(Canvas):
     """
@@ -25,6 +96,10 @@ class ChartWidget(Canvas):
     - Grid lines at log intervals
     - Price labels
     - Scrollable history (last 500 ticks)
+
+    History is kept as two parallel fixed-size ring buffers (tick numbers
+    and float prices) rather than a deque of tuples, and the price path is
+    drawn as one polyline per run of same-direction moves.
     """
 
     def __init__(self, parent, width=800, height=400, **kwargs):
@@ -50,8 +125,11 @@ class ChartWidget(Canvas):
         self.chart_width = width - self.padding_left - self.padding_right
         self.chart_height = height - self.padding_top - self.padding_bottom
 
-        # Price history (stores tuples of (tick, price))
-        self.price_history = deque(maxlen=500)  # Last 500 ticks
+        # Price history ring buffers (struct-of-arrays, last MAX_POINTS ticks)
+        self._ticks = array('q', bytes(8 * MAX_POINTS))
+        self._prices = array('d', bytes(8 * MAX_POINTS))
+        self._head = 0   # Next write slot
+        self._n = 0      # Number of valid points
 
         # Current visible range
         self.visible_ticks = 100  # Show last 100 ticks by default
@@ -64,9 +142,18 @@ class ChartWidget(Canvas):
         # Colors (Phase 5: Theme-aware)
         self.colors = self._get_theme_colors()
 
+        # (min_price, max_price, width, height) the axes layer was drawn for;
+        # None forces the next draw() to rebuild everything
+        self._axes_key = None
+
         # Log scale parameters
         self.log_base = 10
 
+        # Named fonts resolved once; every redraw references them instead of
+        # passing fresh font tuples to each create_text call
+        self._label_font = tkfont.Font(root=self, family='Arial', size=9)
+        self._message_font = tkfont.Font(root=self, family='Arial', size=14)
+
         # Bind resize event to handle dynamic sizing
         self.bind('<Configure>', self._on_resize)
 
@@ -84,69 +171,15 @@ class ChartWidget(Canvas):
             style = ttk.Style()
             theme = style.theme_use()
 
-            # Theme-specific color palettes
-            theme_colors = {
-                'cyborg': {
-                    'grid': '#1a1a1a',
-                    'grid_major': '#2a2a2a',
-                    'text': '#77B7D7',
-                    'text_bright': '#ffffff',
-                    'price_up': '#2A9FD6',
-                    'price_down': '#ff3366',
-                    'price_neutral': '#ffcc00',
-                    'background': '#060606'
-                },
-                'darkly': {
-                    'grid': '#2a2a2a',
-                    'grid_major': '#3a3a3a',
-                    'text': '#AAAAAA',
-                    'text_bright': '#ffffff',
-                    'price_up': '#375A7F',
-                    'price_down': '#ff3366',
-                    'price_neutral': '#ffcc00',
-                    'background': '#222222'
-                },
-                'superhero': {
-                    'grid': '#2a2a2a',
-                    'grid_major': '#3a3a3a',
-                    'text': '#AAAAAA',
-                    'text_bright': '#ffffff',
-                    'price_up': '#4F9FE0',
-                    'price_down': '#DF6919',
-                    'price_neutral': '#ECA400',
-                    'background': '#2B3E50'
-                },
-                # Default colors for other themes
-                'default': {
-                    'grid': '#1a1a1a',
-                    'grid_major': '#2a2a2a',
-                    'text': '#666666',
-                    'text_bright': '#ffffff',
-                    'price_up': '#00ff88',
-                    'price_down': '#ff3366',
-                    'price_neutral': '#ffcc00',
-                    'background': '#0a0a0a'
-                }
-            }
-
             # Get colors for current theme or use default
-            colors = theme_colors.get(theme, theme_colors['default'])
+            colors = THEME_COLORS.get(theme, THEME_COLORS['default'])
             logger.debug(f"Using chart colors for theme: {theme}")
             return colors
 
         except Exception as e:
             logger.warning(f"Could not get theme colors: {e}, using defaults")
             # Fallback to default colors
-            return {
-                'grid': '#1a1a1a',
-                'grid_major': '#2a2a2a',
-                'text': '#666666',
-                'text_bright': '#ffffff',
-                'price_up': '#00ff88',
-                'price_down': '#ff3366',
-                'price_neutral': '#ffcc00',
-                'background': '#0a0a0a'
-            }
+            return THEME_COLORS['default']
 
     def update_theme_colors(self):
         """
@@ -156,6 +189,7 @@ class ChartWidget(Canvas):
         """
         self.colors = self._get_theme_colors()
         self.config(bg=self.colors['background'])
+        self._axes_key = None
         self.draw()  # Redraw with new colors
 
     def _on_resize(self, event):
@@ -187,7 +221,13 @@ class ChartWidget(Canvas):
             tick_number: Tick/frame number
             price: Current price multiplier (e.g., 1.5 = 1.5x)
         """
-        self.price_history.append((tick_number, price))
+        # Same tick re-delivered at the same price renders an identical frame
+        if self._n:
+            last = (self._head - 1) % MAX_POINTS
+            if self._ticks[last] == tick_number and self._prices[last] == float(price):
+                return
+
+        self._append(tick_number, price)
 
         # Auto-scale if needed
         self._update_price_range()
@@ -195,33 +235,68 @@ class ChartWidget(Canvas):
         # Redraw chart
         self.draw()
 
+    def add_ticks(self, ticks: Iterable[int], prices: Iterable[Decimal]):
+        """
+        Add several price ticks and redraw once
+
+        Args:
+            ticks: Tick/frame numbers
+            prices: Price multipliers, parallel to ticks
+        """
+        for tick_number, price in zip(ticks, prices):
+            self._append(tick_number, price)
+
+        self._update_price_range()
+        self.draw()
+
+    def _append(self, tick_number: int, price: Decimal):
+        """Write one point into the ring buffers"""
+        head = self._head
+        self._ticks[head] = tick_number
+        self._prices[head] = float(price)
+        self._head = (head + 1) % MAX_POINTS
+        if self._n < MAX_POINTS:
+            self._n += 1
+
+    def _visible(self, column: array) -> array:
+        """Return the visible tail of a ring buffer column in order"""
+        count = min(self._n, self.visible_ticks)
+        if count == 0:
+            return column[:0]
+
+        start = (self._head - count) % MAX_POINTS
+        if start + count <= MAX_POINTS:
+            return column[start:start + count]
+        return column[start:] + column[:self._head]
+
     def clear_history(self):
         """Clear all price history"""
-        self.price_history.clear()
+        self._head = 0
+        self._n = 0
         self.min_price = Decimal('1.0')
         self.max_price = Decimal('2.0')
         self.draw()
 
     def _update_price_range(self):
         """Update min/max price range based on visible ticks"""
-        if not self.price_history:
+        if not self._n:
             return
 
         # Get visible prices
-        visible = list(self.price_history)[-self.visible_ticks:]
-        if not visible:
+        prices = self._visible(self._prices)
+        if not prices:
             return
 
-        prices = [price for _, price in visible]
-        self.min_price = min(prices)
-        self.max_price = max(prices)
+        low = max(min(prices), 0.01)
+        high = max(max(prices), 0.01)
 
         # Add 10% padding on log scale
-        log_range = math.log10(float(self.max_price)) - math.log10(float(self.min_price))
-        padding = log_range * 0.1
+        log_low = math.log10(low)
+        log_high = math.log10(high)
+        padding = (log_high - log_low) * 0.1
 
-        self.min_price = Decimal(str(10 ** (math.log10(float(self.min_price)) - padding)))
-        self.max_price = Decimal(str(10 ** (math.log10(float(self.max_price)) + padding)))
+        self.min_price = Decimal(str(10 ** (log_low - padding)))
+        self.max_price = Decimal(str(10 ** (log_high + padding)))
 
         # Ensure minimum range
         if self.max_price / self.min_price < Decimal('1.2'):
@@ -285,15 +360,30 @@ class ChartWidget(Canvas):
     # ========================================================================
 
     def draw(self):
-        """Redraw the entire chart"""
-        # Clear canvas
-        self.delete('all')
+        """
+        Redraw the chart
 
-        if not self.price_history:
+        Background, grid, price labels and border depend only on the price
+        range and canvas size; while those are unchanged only the 'series'
+        items (price line, last point, tick labels) are replaced.
+        """
+        if not self._n:
+            self._axes_key = None
+            self.delete('all')
             self._draw_empty_state()
             return
 
+        axes_key = (self.min_price, self.max_price, self.width, self.height)
+        if axes_key == self._axes_key:
+            self.delete('series')
+            self._draw_price_line()
+            self._draw_tick_labels()
+            self.tag_raise('border')
+            return
+
         # Draw components in order
+        self._axes_key = axes_key
+        self.delete('all')
         self._draw_background()
         self._draw_grid()
         self._draw_price_labels()
@@ -308,7 +398,7 @@ class ChartWidget(Canvas):
             self.height / 2,
             text="No price data",
             fill=self.colors['text'],
-            font=('Arial', 14)
+            font=self._message_font
         )
 
     def _draw_background(self):
@@ -399,74 +489,76 @@ class ChartWidget(Canvas):
                 text=label,
                 fill=self.colors['text_bright'],
                 anchor='e',
-                font=('Arial', 9)
+                font=self._label_font
             )
 
     def _draw_price_line(self):
-        """Draw price line with candlestick-style coloring"""
-        if len(self.price_history) < 2:
-            return
-
-        # Get visible ticks
-        visible = list(self.price_history)[-self.visible_ticks:]
-
-        if len(visible) < 2:
+        """Draw the price path with candlestick-style trend coloring"""
+        prices = self._visible(self._prices)
+        count = len(prices)
+        if count < 2:
             return
 
-        # Draw line segments with color based on trend
-        for i in range(len(visible) - 1):
-            tick1, price1 = visible[i]
-            tick2, price2 = visible[i + 1]
-
-            x1 = self.tick_to_x(i)
-            y1 = self.price_to_y(price1)
-            x2 = self.tick_to_x(i + 1)
-            y2 = self.price_to_y(price2)
-
-            # Color based on price movement
-            if price2 > price1:
-                color = self.colors['price_up']
-            elif price2 < price1:
-                color = self.colors['price_down']
+        # Project all visible points in one pass (log scale, inverted Y)
+        log_min = math.log10(float(self.min_price))
+        log_max = math.log10(float(self.max_price))
+        log_span = log_max - log_min
+        top = self.padding_top
+        height = self.chart_height
+        left = self.padding_left
+        x_step = self.chart_width / (self.visible_ticks - 1) if self.visible_ticks > 1 else 0.0
+        log10 = math.log10
+
+        coords = []
+        append = coords.append
+        for i, price in enumerate(prices):
+            if log_span:
+                normalized = (log10(max(price, 0.01)) - log_min) / log_span
             else:
-                color = self.colors['price_neutral']
-
-            # Draw line segment
+                normalized = 0.5
+            append(left + i * x_step)
+            append(top + (1 - normalized) * height)
+
+        # One polyline per run of same-direction segments keeps the trend
+        # colouring without an item per segment
+        colors = self.colors
+        run_colors = (colors['price_down'], colors['price_neutral'], colors['price_up'])
+        for start, end, direction in _trend_runs(prices):
+            color = run_colors[direction + 1]
             self.create_line(
-                x1, y1, x2, y2,
+                *coords[2 * start:2 * end + 2],
                 fill=color,
                 width=2,
-                capstyle=tk.ROUND
+                capstyle=tk.ROUND,
+                joinstyle=tk.ROUND,
+                tags='series'
             )
 
-            # Draw dot at each point
-            self.create_oval(
-                x1 - 2, y1 - 2,
-                x1 + 2, y1 + 2,
-                fill=color,
-                outline=''
-            )
+            # Dot at each point, colored by the segment leaving it
+            for i in range(start, end):
+                x, y = coords[2 * i], coords[2 * i + 1]
+                self.create_oval(
+                    x - 2, y - 2,
+                    x + 2, y + 2,
+                    fill=color,
+                    outline='',
+                    tags='series'
+                )
 
         # Draw final point
-        last_i = len(visible) - 1
-        _, last_price = visible[last_i]
-        x = self.tick_to_x(last_i)
-        y = self.price_to_y(last_price)
-
+        x, y = coords[-2], coords[-1]
         self.create_oval(
             x - 3, y - 3,
             x + 3, y + 3,
             fill=self.colors['price_neutral'],
             outline=self.colors['text_bright'],
-            width=1
+            width=1,
+            tags='series'
         )
 
     def _draw_tick_labels(self):
         """Draw tick number labels on X-axis"""
-        if not self.price_history:
-            return
-
-        visible = list(self.price_history)[-self.visible_ticks:]
+        visible = self._visible(self._ticks)
 
         if not visible:
             return
@@ -476,7 +568,7 @@ class ChartWidget(Canvas):
 
         for i in range(label_count):
             index = int(i * (len(visible) - 1) / max(1, label_count - 1))
-            tick_number, _ = visible[index]
+            tick_number = visible[index]
 
             x = self.tick_to_x(index)
             y = self.height - self.padding_bottom + 20
@@ -485,7 +577,8 @@ class ChartWidget(Canvas):
                 x, y,
                 text=f"#{tick_number}",
                 fill=self.colors['text'],
-                font=('Arial', 9)
+                font=self._label_font,
+                tags='series'
             )
 
     def _draw_border(self):
@@ -496,7 +589,8 @@ class ChartWidget(Canvas):
             self.width - self.padding_right,
             self.height - self.padding_bottom,
             outline=self.colors['grid_major'],
-            width=1
+            width=1,
+            tags='border'
         )
 
     # ========================================================================
@@ -531,7 +625,7 @@ class ChartWidget(Canvas):
     def get_info(self) -> dict:
         """Get chart info"""
         return {
-            'tick_count': len(self.price_history),
+            'tick_count': self._n,
             'visible_ticks': self.visible_ticks,
             'min_price': float(self.min_price),
             'max_price': float(self.max_price),